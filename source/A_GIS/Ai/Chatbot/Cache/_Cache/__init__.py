@@ -0,0 +1,55 @@
+import threading
+
+class _Cache:
+    """Process-wide settings and counters of the chatbot response cache.
+
+    The settings are read once from the environment, `A_GIS_CHAT_CACHE`
+    (the mode), `A_GIS_CHAT_CACHE_PATH`, `A_GIS_CHAT_CACHE_MAX_BYTES` and
+    `A_GIS_CHAT_CACHE_TTL`, and can be changed at runtime with
+    `A_GIS.Ai.Chatbot.Cache.configure`.
+
+    `bytes` is the running size of the cached responses, counted once from
+    the database and then kept up to date by every write, so a write does
+    not sum the whole table. It is recounted before evicting, as other
+    processes may share the file. The counters and the size are changed
+    under `lock`.
+    """
+
+    modes = ("off", "on", "bypass", "replay")
+    initialized = False
+    mode = None
+    path = None
+    max_bytes = None
+    ttl = None
+    lock = threading.Lock()
+    bytes = None
+    hits = 0
+    misses = 0
+    writes = 0
+    evictions = 0
+
+    def __init__(self):
+        if not _Cache.initialized:
+            self._do_initialize()
+
+    @staticmethod
+    def _do_initialize():
+        import os
+        import pathlib
+
+        if _Cache.initialized:
+            return
+
+        _Cache.mode = os.environ.get("A_GIS_CHAT_CACHE", "off")
+        _Cache.path = pathlib.Path(
+            os.environ.get(
+                "A_GIS_CHAT_CACHE_PATH",
+                pathlib.Path.home() / ".cache" / "A_GIS" / "chat.sqlite",
+            )
+        )
+        _Cache.max_bytes = int(
+            os.environ.get("A_GIS_CHAT_CACHE_MAX_BYTES", str(1 << 30))
+        )
+        ttl = os.environ.get("A_GIS_CHAT_CACHE_TTL", "")
+        _Cache.ttl = float(ttl) if ttl else None
+        _Cache.initialized = True
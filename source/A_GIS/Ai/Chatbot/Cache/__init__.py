@@ -0,0 +1,19 @@
+"""Persistent cache of chatbot responses.
+"""
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "_connect",
+        "clear",
+        "configure",
+        "get_key",
+        "get_stats",
+        "lookup",
+        "store",
+    ],
+    classes=[
+        "_Cache",
+    ],
+)
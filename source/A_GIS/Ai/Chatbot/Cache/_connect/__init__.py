@@ -0,0 +1,29 @@
+def _connect(*, path: type["pathlib.Path"]):
+    """Open the SQLite database of the chatbot response cache.
+
+    The table is created on first use. A new connection is opened per
+    operation, so the cache can be shared by threads and processes.
+
+    Args:
+        path (pathlib.Path):
+            The database file.
+
+    Returns:
+        sqlite3.Connection:
+            The open connection.
+    """
+    import pathlib
+    import sqlite3
+
+    pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=30)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+        "created REAL NOT NULL, accessed REAL NOT NULL)"
+    )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS responses_accessed "
+        "ON responses (accessed)"
+    )
+    return connection
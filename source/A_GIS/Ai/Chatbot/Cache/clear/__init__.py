@@ -0,0 +1,20 @@
+def clear():
+    """Delete all responses from the chatbot response cache.
+
+    Returns:
+        int:
+            The number of deleted responses.
+    """
+    import A_GIS.Ai.Chatbot.Cache._Cache
+    import A_GIS.Ai.Chatbot.Cache._connect
+
+    cache = A_GIS.Ai.Chatbot.Cache._Cache
+    cache()
+    if not cache.path.exists():
+        return 0
+    with A_GIS.Ai.Chatbot.Cache._connect(path=cache.path) as connection:
+        count = connection.execute("DELETE FROM responses").rowcount
+    connection.close()
+    with cache.lock:
+        cache.bytes = 0
+    return count
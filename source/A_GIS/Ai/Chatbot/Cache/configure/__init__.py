@@ -0,0 +1,74 @@
+def configure(
+    *,
+    mode: str = None,
+    path: type["pathlib.Path"] = None,
+    max_bytes: int = None,
+    ttl: float = None,
+):
+    """Configure the persistent cache of chatbot responses.
+
+    The cache stores the responses of the chatbot providers in a SQLite
+    file, keyed by `A_GIS.Ai.Chatbot.Cache.get_key` on the provider, model,
+    messages, tools, format and sampling options. The modes are:
+
+    - "off": Do not use the cache (the default).
+    - "on": Return cached responses and store new ones.
+    - "bypass": Always ask the model and store the new responses.
+    - "replay": Only return cached responses. A miss raises `LookupError`
+      instead of contacting the model, for deterministic tests.
+
+    The key does not include the server address, so responses recorded
+    against a real server replay unchanged against a local stand-in.
+
+    Args:
+        mode (str, optional):
+            One of "off", "on", "bypass" or "replay". Defaults to None,
+            which keeps the current mode.
+        path (pathlib.Path, optional):
+            The database file. Defaults to None, which keeps the current
+            path, initially `~/.cache/A_GIS/chat.sqlite`.
+        max_bytes (int, optional):
+            The size above which the least recently used responses are
+            evicted. Defaults to None, which keeps the current size,
+            initially 1 GiB.
+        ttl (float, optional):
+            Seconds after which a response expires, or 0 for never.
+            Defaults to None, which keeps the current TTL.
+
+    Raises:
+        ValueError: If the mode is not known.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the resulting `mode`, `path`, `max_bytes` and
+            `ttl`.
+    """
+    import A_GIS.Ai.Chatbot.Cache._Cache
+    import A_GIS.Code.make_struct
+    import pathlib
+
+    cache = A_GIS.Ai.Chatbot.Cache._Cache
+    cache()
+    if mode is not None:
+        if mode not in cache.modes:
+            raise ValueError(
+                f"Unknown cache mode={mode}! Should be one of "
+                + ", ".join(cache.modes)
+                + "."
+            )
+        cache.mode = mode
+    if path is not None:
+        with cache.lock:
+            cache.path = pathlib.Path(path)
+            cache.bytes = None
+    if max_bytes is not None:
+        cache.max_bytes = max_bytes
+    if ttl is not None:
+        cache.ttl = ttl if ttl > 0 else None
+
+    return A_GIS.Code.make_struct(
+        mode=cache.mode,
+        path=cache.path,
+        max_bytes=cache.max_bytes,
+        ttl=cache.ttl,
+    )
@@ -0,0 +1,57 @@
+def get_key(
+    *,
+    provider: str,
+    model: str,
+    messages: list[dict],
+    tools: list[dict] = [],
+    format=None,
+    options: dict = {},
+) -> str:
+    """Compute the cache key of a chatbot request.
+
+    Args:
+        provider (str):
+            The provider, e.g. "ollama".
+        model (str):
+            The model name.
+        messages (list[dict]):
+            The full list of messages sent.
+        tools (list[dict], optional):
+            The tool schemas sent. Defaults to [].
+        format (optional):
+            The requested response format. Defaults to None.
+        options (dict, optional):
+            The sampling options. Defaults to {}.
+
+    Returns:
+        str:
+            The SHA-256 hex digest of the canonical JSON of the request.
+    """
+    import collections.abc
+    import hashlib
+    import json
+
+    def default(value):
+        # Messages returned by a provider may be objects.
+        if hasattr(value, "model_dump"):
+            return value.model_dump(exclude_none=True)
+        if isinstance(value, bytes):
+            return hashlib.sha256(value).hexdigest()
+        # A chatbot's message history is a sequence, not a list.
+        if isinstance(value, collections.abc.Sequence):
+            return list(value)
+        return repr(value)
+
+    text = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "messages": messages,
+            "tools": tools,
+            "format": format,
+            "options": options,
+        },
+        sort_keys=True,
+        default=default,
+    )
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -0,0 +1,45 @@
+def get_stats():
+    """Return the counters and size of the chatbot response cache.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - hits (int): Lookups answered from the cache in this process.
+            - misses (int): Lookups not found or expired in this process.
+            - writes (int): Responses stored in this process.
+            - evictions (int): Responses evicted in this process.
+            - entries (int): Responses in the cache.
+            - bytes (int): Size of the cached responses.
+            - _mode (str): The cache mode.
+            - _path (pathlib.Path): The database file.
+    """
+    import A_GIS.Ai.Chatbot.Cache._Cache
+    import A_GIS.Ai.Chatbot.Cache._connect
+    import A_GIS.Code.make_struct
+
+    cache = A_GIS.Ai.Chatbot.Cache._Cache
+    cache()
+    entries = 0
+    size = 0
+    if cache.path.exists():
+        with A_GIS.Ai.Chatbot.Cache._connect(path=cache.path) as connection:
+            entries, size = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        connection.close()
+
+    with cache.lock:
+        counters = (cache.hits, cache.misses, cache.writes, cache.evictions)
+    hits, misses, writes, evictions = counters
+
+    return A_GIS.Code.make_struct(
+        hits=hits,
+        misses=misses,
+        writes=writes,
+        evictions=evictions,
+        entries=entries,
+        bytes=size,
+        _mode=cache.mode,
+        _path=cache.path,
+    )
@@ -0,0 +1,59 @@
+def lookup(*, key: str):
+    """Look up a chatbot response in the persistent cache.
+
+    Expired responses are deleted and count as misses. A hit marks the
+    response as recently used.
+
+    Args:
+        key (str):
+            The key from `A_GIS.Ai.Chatbot.Cache.get_key`.
+
+    Raises:
+        LookupError: On a miss in "replay" mode.
+
+    Returns:
+        The cached response, or None on a miss or when the mode is "off" or
+        "bypass".
+    """
+    import A_GIS.Ai.Chatbot.Cache._Cache
+    import A_GIS.Ai.Chatbot.Cache._connect
+    import json
+    import time
+
+    cache = A_GIS.Ai.Chatbot.Cache._Cache
+    cache()
+    if cache.mode not in ("on", "replay"):
+        return None
+
+    now = time.time()
+    value = None
+    expired = 0
+    with A_GIS.Ai.Chatbot.Cache._connect(path=cache.path) as connection:
+        row = connection.execute(
+            "SELECT value, created, size FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is not None:
+            if cache.ttl is not None and now - row[1] > cache.ttl:
+                deleted = connection.execute(
+                    "DELETE FROM responses WHERE key = ?", (key,)
+                ).rowcount
+                expired = row[2] * deleted
+            else:
+                connection.execute(
+                    "UPDATE responses SET accessed = ? WHERE key = ?",
+                    (now, key),
+                )
+                value = json.loads(row[0])
+    connection.close()
+
+    with cache.lock:
+        if cache.bytes is not None:
+            cache.bytes -= expired
+        if value is None:
+            cache.misses += 1
+        else:
+            cache.hits += 1
+    if value is None and cache.mode == "replay":
+        raise LookupError(f"No cached chatbot response for key={key}!")
+    return value
@@ -0,0 +1,125 @@
+import A_GIS.Ai.Chatbot.Cache._Cache
+import A_GIS.Ai.Chatbot.Cache.clear
+import A_GIS.Ai.Chatbot.Cache.configure
+import A_GIS.Ai.Chatbot.Cache.get_key
+import A_GIS.Ai.Chatbot.Cache.get_stats
+import A_GIS.Ai.Chatbot.Cache.lookup
+import A_GIS.Ai.Chatbot.Cache.store
+import pytest
+
+
+@pytest.fixture
+def cache(tmp_path):
+    previous = A_GIS.Ai.Chatbot.Cache.configure()
+    yield A_GIS.Ai.Chatbot.Cache.configure(
+        mode="on", path=tmp_path / "chat.sqlite", max_bytes=1 << 20, ttl=0
+    )
+    A_GIS.Ai.Chatbot.Cache.configure(
+        mode=previous.mode,
+        path=previous.path,
+        max_bytes=previous.max_bytes,
+        ttl=previous.ttl or 0,
+    )
+
+
+def get_key(content, **kwargs):
+    return A_GIS.Ai.Chatbot.Cache.get_key(
+        provider="ollama",
+        model="llama3",
+        messages=[{"role": "user", "content": content}],
+        **kwargs,
+    )
+
+
+def test_get_key():
+    assert get_key("a") == get_key("a")
+    assert get_key("a") != get_key("b")
+    assert get_key("a") != get_key("a", options={"temperature": 0.5})
+    assert get_key("a", options={"a": 1, "b": 2}) == get_key(
+        "a", options={"b": 2, "a": 1}
+    )
+
+
+def test_store_and_lookup(cache):
+    key = get_key("hello")
+    hits = A_GIS.Ai.Chatbot.Cache.get_stats().hits
+    assert A_GIS.Ai.Chatbot.Cache.lookup(key=key) is None
+    value = {"message": {"role": "assistant", "content": "hi"}}
+    assert A_GIS.Ai.Chatbot.Cache.store(key=key, value=value)
+    assert A_GIS.Ai.Chatbot.Cache.lookup(key=key) == value
+    stats = A_GIS.Ai.Chatbot.Cache.get_stats()
+    assert stats.hits == hits + 1
+    assert stats.entries == 1
+    assert A_GIS.Ai.Chatbot.Cache.clear() == 1
+    assert A_GIS.Ai.Chatbot.Cache.lookup(key=key) is None
+
+
+def test_ttl(cache):
+    import time
+
+    key = get_key("hello")
+    A_GIS.Ai.Chatbot.Cache.store(key=key, value="hi")
+    A_GIS.Ai.Chatbot.Cache.configure(ttl=0.01)
+    time.sleep(0.05)
+    assert A_GIS.Ai.Chatbot.Cache.lookup(key=key) is None
+    assert A_GIS.Ai.Chatbot.Cache.get_stats().entries == 0
+
+
+def test_eviction(cache):
+    A_GIS.Ai.Chatbot.Cache.configure(max_bytes=250)
+    keys = [get_key(str(i)) for i in range(3)]
+    for key in keys:
+        A_GIS.Ai.Chatbot.Cache.store(key=key, value="x" * 100)
+        # Use the first response so the second is the least recently used.
+        A_GIS.Ai.Chatbot.Cache.lookup(key=keys[0])
+    assert A_GIS.Ai.Chatbot.Cache.lookup(key=keys[0]) is not None
+    assert A_GIS.Ai.Chatbot.Cache.lookup(key=keys[1]) is None
+    assert A_GIS.Ai.Chatbot.Cache.lookup(key=keys[2]) is not None
+
+
+def test_modes(cache):
+    key = get_key("hello")
+    A_GIS.Ai.Chatbot.Cache.configure(mode="bypass")
+    assert A_GIS.Ai.Chatbot.Cache.store(key=key, value="hi")
+    assert A_GIS.Ai.Chatbot.Cache.lookup(key=key) is None
+
+    A_GIS.Ai.Chatbot.Cache.configure(mode="replay")
+    assert A_GIS.Ai.Chatbot.Cache.lookup(key=key) == "hi"
+    assert not A_GIS.Ai.Chatbot.Cache.store(key=get_key("new"), value="x")
+    with pytest.raises(LookupError):
+        A_GIS.Ai.Chatbot.Cache.lookup(key=get_key("new"))
+
+    A_GIS.Ai.Chatbot.Cache.configure(mode="off")
+    assert A_GIS.Ai.Chatbot.Cache.lookup(key=key) is None
+    with pytest.raises(ValueError):
+        A_GIS.Ai.Chatbot.Cache.configure(mode="sometimes")
+
+
+def test_running_size_and_threads(cache):
+    import concurrent.futures
+
+    stats = A_GIS.Ai.Chatbot.Cache.get_stats()
+    keys = [get_key(str(i % 10)) for i in range(100)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        list(
+            pool.map(
+                lambda key: A_GIS.Ai.Chatbot.Cache.store(key=key, value=key),
+                keys,
+            )
+        )
+        list(
+            pool.map(lambda key: A_GIS.Ai.Chatbot.Cache.lookup(key=key), keys)
+        )
+    after = A_GIS.Ai.Chatbot.Cache.get_stats()
+    assert after.writes == stats.writes + 100
+    assert after.hits == stats.hits + 100
+    assert after.entries == 10
+
+    # The running size follows replaced and cleared responses.
+    assert A_GIS.Ai.Chatbot.Cache._Cache.bytes == after.bytes
+    A_GIS.Ai.Chatbot.Cache.clear()
+    A_GIS.Ai.Chatbot.Cache.store(key=keys[0], value="x")
+    assert (
+        A_GIS.Ai.Chatbot.Cache._Cache.bytes
+        == A_GIS.Ai.Chatbot.Cache.get_stats().bytes
+    )
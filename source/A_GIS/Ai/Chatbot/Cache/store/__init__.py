@@ -0,0 +1,75 @@
+def store(*, key: str, value):
+    """Store a chatbot response in the persistent cache.
+
+    After writing, the least recently used responses are evicted until the
+    cache is below its size limit, which is checked against the running
+    size in `A_GIS.Ai.Chatbot.Cache._Cache.bytes`. Nothing is stored in
+    "off" and "replay" modes.
+
+    Args:
+        key (str):
+            The key from `A_GIS.Ai.Chatbot.Cache.get_key`.
+        value:
+            The JSON-serializable response.
+
+    Returns:
+        bool:
+            Whether the response was stored.
+    """
+    import A_GIS.Ai.Chatbot.Cache._Cache
+    import A_GIS.Ai.Chatbot.Cache._connect
+    import json
+    import time
+
+    cache = A_GIS.Ai.Chatbot.Cache._Cache
+    cache()
+    if cache.mode not in ("on", "bypass"):
+        return False
+
+    now = time.time()
+    text = json.dumps(value, sort_keys=True, default=repr)
+    size = len(text.encode("utf-8"))
+    evicted = 0
+    with A_GIS.Ai.Chatbot.Cache._connect(path=cache.path) as connection:
+        # Take the write lock first, so the replaced size is still current
+        # when the running size is updated.
+        connection.execute("BEGIN IMMEDIATE")
+        row = connection.execute(
+            "SELECT size FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        connection.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+            (key, text, size, now, now),
+        )
+
+        with cache.lock:
+            if cache.bytes is not None:
+                cache.bytes += size - (row[0] if row is not None else 0)
+            total = cache.bytes
+
+        # Evict the least recently used responses above the limit, after
+        # recounting what other processes may have added or removed.
+        if total is None or total > cache.max_bytes:
+            total = connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+        if total > cache.max_bytes:
+            rows = connection.execute(
+                "SELECT key, size FROM responses ORDER BY accessed"
+            )
+            delete = []
+            for old_key, old_size in rows:
+                if total <= cache.max_bytes:
+                    break
+                delete.append((old_key,))
+                total -= old_size
+            connection.executemany(
+                "DELETE FROM responses WHERE key = ?", delete
+            )
+            evicted = len(delete)
+        with cache.lock:
+            cache.bytes = total
+            cache.writes += 1
+            cache.evictions += evicted
+    connection.close()
+    return True
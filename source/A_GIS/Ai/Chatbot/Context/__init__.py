@@ -0,0 +1,11 @@
+"""Keep chatbot message histories within the context window.
+"""
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "count_tokens",
+        "fit",
+    ],
+)
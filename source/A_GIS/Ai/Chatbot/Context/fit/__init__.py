@@ -0,0 +1,160 @@
+def fit(
+    *,
+    messages: list[dict],
+    max_tokens: int,
+    policy: str = "truncate",
+    tokenizer=None,
+    summarize=None,
+    max_tool_chars: int = 2000,
+):
+    """Fit a chatbot message history into a token budget.
+
+    The system messages at the start and the last turn, from the last user
+    message on, are always kept. When the history is over `max_tokens`, the
+    policy decides what gives way:
+
+    - "none": Nothing, the history is only counted.
+    - "truncate": The oldest turns are dropped.
+    - "elide": Tool results longer than `max_tool_chars` are cut, oldest
+      first, and then the oldest turns are dropped if still needed.
+    - "summarize": The oldest turns are replaced by one message holding
+      `summarize(dropped_messages)`, if it fits, and dropped otherwise.
+
+    Args:
+        messages (list[dict]):
+            The message history. It is not modified.
+        max_tokens (int):
+            The token budget of the history.
+        policy (str, optional):
+            One of "none", "truncate", "elide" or "summarize". Defaults to
+            "truncate".
+        tokenizer (callable, optional):
+            Passed to `A_GIS.Ai.Chatbot.Context.count_tokens`. Defaults to
+            None, which estimates the counts.
+        summarize (callable, optional):
+            Returns a summary text of a list of messages. Required for the
+            "summarize" policy.
+        max_tool_chars (int, optional):
+            The characters of a tool result kept by the "elide" policy.
+            Defaults to 2000.
+
+    Raises:
+        ValueError: If the policy is not known, or "summarize" is missing a
+            summarize function.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - messages (list[dict]): The fitted history, sharing the
+              unchanged messages with the input.
+            - tokens (int): The tokens of the fitted history.
+            - fits (bool): Whether the fitted history is within the budget.
+            - dropped (int): Messages dropped or summarized.
+            - elided (int): Tool results cut.
+            - _tokens_before (int): The tokens of the input history.
+            - _max_tokens (int): The budget.
+            - _policy (str): The policy.
+    """
+    import A_GIS.Ai.Chatbot.Context.count_tokens
+    import A_GIS.Code.make_struct
+
+    policies = ("none", "truncate", "elide", "summarize")
+    if policy not in policies:
+        raise ValueError(
+            f"Unknown context policy={policy}! Should be one of "
+            + ", ".join(policies)
+            + "."
+        )
+    if policy == "summarize" and summarize is None:
+        raise ValueError("The summarize policy needs a summarize function!")
+
+    def count(message):
+        return A_GIS.Ai.Chatbot.Context.count_tokens(
+            message=message, tokenizer=tokenizer
+        )
+
+    counts = [count(x) for x in messages]
+    tokens_before = sum(counts)
+
+    # Split into the leading system messages, the older turns and the last
+    # turn.
+    start = 0
+    while start < len(messages) and messages[start].get("role") == "system":
+        start += 1
+    last = len(messages)
+    for i in range(len(messages) - 1, start - 1, -1):
+        if messages[i].get("role") == "user":
+            last = i
+            break
+    head = list(range(start))
+    middle = list(range(start, last))
+    tail = list(range(last, len(messages)))
+
+    result = list(messages)
+    tokens = tokens_before
+    dropped = 0
+    elided = 0
+    if policy == "elide":
+        for i in middle + tail:
+            if tokens <= max_tokens:
+                break
+            content = result[i].get("content") or ""
+            if (
+                result[i].get("role") == "tool"
+                and len(content) > max_tool_chars
+            ):
+                cut = len(content) - max_tool_chars
+                result[i] = dict(
+                    result[i],
+                    content=content[:max_tool_chars]
+                    + f"... [elided {cut} characters]",
+                )
+                new_count = count(result[i])
+                tokens += new_count - counts[i]
+                counts[i] = new_count
+                elided += 1
+
+    if policy != "none" and tokens > max_tokens:
+        # Drop whole turns, oldest first, so tool results are never left
+        # without the call that asked for them.
+        keep = list(middle)
+        removed = []
+        while keep and tokens > max_tokens:
+            end = 1
+            while end < len(keep) and result[keep[end]].get("role") != "user":
+                end += 1
+            for i in keep[:end]:
+                tokens -= counts[i]
+            removed += keep[:end]
+            keep = keep[end:]
+        dropped = len(removed)
+
+        summary = []
+        if policy == "summarize" and removed:
+            message = {
+                "role": "user",
+                "content": "Summary of the earlier conversation:\n\n"
+                + summarize([result[i] for i in removed]),
+            }
+            if tokens + count(message) <= max_tokens:
+                summary = [message]
+                tokens += count(message)
+
+        result = (
+            [result[i] for i in head]
+            + summary
+            + [result[i] for i in keep]
+            + [result[i] for i in tail]
+        )
+
+    return A_GIS.Code.make_struct(
+        messages=result,
+        tokens=tokens,
+        fits=tokens <= max_tokens,
+        dropped=dropped,
+        elided=elided,
+        _tokens_before=tokens_before,
+        _max_tokens=max_tokens,
+        _policy=policy,
+    )
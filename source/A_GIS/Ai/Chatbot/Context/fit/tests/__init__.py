@@ -0,0 +1,92 @@
+import A_GIS.Ai.Chatbot.Context.count_tokens
+import A_GIS.Ai.Chatbot.Context.fit
+import pytest
+
+
+def get_messages():
+    return [
+        {"role": "system", "content": "s" * 40},
+        {"role": "user", "content": "u" * 40},
+        {"role": "assistant", "content": "a" * 40},
+        {"role": "tool", "name": "t", "content": "x" * 400},
+        {"role": "assistant", "content": "a" * 40},
+        {"role": "user", "content": "u" * 40},
+        {"role": "assistant", "content": "a" * 40},
+        {"role": "user", "content": "last"},
+    ]
+
+
+def test_count_tokens():
+    count = A_GIS.Ai.Chatbot.Context.count_tokens
+    assert count(message="abcdefgh") == 2
+    assert count(message={"role": "user", "content": "abcdefgh"}) == 6
+    assert count(message="a b c", tokenizer=str.split) == 3
+    assert count(message="a b c", tokenizer=lambda text: 7) == 7
+
+
+def test_none_and_fits():
+    messages = get_messages()
+    result = A_GIS.Ai.Chatbot.Context.fit(
+        messages=messages, max_tokens=10, policy="none"
+    )
+    assert result.messages == messages
+    assert not result.fits
+    result = A_GIS.Ai.Chatbot.Context.fit(messages=messages, max_tokens=1000)
+    assert result.messages == messages
+    assert result.fits
+    assert result.tokens == result._tokens_before
+
+
+def test_truncate():
+    messages = get_messages()
+    result = A_GIS.Ai.Chatbot.Context.fit(messages=messages, max_tokens=60)
+    assert result.fits
+    # The whole first turn, with its tool result, is dropped.
+    assert result.messages == messages[:1] + messages[5:]
+    assert result.dropped == 4
+
+    # The system message and last turn stay even if they do not fit.
+    result = A_GIS.Ai.Chatbot.Context.fit(messages=messages, max_tokens=10)
+    assert result.messages == [messages[0], messages[-1]]
+    assert not result.fits
+
+
+def test_elide():
+    messages = get_messages()
+    result = A_GIS.Ai.Chatbot.Context.fit(
+        messages=messages, max_tokens=110, policy="elide", max_tool_chars=20
+    )
+    assert result.fits
+    assert result.elided == 1
+    assert result.dropped == 0
+    assert result.messages[3]["content"].endswith("[elided 380 characters]")
+    assert messages[3]["content"] == "x" * 400
+
+
+def test_summarize():
+    messages = get_messages()
+    summarized = []
+
+    def summarize(dropped):
+        summarized.extend(dropped)
+        return "short"
+
+    result = A_GIS.Ai.Chatbot.Context.fit(
+        messages=messages,
+        max_tokens=70,
+        policy="summarize",
+        summarize=summarize,
+    )
+    assert summarized == messages[1:5]
+    assert result.messages[1]["content"].endswith("short")
+    assert result.messages[2:] == messages[5:]
+    assert result.fits
+
+    with pytest.raises(ValueError):
+        A_GIS.Ai.Chatbot.Context.fit(
+            messages=messages, max_tokens=60, policy="summarize"
+        )
+    with pytest.raises(ValueError):
+        A_GIS.Ai.Chatbot.Context.fit(
+            messages=messages, max_tokens=60, policy="forget"
+        )
@@ -0,0 +1,43 @@
+import itertools
+import threading
+
+class _Replay:
+    """Process-wide settings of the "replay" chatbot provider.
+
+    The responses come from `script`, a callable, or else from the
+    `transcript` list in order, or else echo the last user message. The
+    settings are read once from `A_GIS_REPLAY_TRANSCRIPT`,
+    `A_GIS_REPLAY_LATENCY` and `A_GIS_REPLAY_TOKENS_PER_S`, and can be
+    changed with `A_GIS.Ai.Chatbot.Replay.configure`.
+    """
+
+    initialized = False
+    script = None
+    transcript = None
+    latency_s = 0.0
+    tokens_per_s = 0.0
+
+    # Position in the transcript.
+    position = itertools.count()
+    lock = threading.Lock()
+
+    def __init__(self):
+        if not _Replay.initialized:
+            self._do_initialize()
+
+    @staticmethod
+    def _do_initialize():
+        import A_GIS.Ai.Chatbot.Replay.configure
+        import os
+
+        if _Replay.initialized:
+            return
+
+        _Replay.initialized = True
+        A_GIS.Ai.Chatbot.Replay.configure(
+            transcript=os.environ.get("A_GIS_REPLAY_TRANSCRIPT") or None,
+            latency_s=float(os.environ.get("A_GIS_REPLAY_LATENCY", "0")),
+            tokens_per_s=float(
+                os.environ.get("A_GIS_REPLAY_TOKENS_PER_S", "0")
+            ),
+        )
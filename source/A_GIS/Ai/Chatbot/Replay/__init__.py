@@ -0,0 +1,14 @@
+"""Serve scripted chatbot responses without a model server.
+"""
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "configure",
+        "get_response",
+    ],
+    classes=[
+        "_Replay",
+    ],
+)
@@ -0,0 +1,74 @@
+def configure(
+    *,
+    script=None,
+    transcript=None,
+    latency_s: float = None,
+    tokens_per_s: float = None,
+):
+    """Configure the responses and timing of the "replay" chatbot provider.
+
+    A chatbot from `A_GIS.Ai.Chatbot.init(provider="replay")` answers
+    without a model server, so the prompt building, parsing and tool
+    dispatch around it can be profiled and tested deterministically.
+    Setting a script or transcript restarts the transcript.
+
+    Args:
+        script (callable, optional):
+            Called as `script(messages=..., model=...)` for each request and
+            returns the response as a string or a message dict, which may
+            have `tool_calls`. Defaults to None, which keeps the current
+            script.
+        transcript (list | str, optional):
+            The responses to serve in order, starting over at the end, or
+            the path of a JSON list or JSON lines file of them. Entries are
+            strings, message dicts or logged responses with a "message",
+            such as the values of `A_GIS.Ai.Chatbot.Cache`. Defaults to
+            None, which keeps the current transcript.
+        latency_s (float, optional):
+            Seconds before the first token. Defaults to None, which keeps
+            the current latency, initially 0.
+        tokens_per_s (float, optional):
+            The rate at which tokens are generated after the first, or 0
+            for no delay. Defaults to None, which keeps the current rate,
+            initially 0.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the resulting `script`, `transcript`,
+            `latency_s` and `tokens_per_s`.
+    """
+    import A_GIS.Ai.Chatbot.Replay._Replay
+    import A_GIS.Code.make_struct
+    import itertools
+    import json
+    import pathlib
+
+    replay = A_GIS.Ai.Chatbot.Replay._Replay
+    replay()
+    if isinstance(transcript, (str, pathlib.Path)):
+        text = pathlib.Path(transcript).read_text()
+        if text.lstrip().startswith("["):
+            transcript = json.loads(text)
+        else:
+            transcript = [
+                json.loads(x) for x in text.splitlines() if x.strip()
+            ]
+
+    with replay.lock:
+        if script is not None:
+            replay.script = script
+        if transcript is not None:
+            replay.transcript = list(transcript)
+        if script is not None or transcript is not None:
+            replay.position = itertools.count()
+        if latency_s is not None:
+            replay.latency_s = latency_s
+        if tokens_per_s is not None:
+            replay.tokens_per_s = tokens_per_s
+
+    return A_GIS.Code.make_struct(
+        script=replay.script,
+        transcript=replay.transcript,
+        latency_s=replay.latency_s,
+        tokens_per_s=replay.tokens_per_s,
+    )
@@ -0,0 +1,36 @@
+def get_response(*, messages: list[dict], model: str) -> dict:
+    """Return the next message of the "replay" chatbot provider.
+
+    Args:
+        messages (list[dict]):
+            The messages of the request.
+        model (str):
+            The model of the request.
+
+    Returns:
+        dict:
+            An assistant message with a "content" and, if the response has
+            them, "tool_calls".
+    """
+    import A_GIS.Ai.Chatbot.Replay._Replay
+
+    replay = A_GIS.Ai.Chatbot.Replay._Replay
+    replay()
+    if replay.script is not None:
+        response = replay.script(messages=messages, model=model)
+    elif replay.transcript:
+        with replay.lock:
+            i = next(replay.position)
+        response = replay.transcript[i % len(replay.transcript)]
+    else:
+        response = ""
+        for message in reversed(messages):
+            if message.get("role") == "user":
+                response = message.get("content") or ""
+                break
+
+    if isinstance(response, str):
+        return {"role": "assistant", "content": response}
+    if "message" in response:
+        response = response["message"]
+    return {"role": "assistant", "content": "", **response}
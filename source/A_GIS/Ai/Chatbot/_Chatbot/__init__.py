@@ -24,13 +24,26 @@ class _Chatbot:
     tool_names: list[str]
     tools: list[dict]
 
+    # How to keep the history within the context window, see
+    # A_GIS.Ai.Chatbot.Context.fit.
+    context_policy: str = "truncate"
+    tokenizer: "typing.Any" = None
+
+    # How long the server keeps the model loaded, e.g. "30m".
+    keep_alive: "typing.Any" = None
+
+    # Server to use instead of the provider's, e.g. a local stand-in.
+    http_base_url: str = None
+
     def __post_init__(self):
         """Initialize tools and messages."""
+        import A_GIS.Ai.Chatbot._History
         import A_GIS.Code.get_schema
 
         # Add the system message.
         if len(self.messages) == 0 and self.system != "":
             self.messages = [{"role": "system", "content": self.system}]
+        self.messages = A_GIS.Ai.Chatbot._History(self.messages)
 
         # Expand the tools.
         if len(self.tools) == 0:
@@ -42,18 +55,115 @@ class _Chatbot:
         *,
         message: str,
         images=[],
+        stream=None,
         **kwargs,
     ):
         """Forwards to send chat."""
         self.messages.append(
             {"role": "user", "content": message, "images": images}
         )
-        return self._send_chat(
+        self._fit_context(**kwargs)
+
+        def fit_context(*, messages):
+            # Tool results can outgrow the context window within one chat,
+            # so the provider fits the history again before every follow-up.
+            self._fit_context(**kwargs)
+            return self.messages
+
+        # The provider extends the history itself with the response.
+        result = self._send_chat(
             model=self.model,
             messages=self.messages,
             tools=self.tools,
+            stream=stream,
+            keep_alive=self.keep_alive,
+            http_base_url=self.http_base_url,
+            fit_context=fit_context,
             **self._get_kwargs(**kwargs),
         )
+        return result
+
+    def preload(self):
+        """Forwards to preload."""
+        import A_GIS.Ai.Chatbot.preload
+
+        return A_GIS.Ai.Chatbot.preload(chatbot=self)
+
+    def fork(self):
+        """Return a copy that continues the conversation independently.
+
+        The message history is shared until either copy adds to it, so
+        forking takes constant time however long the conversation is.
+        """
+        import copy
+
+        chatbot = copy.copy(self)
+        chatbot.messages = self.messages.fork()
+        return chatbot
+
+    def chat_many(
+        self,
+        *,
+        messages: list[str],
+        images: list[list[str]] = [],
+        max_in_flight: int = 4,
+        timeout: float = None,
+        **kwargs,
+    ):
+        """Forwards to chat many, leaving this chatbot unchanged."""
+        import A_GIS.Ai.Chatbot.chat_many
+
+        return A_GIS.Ai.Chatbot.chat_many(
+            chatbot=self,
+            messages=messages,
+            images=images,
+            max_in_flight=max_in_flight,
+            timeout=timeout,
+            **kwargs,
+        )
+
+    def _fit_context(self, **kwargs):
+        """Fit the messages into the context window, leaving room for the
+        response."""
+        import A_GIS.Ai.Chatbot.Context.fit
+        import A_GIS.Ai.Chatbot._History
+
+        num_ctx = kwargs.get("num_ctx", self.num_ctx)
+        num_predict = kwargs.get("num_predict", self.num_predict)
+        result = A_GIS.Ai.Chatbot.Context.fit(
+            messages=list(self.messages),
+            max_tokens=num_ctx - min(num_predict, num_ctx // 4),
+            policy=self.context_policy,
+            tokenizer=self.tokenizer,
+            summarize=self._summarize,
+        )
+        if result.dropped or result.elided:
+            self.messages = A_GIS.Ai.Chatbot._History(result.messages)
+        return result
+
+    def _summarize(self, messages: list[dict]) -> str:
+        """Summarize messages with the chatbot's own model."""
+        transcript = "\n\n".join(
+            f"{x.get('role')}: {x.get('content') or ''}" for x in messages
+        )
+        result = self._send_chat(
+            model=self.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "Summarize this conversation in a few "
+                    "sentences, keeping every fact, name and decision that "
+                    "later messages could refer to.",
+                },
+                {"role": "user", "content": transcript},
+            ],
+            tools=[],
+            keep_alive=self.keep_alive,
+            http_base_url=self.http_base_url,
+            **self._get_kwargs(),
+        )
+        response = getattr(result, "response", result)
+        return response["message"]["content"]
 
     def _get_kwargs(self, **kwargs):
         """Forwards args."""
@@ -0,0 +1,39 @@
+import threading
+
+class _Clients:
+    """Process-wide pool of chatbot provider clients.
+
+    One client is kept per provider, API key and base URL, so every chatbot
+    of a process shares its HTTP connection pool and keep-alive
+    connections. Failed OpenAI and Groq requests are retried up to
+    `max_retries` times, from `A_GIS_CHAT_MAX_RETRIES` and 2 by default,
+    waiting `retry_backoff` seconds, from `A_GIS_CHAT_RETRY_BACKOFF` and
+    0.5 by default, doubled after every attempt.
+    """
+
+    initialized = False
+    max_retries = None
+    retry_backoff = None
+    lock = threading.Lock()
+
+    # The clients by provider, API key and base URL.
+    clients = {}
+
+    def __init__(self):
+        if not _Clients.initialized:
+            self._do_initialize()
+
+    @staticmethod
+    def _do_initialize():
+        import os
+
+        if _Clients.initialized:
+            return
+
+        _Clients.max_retries = int(
+            os.environ.get("A_GIS_CHAT_MAX_RETRIES", "2")
+        )
+        _Clients.retry_backoff = float(
+            os.environ.get("A_GIS_CHAT_RETRY_BACKOFF", "0.5")
+        )
+        _Clients.initialized = True
@@ -0,0 +1,80 @@
+import collections.abc
+import threading
+
+class _History(collections.abc.Sequence):
+    """Append-only message history that forks in constant time.
+
+    Forks share one backing list and each only sees its own prefix of it.
+    Appending to the fork that ends at the end of the backing list extends
+    it in place; appending to any other fork first copies its prefix, so
+    the other forks never see the change. Forking a long conversation is
+    therefore constant-time, and forked conversations share the memory of
+    their common messages, which are never copied.
+
+    Messages are shared by reference, so they must not be modified in
+    place. Anything other than appending copies the prefix as well.
+
+    It is a `collections.abc.Sequence`, not a list, so it is passed to the
+    providers as is. `A_GIS.Ai.Chatbot.Cache.get_key` and the log write it
+    as a JSON list; elsewhere use `json.dumps(history, default=list)`.
+    """
+
+    # Guards the check-then-append on backing lists shared across threads.
+    _lock = threading.Lock()
+
+    def __init__(self, messages=()):
+        self._base = list(messages)
+        self._length = len(self._base)
+
+    def fork(self):
+        """Return an independent history with the same messages."""
+        history = _History.__new__(_History)
+        history._base = self._base
+        history._length = self._length
+        return history
+
+    def append(self, message):
+        with _History._lock:
+            if self._length != len(self._base):
+                self._base = self._base[: self._length]
+            self._base.append(message)
+            self._length += 1
+
+    def extend(self, messages):
+        for message in messages:
+            self.append(message)
+
+    def __setitem__(self, index, message):
+        with _History._lock:
+            self._base = self._base[: self._length]
+            self._base[index] = message
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._base[: self._length][index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("history index out of range")
+        return self._base[index]
+
+    def __iter__(self):
+        import itertools
+
+        return itertools.islice(self._base, self._length)
+
+    def __eq__(self, other):
+        if isinstance(other, (_History, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self._base[: self._length])
+
+    def __deepcopy__(self, memo):
+        import copy
+
+        return _History(copy.deepcopy(list(self), memo))
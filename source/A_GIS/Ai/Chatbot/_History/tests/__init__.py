@@ -0,0 +1,107 @@
+import A_GIS.Ai.Chatbot._Chatbot
+import A_GIS.Ai.Chatbot.Cache.get_key
+import A_GIS.Ai.Chatbot._History
+import A_GIS.Ai.Chatbot.chat
+import A_GIS.Code.make_struct
+import A_GIS.Log._LazyValue
+import copy
+import json
+import threading
+
+
+def test_fork():
+    a = A_GIS.Ai.Chatbot._History([1, 2])
+    b = a.fork()
+    assert b._base is a._base
+
+    # The first fork to append extends the shared list in place.
+    a.append(3)
+    assert b._base is a._base
+    assert list(a) == [1, 2, 3]
+    assert list(b) == [1, 2]
+
+    # The other fork copies its prefix before appending.
+    b.append(4)
+    assert b._base is not a._base
+    assert list(a) == [1, 2, 3]
+    assert list(b) == [1, 2, 4]
+    assert a[-1] == 3
+    assert b[0:2] == [1, 2]
+    assert len(b) == 3
+
+    c = a.fork()
+    c[0] = 0
+    assert list(a) == [1, 2, 3]
+    assert c == [0, 2, 3]
+    assert repr(c) == "[0, 2, 3]"
+    assert copy.deepcopy(c) == c
+
+
+def test_threads():
+    history = A_GIS.Ai.Chatbot._History(["start"])
+    forks = [history.fork() for _ in range(8)]
+
+    def extend(i):
+        for j in range(1000):
+            forks[i].append((i, j))
+
+    threads = [threading.Thread(target=extend, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for i, fork in enumerate(forks):
+        assert list(fork) == ["start"] + [(i, j) for j in range(1000)]
+    assert list(history) == ["start"]
+
+
+def test_chat_shares_history():
+    def send(*, model, messages, tools, **kwargs):
+        # The history itself is sent, not a copy of it.
+        assert isinstance(messages, A_GIS.Ai.Chatbot._History)
+        messages.append({"role": "assistant", "content": "ok"})
+        return A_GIS.Code.make_struct(
+            messages=messages, response={"message": messages[-1]}
+        )
+
+    chatbot = A_GIS.Ai.Chatbot._Chatbot(
+        model="fake",
+        mirostat=0,
+        num_predict=100,
+        num_ctx=1000,
+        temperature=0.0,
+        provider="ollama",
+        system="Be brief.",
+        _send_chat=send,
+        messages=[],
+        tool_names=[],
+        tools=[],
+    )
+    result1 = A_GIS.Ai.Chatbot.chat(chatbot=chatbot, message="one")
+    result2 = A_GIS.Ai.Chatbot.chat(chatbot=result1.chatbot, message="two")
+    result3 = A_GIS.Ai.Chatbot.chat(chatbot=result1.chatbot, message="three")
+    assert len(chatbot.messages) == 1
+    assert len(result1.chatbot.messages) == 3
+    assert [x["content"] for x in result2.chatbot.messages] == [
+        "Be brief.",
+        "one",
+        "ok",
+        "two",
+        "ok",
+    ]
+    assert result3.chatbot.messages[3]["content"] == "three"
+
+    # The common messages are shared, not copied.
+    assert result2.chatbot.messages[1] is result3.chatbot.messages[1]
+
+
+def test_serialized_as_list():
+    messages = [{"role": "user", "content": "hi"}]
+    history = A_GIS.Ai.Chatbot._History(messages).fork()
+    assert json.dumps(history, default=list) == json.dumps(messages)
+    assert A_GIS.Log._LazyValue(history).__structlog__() == messages
+    assert A_GIS.Ai.Chatbot.Cache.get_key(
+        provider="ollama", model="m", messages=history
+    ) == A_GIS.Ai.Chatbot.Cache.get_key(
+        provider="ollama", model="m", messages=messages
+    )
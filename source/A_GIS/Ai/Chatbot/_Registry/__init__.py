@@ -0,0 +1,47 @@
+import threading
+
+class _Registry:
+    """Process-wide cache of the installed models and their capabilities.
+
+    `A_GIS.Ai.Chatbot.list_models` keeps the installed model names here and
+    `A_GIS.Ai.Chatbot.get_info` the context length and tool support of each
+    model, so a conversation asks the server only once. Entries are kept
+    per server, the `http_base_url` or None for the default one, and are
+    refreshed after `ttl` seconds, read from `A_GIS_MODEL_INFO_TTL` and
+    300 by default, or on `A_GIS.Ai.Chatbot.invalidate_info`.
+    """
+
+    initialized = False
+    ttl = None
+    lock = threading.Lock()
+
+    # Installed model names and when they were listed, by server.
+    models = {}
+    models_time = {}
+
+    # Server and model name to its information and when it was resolved.
+    info = {}
+
+    def __init__(self):
+        if not _Registry.initialized:
+            self._do_initialize()
+
+    @staticmethod
+    def _do_initialize():
+        import os
+
+        if _Registry.initialized:
+            return
+
+        _Registry.ttl = float(os.environ.get("A_GIS_MODEL_INFO_TTL", "300"))
+        _Registry.initialized = True
+
+    @staticmethod
+    def is_fresh(resolved):
+        """Return whether an entry resolved at this monotonic time is fresh."""
+        import time
+
+        return (
+            resolved is not None
+            and time.monotonic() - resolved < _Registry.ttl
+        )
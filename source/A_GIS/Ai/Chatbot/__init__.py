@@ -1,13 +1,38 @@
 """Wraps AI chatbots into a few key interfaces.
 """
-# Functions
-from ._send_chat_groq import _send_chat_groq
-from ._send_chat_ollama import _send_chat_ollama
-from ._send_chat_openai import _send_chat_openai
-from .chat import chat
-from .get_info import get_info
-from .init import init
-from .list_models import list_models
+import A_GIS.Code.Tree._LazyPackage
 
-# Classes
-from ._Chatbot import _Chatbot
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "_create_completion",
+        "_get_client",
+        "_get_metrics",
+        "_run_tool_calls",
+        "_send_chat_groq",
+        "_send_chat_ollama",
+        "_send_chat_openai",
+        "_send_chat_replay",
+        "chat",
+        "chat_many",
+        "chat_many_async",
+        "get_info",
+        "get_session",
+        "init",
+        "invalidate_info",
+        "list_models",
+        "prefetch_info",
+        "preload",
+    ],
+    classes=[
+        "_Chatbot",
+        "_Clients",
+        "_History",
+        "_Registry",
+    ],
+    packages=[
+        "Cache",
+        "Context",
+        "Replay",
+    ],
+)
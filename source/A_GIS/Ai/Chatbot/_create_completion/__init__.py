@@ -0,0 +1,43 @@
+def _create_completion(*, client, **kwargs):
+    """Create an OpenAI-style chat completion, retrying transient errors.
+
+    Connection errors, timeouts, rate limits and server errors are retried
+    up to `A_GIS.Ai.Chatbot._Clients.max_retries` times, waiting
+    `A_GIS.Ai.Chatbot._Clients.retry_backoff` seconds before the first
+    retry and twice as long before each next one, with some jitter so
+    concurrent requests do not retry in lockstep.
+
+    Args:
+        client:
+            An `openai.OpenAI` or `groq.Groq` client.
+        **kwargs (dict, optional):
+            The arguments of `client.chat.completions.create`.
+
+    Returns:
+        The completion, or the stream of chunks with `stream=True`.
+    """
+    import A_GIS.Ai.Chatbot._Clients
+    import random
+    import time
+
+    clients = A_GIS.Ai.Chatbot._Clients
+    clients()
+    retryable = (
+        "APIConnectionError",
+        "APITimeoutError",
+        "RateLimitError",
+        "InternalServerError",
+    )
+    attempt = 0
+    while True:
+        try:
+            return client.chat.completions.create(**kwargs)
+        except Exception as e:
+            names = [x.__name__ for x in type(e).__mro__]
+            if attempt >= clients.max_retries or not any(
+                x in retryable for x in names
+            ):
+                raise
+        delay = clients.retry_backoff * 2**attempt
+        time.sleep(delay * random.uniform(0.75, 1.25))
+        attempt += 1
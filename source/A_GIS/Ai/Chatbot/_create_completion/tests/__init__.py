@@ -0,0 +1,60 @@
+import A_GIS.Ai.Chatbot._Clients
+import A_GIS.Ai.Chatbot._create_completion
+import pytest
+import types
+
+
+class APIConnectionError(Exception):
+    pass
+
+
+class APITimeoutError(APIConnectionError):
+    pass
+
+
+class AuthenticationError(Exception):
+    pass
+
+
+def get_client(errors):
+    """Return a client failing with the given errors before answering."""
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "completion"
+
+    completions = types.SimpleNamespace(create=create)
+    client = types.SimpleNamespace(
+        chat=types.SimpleNamespace(completions=completions)
+    )
+    return client, calls
+
+
+@pytest.fixture
+def clients(monkeypatch):
+    A_GIS.Ai.Chatbot._Clients()
+    monkeypatch.setattr(A_GIS.Ai.Chatbot._Clients, "max_retries", 2)
+    monkeypatch.setattr(A_GIS.Ai.Chatbot._Clients, "retry_backoff", 0.01)
+
+
+def test_retries(clients):
+    client, calls = get_client([APIConnectionError(), APITimeoutError()])
+    result = A_GIS.Ai.Chatbot._create_completion(client=client, model="m")
+    assert result == "completion"
+    assert len(calls) == 3
+    assert calls[0] == {"model": "m"}
+
+    client, calls = get_client([APIConnectionError()] * 3)
+    with pytest.raises(APIConnectionError):
+        A_GIS.Ai.Chatbot._create_completion(client=client, model="m")
+    assert len(calls) == 3
+
+
+def test_no_retry(clients):
+    client, calls = get_client([AuthenticationError()])
+    with pytest.raises(AuthenticationError):
+        A_GIS.Ai.Chatbot._create_completion(client=client, model="m")
+    assert len(calls) == 1
@@ -0,0 +1,62 @@
+def _get_client(*, provider: str, http_base_url: str = None):
+    """Return the shared client of a chatbot provider.
+
+    The client is created on first use and kept in
+    `A_GIS.Ai.Chatbot._Clients` for the API key, read from
+    `OPENAI_API_KEY` or `GROQ_API_KEY`, and the base URL. The SDK's own
+    retries are turned off, as `A_GIS.Ai.Chatbot._create_completion`
+    retries with a configurable backoff.
+
+    Args:
+        provider (str):
+            One of "ollama", "openai" or "groq".
+        http_base_url (str, optional):
+            The server to use instead of the provider's, e.g. a local
+            stand-in for load tests. Defaults to None, which uses the SDK's
+            default, including its environment variables.
+
+    Raises:
+        ValueError: If the provider is not known.
+
+    Returns:
+        The `ollama.Client`, `openai.OpenAI` or `groq.Groq` client.
+    """
+    import A_GIS.Ai.Chatbot._Clients
+    import os
+
+    clients = A_GIS.Ai.Chatbot._Clients
+    clients()
+    api_key = {
+        "ollama": None,
+        "openai": os.environ.get("OPENAI_API_KEY"),
+        "groq": os.environ.get("GROQ_API_KEY"),
+    }
+    if provider not in api_key:
+        raise ValueError(f"Provider={provider} not recognized!")
+
+    key = (provider, api_key[provider], http_base_url)
+    with clients.lock:
+        client = clients.clients.get(key)
+        if client is None:
+            if provider == "ollama":
+                import ollama
+
+                client = ollama.Client(host=http_base_url)
+            elif provider == "openai":
+                import openai
+
+                client = openai.OpenAI(
+                    api_key=api_key[provider],
+                    base_url=http_base_url,
+                    max_retries=0,
+                )
+            else:
+                import groq
+
+                client = groq.Groq(
+                    api_key=api_key[provider],
+                    base_url=http_base_url,
+                    max_retries=0,
+                )
+            clients.clients[key] = client
+    return client
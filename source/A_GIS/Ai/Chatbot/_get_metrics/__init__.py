@@ -0,0 +1,94 @@
+def _get_metrics(
+    *,
+    response,
+    wall_s: float,
+    first_token_s: float = None,
+    cached: bool = False,
+):
+    """Compute the latency metrics of one chatbot response.
+
+    Ollama reports its own timings in nanoseconds, `load_duration`,
+    `prompt_eval_duration`, `eval_duration` and `total_duration`, with the
+    token counts `prompt_eval_count` and `eval_count`. OpenAI-style
+    responses only report token counts in `usage`, so their timings come
+    from the client-side measurements.
+
+    Args:
+        response:
+            The provider response, as a dictionary or an object with
+            `model_dump`.
+        wall_s (float):
+            The client-side seconds from sending the request to the end of
+            the response.
+        first_token_s (float, optional):
+            The client-side seconds to the first streamed content. Defaults
+            to None, for a response that was not streamed.
+        cached (bool, optional):
+            Whether the response came from `A_GIS.Ai.Chatbot.Cache`.
+            Defaults to False.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes, None if unknown:
+
+            - time_to_first_token_s (float): Seconds until the first token,
+              measured when streaming and otherwise the model load and
+              prompt evaluation time.
+            - load_s (float): Seconds spent loading the model.
+            - prompt_eval_s (float): Seconds spent evaluating the prompt.
+            - eval_s (float): Seconds spent generating tokens.
+            - tokens_per_s (float): Generated tokens per second.
+            - total_s (float): Total seconds reported by the provider, or
+              the client-side seconds.
+            - prompt_tokens (int): Tokens in the prompt.
+            - completion_tokens (int): Tokens generated.
+            - _wall_s (float): The client-side seconds.
+            - _cached (bool): Whether the response came from the cache.
+    """
+    import A_GIS.Code.make_struct
+
+    if hasattr(response, "model_dump"):
+        response = response.model_dump()
+
+    def seconds(name):
+        value = response.get(name)
+        return None if value is None else value / 1e9
+
+    load_s = seconds("load_duration")
+    prompt_eval_s = seconds("prompt_eval_duration")
+    eval_s = seconds("eval_duration")
+    total_s = seconds("total_duration")
+    prompt_tokens = response.get("prompt_eval_count")
+    completion_tokens = response.get("eval_count")
+
+    usage = response.get("usage") or {}
+    if hasattr(usage, "model_dump"):
+        usage = usage.model_dump()
+    if prompt_tokens is None:
+        prompt_tokens = usage.get("prompt_tokens")
+    if completion_tokens is None:
+        completion_tokens = usage.get("completion_tokens")
+
+    time_to_first_token_s = first_token_s
+    if time_to_first_token_s is None and prompt_eval_s is not None:
+        time_to_first_token_s = (load_s or 0) + prompt_eval_s
+
+    if eval_s is None and not cached:
+        # Estimate the generation time from the client side.
+        eval_s = wall_s - (first_token_s or 0)
+    tokens_per_s = None
+    if completion_tokens and eval_s:
+        tokens_per_s = completion_tokens / eval_s
+
+    return A_GIS.Code.make_struct(
+        time_to_first_token_s=time_to_first_token_s,
+        load_s=load_s,
+        prompt_eval_s=prompt_eval_s,
+        eval_s=eval_s,
+        tokens_per_s=tokens_per_s,
+        total_s=wall_s if total_s is None else total_s,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        _wall_s=wall_s,
+        _cached=cached,
+    )
@@ -0,0 +1,50 @@
+import A_GIS.Ai.Chatbot._get_metrics
+import pytest
+
+
+def test_ollama():
+    response = {
+        "message": {"role": "assistant", "content": "hi"},
+        "load_duration": 500_000_000,
+        "prompt_eval_duration": 250_000_000,
+        "prompt_eval_count": 20,
+        "eval_duration": 2_000_000_000,
+        "eval_count": 50,
+        "total_duration": 3_000_000_000,
+    }
+    metrics = A_GIS.Ai.Chatbot._get_metrics(response=response, wall_s=3.1)
+    assert metrics.time_to_first_token_s == pytest.approx(0.75)
+    assert metrics.load_s == pytest.approx(0.5)
+    assert metrics.prompt_eval_s == pytest.approx(0.25)
+    assert metrics.tokens_per_s == pytest.approx(25.0)
+    assert metrics.total_s == pytest.approx(3.0)
+    assert metrics.prompt_tokens == 20
+    assert metrics.completion_tokens == 50
+
+    # A streamed response reports the measured time to first token.
+    metrics = A_GIS.Ai.Chatbot._get_metrics(
+        response=response, wall_s=3.1, first_token_s=0.9
+    )
+    assert metrics.time_to_first_token_s == pytest.approx(0.9)
+
+
+def test_openai():
+    response = {
+        "message": {"content": "hi"},
+        "usage": {"prompt_tokens": 10, "completion_tokens": 40},
+    }
+    metrics = A_GIS.Ai.Chatbot._get_metrics(
+        response=response, wall_s=2.5, first_token_s=0.5
+    )
+    assert metrics.time_to_first_token_s == pytest.approx(0.5)
+    assert metrics.prompt_eval_s is None
+    assert metrics.tokens_per_s == pytest.approx(20.0)
+    assert metrics.total_s == pytest.approx(2.5)
+    assert metrics.completion_tokens == 40
+
+    # Cached responses have no generation time.
+    metrics = A_GIS.Ai.Chatbot._get_metrics(
+        response=response, wall_s=0.01, cached=True
+    )
+    assert metrics.tokens_per_s is None
+    assert metrics._cached
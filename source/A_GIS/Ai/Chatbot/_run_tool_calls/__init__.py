@@ -0,0 +1,106 @@
+def _run_tool_calls(
+    *,
+    tool_calls: list,
+    max_workers: int = 4,
+    timeout: float = 60.0,
+    max_chars: int = 20000,
+):
+    """Run the tool calls of one chatbot message concurrently.
+
+    Each call names an A_GIS function, which is resolved with
+    `A_GIS.resolve_function` and called with the given arguments on a
+    bounded thread pool, in the context of the caller so tracked calls nest
+    under the current span. The `__dict__` of each result is serialized to
+    JSON and cut to `max_chars` characters so a large result can not flood
+    the context window. A call that raises or takes longer than `timeout`
+    seconds becomes an error message for the model instead.
+
+    Args:
+        tool_calls (list):
+            The `tool_calls` of a chatbot message, each with a `function`
+            holding its `name` and `arguments`.
+        max_workers (int, optional):
+            The most tools run at the same time. Defaults to 4.
+        timeout (float, optional):
+            Seconds to wait for each tool. Defaults to 60.0.
+        max_chars (int, optional):
+            The most characters of a tool result sent back to the model.
+            Defaults to 20000.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - messages (list[dict]): The "tool" messages with the results,
+              in the order of the calls.
+            - metrics (list[dict]): For each call, the function `name`, the
+              `wall_s` seconds it took, the `chars` of its result before
+              the cut and the `error`, or "" if it succeeded.
+    """
+    import A_GIS.Code.make_struct
+    import A_GIS.resolve_function
+    import concurrent.futures
+    import contextvars
+    import json
+    import time
+
+    def run(fn_name, fn_args):
+        start = time.perf_counter()
+        try:
+            result = A_GIS.resolve_function(func_path=fn_name)(**fn_args)
+            text = json.dumps(result.__dict__, default=repr)
+            error = ""
+        except Exception as e:
+            text = ""
+            error = str(e)
+        return text, time.perf_counter() - start, error
+
+    calls = []
+    for tool_call in tool_calls:
+        if fn_call := tool_call.get("function"):
+            calls.append((fn_call["name"], fn_call["arguments"]))
+
+    messages = []
+    metrics = []
+    pool = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="A_GIS_TOOL"
+    )
+    try:
+        futures = [
+            pool.submit(contextvars.copy_context().run, run, *call)
+            for call in calls
+        ]
+        for (fn_name, fn_args), future in zip(calls, futures):
+            try:
+                fn_res, wall_s, error = future.result(timeout=timeout)
+            except concurrent.futures.TimeoutError:
+                fn_res, wall_s = "", timeout
+                error = f"timed out after {timeout} seconds"
+            chars = len(fn_res)
+            if error:
+                fn_res = (
+                    f"Error executing function {fn_name} with arguments "
+                    f"{fn_args}: {error}"
+                )
+            elif chars > max_chars:
+                fn_res = (
+                    fn_res[:max_chars]
+                    + f"... [truncated {chars - max_chars} characters]"
+                )
+
+            messages.append(
+                {"role": "tool", "name": fn_name, "content": fn_res}
+            )
+            metrics.append(
+                {
+                    "name": fn_name,
+                    "wall_s": wall_s,
+                    "chars": chars,
+                    "error": error,
+                }
+            )
+    finally:
+        # Do not wait for tools that timed out.
+        pool.shutdown(wait=False)
+
+    return A_GIS.Code.make_struct(messages=messages, metrics=metrics)
@@ -0,0 +1,71 @@
+import A_GIS.Ai.Chatbot._run_tool_calls
+import A_GIS.Code.make_struct
+import json
+import threading
+import time
+
+# Tools must be importable by name, so they live in this module.
+barrier = threading.Barrier(3, timeout=5)
+
+
+def wait(*, name: str):
+    barrier.wait()
+    return A_GIS.Code.make_struct(name=name)
+
+
+def sleep(*, seconds: float):
+    time.sleep(seconds)
+    return A_GIS.Code.make_struct(seconds=seconds)
+
+
+def large(*, size: int):
+    return A_GIS.Code.make_struct(text="x" * size)
+
+
+def fail():
+    raise RuntimeError("broken tool")
+
+
+def get_calls(*calls):
+    return [
+        {"function": {"name": f"{__name__}.{name}", "arguments": arguments}}
+        for name, arguments in calls
+    ]
+
+
+def test_concurrent():
+    # All three calls must run at once to pass the barrier.
+    barrier.reset()
+    result = A_GIS.Ai.Chatbot._run_tool_calls(
+        tool_calls=get_calls(*[("wait", {"name": str(i)}) for i in range(3)]),
+        max_workers=3,
+        timeout=10,
+    )
+    assert [json.loads(x["content"])["name"] for x in result.messages] == [
+        "0",
+        "1",
+        "2",
+    ]
+    assert all(x["role"] == "tool" for x in result.messages)
+    assert all(x["error"] == "" for x in result.metrics)
+
+
+def test_errors_and_limits():
+    result = A_GIS.Ai.Chatbot._run_tool_calls(
+        tool_calls=get_calls(
+            ("large", {"size": 1000}),
+            ("fail", {}),
+            ("sleep", {"seconds": 2.0}),
+            ("missing", {}),
+        ),
+        timeout=0.5,
+        max_chars=100,
+    )
+    large, fail, sleep, missing = result.messages
+    assert large["content"].endswith("[truncated 912 characters]")
+    assert result.metrics[0]["chars"] == 1012
+    assert fail["content"].endswith("broken tool")
+    assert result.metrics[1]["error"] == "broken tool"
+    assert "timed out" in sleep["content"]
+    assert result.metrics[2]["wall_s"] == 0.5
+    assert missing["content"].startswith("Error executing function")
@@ -2,13 +2,21 @@ import A_GIS.Log.track_function
 
 @A_GIS.Log.track_function
 def _send_chat_groq(
-    *, model: str, messages: list[dict], __tracking_hash=None, **kwargs
+    *,
+    model: str,
+    messages: list[dict],
+    stream=None,
+    http_base_url=None,
+    __tracking_hash=None,
+    **kwargs,
 ):
-    import groq
-    import os
-
-    api_key = os.environ.get("GROQ_API_KEY")
-    client = groq.Groq(api_key=api_key)
+    import A_GIS.Ai.Chatbot.Cache.get_key
+    import A_GIS.Ai.Chatbot.Cache.lookup
+    import A_GIS.Ai.Chatbot.Cache.store
+    import A_GIS.Ai.Chatbot._create_completion
+    import A_GIS.Ai.Chatbot._get_client
+    import A_GIS.Ai.Chatbot._get_metrics
+    import time
 
     available_models = ["llama2-70b-4096", "mixtral-8x7b-32768", "gemma-7b-it"]
     groq_model = ""
@@ -20,13 +28,75 @@ def _send_chat_groq(
             f"Provided model={model} does not match any available models: {available_models}!"
         )
 
-    completion = client.chat.completions.create(
-        messages=messages,
+    # Answer from the response cache if it is enabled.
+    key = A_GIS.Ai.Chatbot.Cache.get_key(
+        provider="groq",
         model=groq_model,
-        temperature=kwargs["temperature"],
-        max_tokens=kwargs["num_ctx"] + kwargs["num_predict"],
+        messages=messages,
+        options={
+            "temperature": kwargs["temperature"],
+            "max_tokens": kwargs["num_ctx"] + kwargs["num_predict"],
+        },
     )
-    result = completion.__dict__
-    result["message"] = {"content": completion.choices[0].message.content}
+    start = time.perf_counter()
+    first_token_s = None
+    result = A_GIS.Ai.Chatbot.Cache.lookup(key=key)
+    cached = result is not None
+    if cached:
+        if stream is not None:
+            stream(result["message"]["content"])
+    else:
+        client = A_GIS.Ai.Chatbot._get_client(
+            provider="groq", http_base_url=http_base_url
+        )
+
+        if stream is None:
+            completion = A_GIS.Ai.Chatbot._create_completion(
+                client=client,
+                messages=messages,
+                model=groq_model,
+                temperature=kwargs["temperature"],
+                max_tokens=kwargs["num_ctx"] + kwargs["num_predict"],
+            )
+            result = completion.__dict__
+            result["message"] = {
+                "content": completion.choices[0].message.content
+            }
+            value = completion.model_dump()
+        else:
+            # Pass on the content as it arrives and assemble the message.
+            content = []
+            usage = None
+            for chunk in A_GIS.Ai.Chatbot._create_completion(
+                client=client,
+                messages=messages,
+                model=groq_model,
+                temperature=kwargs["temperature"],
+                max_tokens=kwargs["num_ctx"] + kwargs["num_predict"],
+                stream=True,
+            ):
+                # Groq reports the usage with the last chunk.
+                x_groq = getattr(chunk, "x_groq", None)
+                usage = getattr(x_groq, "usage", None) or usage
+                if chunk.choices and (piece := chunk.choices[0].delta.content):
+                    if first_token_s is None:
+                        first_token_s = time.perf_counter() - start
+                    content.append(piece)
+                    stream(piece)
+            value = chunk.model_dump()
+            value["usage"] = None if usage is None else usage.model_dump()
+            value["message"] = {"content": "".join(content)}
+            result = dict(value)
+        value["message"] = result["message"]
+        A_GIS.Ai.Chatbot.Cache.store(key=key, value=value)
+
+    result["metrics"] = [
+        A_GIS.Ai.Chatbot._get_metrics(
+            response=result,
+            wall_s=time.perf_counter() - start,
+            first_token_s=first_token_s,
+            cached=cached,
+        )
+    ]
 
     return result
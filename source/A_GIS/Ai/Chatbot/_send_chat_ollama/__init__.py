@@ -7,69 +7,156 @@ def _send_chat_ollama(
     messages: list[dict],
     tools=[],
     images=[],
+    stream=None,
+    http_base_url=None,
+    keep_alive=None,
+    tool_workers=4,
+    tool_timeout=60.0,
+    tool_max_chars=20000,
+    fit_context=None,
     __tracking_hash=None,
     **kwargs,
 ):
-    """Send chatbot chat request through ollama."""
+    """Send chatbot chat request through ollama.
+
+    With a `stream` callable, each piece of content is passed to it as it
+    arrives while the full message, including tool calls, is assembled for
+    the conversation. The result has one `metrics` entry from
+    `A_GIS.Ai.Chatbot._get_metrics` per request sent to the model.
+
+    The tool calls of each turn run concurrently through
+    `A_GIS.Ai.Chatbot._run_tool_calls`, on at most `tool_workers` threads,
+    waiting `tool_timeout` seconds for each and sending back at most
+    `tool_max_chars` characters of each result. Their latencies are in
+    `tool_metrics`. Before each request with tool results, `fit_context`
+    is called, if given, with the messages and returns them fitted into the
+    context window.
+
+    With `keep_alive`, e.g. "30m" or -1 for ever, the model stays loaded
+    that long after the request instead of the server's default. With
+    `http_base_url`, requests go to that server instead of the default one.
+    """
     import ollama
-    import json
-    import A_GIS.resolve_function
+    import time
     import A_GIS.Code.make_struct
+    import A_GIS.Ai.Chatbot.Cache.get_key
+    import A_GIS.Ai.Chatbot.Cache.lookup
+    import A_GIS.Ai.Chatbot.Cache.store
+    import A_GIS.Ai.Chatbot._get_client
+    import A_GIS.Ai.Chatbot._get_metrics
+    import A_GIS.Ai.Chatbot._run_tool_calls
     import A_GIS.Ai.Chatbot.get_info
     import A_GIS.Log.append
 
     format = kwargs.pop("format", None)
-
-    # First round chat. If tools would be used, then will go to second round.
-    response = ollama.chat(
-        model=model,
-        messages=messages,
-        tools=tools,
-        format=format,
-        options=ollama.Options(**kwargs),
+    client = A_GIS.Ai.Chatbot._get_client(
+        provider="ollama", http_base_url=http_base_url
     )
-    messages.append(response["message"])
-    A_GIS.Log.append(response)
+    metrics = []
+    tool_metrics = []
 
-    # Handle tool interaction.
-    if A_GIS.Ai.Chatbot.get_info(model=model).has_tools:
-        while tool_calls := messages[-1].get("tool_calls", None):
-            for tool_call in tool_calls:
-                if fn_call := tool_call.get("function"):
-                    # Put together tool call.
-                    fn_name: str = fn_call["name"]
-                    fn_args: dict = fn_call["arguments"]
-
-                    # We only support A_GIS functions which return something
-                    # which converts to a dict.
-                    try:
-                        fn_res: str = json.dumps(
-                            A_GIS.resolve_function(func_path=fn_name)(
-                                **fn_args
-                            ).__dict__
-                        )
-                    except BaseException as e:
-                        fn_res = f"Error executing function {fn_name} with arguments {fn_args}: {e}"
-
-                    # Add the tool call result to the messages.
-                    messages.append(
-                        {
-                            "role": "tool",
-                            "name": fn_name,
-                            "content": fn_res,
-                        }
-                    )
+    def to_dict(value):
+        if hasattr(value, "model_dump"):
+            return value.model_dump(exclude_none=True)
+        return dict(value)
 
-            # Second round chat, now with the results of the tools.
-            response = ollama.chat(
+    def send():
+        # Answer from the response cache if it is enabled.
+        key = A_GIS.Ai.Chatbot.Cache.get_key(
+            provider="ollama",
+            model=model,
+            messages=messages,
+            tools=tools,
+            format=format,
+            options=kwargs,
+        )
+        start = time.perf_counter()
+        first_token_s = None
+        response = A_GIS.Ai.Chatbot.Cache.lookup(key=key)
+        cached = response is not None
+        if cached:
+            if stream is not None:
+                stream(response["message"]["content"])
+        elif stream is None:
+            response = client.chat(
                 model=model,
                 messages=messages,
                 tools=tools,
                 format=format,
                 options=ollama.Options(**kwargs),
+                keep_alive=keep_alive,
             )
+        else:
+            # Pass on the content as it arrives and assemble the message.
+            content = []
+            tool_calls = []
+            for chunk in client.chat(
+                model=model,
+                messages=messages,
+                tools=tools,
+                format=format,
+                options=ollama.Options(**kwargs),
+                keep_alive=keep_alive,
+                stream=True,
+            ):
+                if piece := chunk["message"]["content"]:
+                    if first_token_s is None:
+                        first_token_s = time.perf_counter() - start
+                    content.append(piece)
+                    stream(piece)
+                tool_calls.extend(chunk["message"].get("tool_calls") or [])
+            response = to_dict(chunk)
+            response["message"] = {
+                "role": "assistant",
+                "content": "".join(content),
+            }
+            if tool_calls:
+                response["message"]["tool_calls"] = [
+                    to_dict(x) for x in tool_calls
+                ]
+        wall_s = time.perf_counter() - start
+        if not cached:
+            A_GIS.Ai.Chatbot.Cache.store(key=key, value=to_dict(response))
+        metrics.append(
+            A_GIS.Ai.Chatbot._get_metrics(
+                response=response,
+                wall_s=wall_s,
+                first_token_s=first_token_s,
+                cached=cached,
+            )
+        )
+        return response
+
+    # First round chat. If tools would be used, then will go to second round.
+    response = send()
+    messages.append(response["message"])
+    A_GIS.Log.append(response)
+
+    # Handle tool interaction.
+    info = A_GIS.Ai.Chatbot.get_info(model=model, http_base_url=http_base_url)
+    if info.has_tools:
+        while tool_calls := messages[-1].get("tool_calls", None):
+            # Run the tools of this turn concurrently.
+            tool_result = A_GIS.Ai.Chatbot._run_tool_calls(
+                tool_calls=tool_calls,
+                max_workers=tool_workers,
+                timeout=tool_timeout,
+                max_chars=tool_max_chars,
+            )
+            messages.extend(tool_result.messages)
+            tool_metrics.extend(tool_result.metrics)
+
+            # Second round chat, now with the results of the tools.
+            if fit_context is not None:
+                messages = fit_context(messages=messages)
+            response = send()
             messages.append(response["message"])
             A_GIS.Log.append(response)
 
     # Return a results struct.
-    return A_GIS.Code.make_struct(messages=messages, response=response)
+    return A_GIS.Code.make_struct(
+        messages=messages,
+        response=response,
+        metrics=metrics,
+        tool_metrics=tool_metrics,
+    )
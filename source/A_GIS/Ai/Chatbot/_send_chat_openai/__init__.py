@@ -2,13 +2,21 @@ import A_GIS.Log.track_function
 
 @A_GIS.Log.track_function
 def _send_chat_openai(
-    *, model: str, messages: list[dict], __tracking_hash=None, **kwargs
+    *,
+    model: str,
+    messages: list[dict],
+    stream=None,
+    http_base_url=None,
+    __tracking_hash=None,
+    **kwargs,
 ):
-    import openai
-    import os
-
-    api_key = os.environ.get("OPENAI_API_KEY")
-    client = openai.OpenAI(api_key=api_key)
+    import A_GIS.Ai.Chatbot.Cache.get_key
+    import A_GIS.Ai.Chatbot.Cache.lookup
+    import A_GIS.Ai.Chatbot.Cache.store
+    import A_GIS.Ai.Chatbot._create_completion
+    import A_GIS.Ai.Chatbot._get_client
+    import A_GIS.Ai.Chatbot._get_metrics
+    import time
 
     available_models = ["gpt-4o", "gpt-4o-mini"]
     openai_model = ""
@@ -23,13 +31,75 @@ def _send_chat_openai(
     max_tokens = kwargs["num_ctx"] + kwargs["num_predict"]
     if max_tokens > 4096:
         max_tokens = 4096
-    completion = client.chat.completions.create(
-        messages=messages,
+
+    # Answer from the response cache if it is enabled.
+    key = A_GIS.Ai.Chatbot.Cache.get_key(
+        provider="openai",
         model=openai_model,
-        temperature=kwargs["temperature"],
-        max_tokens=max_tokens,
+        messages=messages,
+        options={
+            "temperature": kwargs["temperature"],
+            "max_tokens": max_tokens,
+        },
     )
-    result = completion.__dict__
-    result["message"] = {"content": completion.choices[0].message.content}
+    start = time.perf_counter()
+    first_token_s = None
+    result = A_GIS.Ai.Chatbot.Cache.lookup(key=key)
+    cached = result is not None
+    if cached:
+        if stream is not None:
+            stream(result["message"]["content"])
+    else:
+        client = A_GIS.Ai.Chatbot._get_client(
+            provider="openai", http_base_url=http_base_url
+        )
+
+        if stream is None:
+            completion = A_GIS.Ai.Chatbot._create_completion(
+                client=client,
+                messages=messages,
+                model=openai_model,
+                temperature=kwargs["temperature"],
+                max_tokens=max_tokens,
+            )
+            result = completion.__dict__
+            result["message"] = {
+                "content": completion.choices[0].message.content
+            }
+            value = completion.model_dump()
+        else:
+            # Pass on the content as it arrives and assemble the message.
+            content = []
+            usage = None
+            for chunk in A_GIS.Ai.Chatbot._create_completion(
+                client=client,
+                messages=messages,
+                model=openai_model,
+                temperature=kwargs["temperature"],
+                max_tokens=max_tokens,
+                stream=True,
+                stream_options={"include_usage": True},
+            ):
+                usage = getattr(chunk, "usage", None) or usage
+                if chunk.choices and (piece := chunk.choices[0].delta.content):
+                    if first_token_s is None:
+                        first_token_s = time.perf_counter() - start
+                    content.append(piece)
+                    stream(piece)
+            value = chunk.model_dump()
+            value["usage"] = None if usage is None else usage.model_dump()
+            value["message"] = {"content": "".join(content)}
+            result = dict(value)
+        value["message"] = result["message"]
+        A_GIS.Ai.Chatbot.Cache.store(key=key, value=value)
+
+    result["metrics"] = [
+        A_GIS.Ai.Chatbot._get_metrics(
+            response=result,
+            wall_s=time.perf_counter() - start,
+            first_token_s=first_token_s,
+            cached=cached,
+        )
+    ]
 
     return result
@@ -0,0 +1,114 @@
+import A_GIS.Log.track_function
+
+@A_GIS.Log.track_function
+def _send_chat_replay(
+    *,
+    model: str,
+    messages: list[dict],
+    tools=[],
+    images=[],
+    stream=None,
+    tool_workers=4,
+    tool_timeout=60.0,
+    tool_max_chars=20000,
+    fit_context=None,
+    __tracking_hash=None,
+    **kwargs,
+):
+    """Send chatbot chat request to the replay provider.
+
+    The responses come from `A_GIS.Ai.Chatbot.Replay.get_response` after
+    the synthetic latency and token rate set with
+    `A_GIS.Ai.Chatbot.Replay.configure`, and carry ollama-style timings and
+    token counts, so `A_GIS.Ai.Chatbot._get_metrics` works as for a real
+    server. Tool calls in a response are run like the ollama provider does,
+    including the `fit_context` before each follow-up request, and a stream
+    receives the content word by word.
+    """
+    import A_GIS.Ai.Chatbot.Context.count_tokens
+    import A_GIS.Ai.Chatbot.Replay._Replay
+    import A_GIS.Ai.Chatbot.Replay.get_response
+    import A_GIS.Ai.Chatbot._get_metrics
+    import A_GIS.Ai.Chatbot._run_tool_calls
+    import A_GIS.Code.make_struct
+    import A_GIS.Log.append
+    import re
+    import time
+
+    replay = A_GIS.Ai.Chatbot.Replay._Replay
+    replay()
+    metrics = []
+    tool_metrics = []
+
+    def send():
+        start = time.perf_counter()
+        message = A_GIS.Ai.Chatbot.Replay.get_response(
+            messages=messages, model=model
+        )
+        prompt_tokens = sum(
+            A_GIS.Ai.Chatbot.Context.count_tokens(message=x) for x in messages
+        )
+        content = message["content"]
+        eval_count = A_GIS.Ai.Chatbot.Context.count_tokens(message=content)
+
+        # Wait for the first token, then generate at the token rate.
+        time.sleep(replay.latency_s)
+        first_token_s = time.perf_counter() - start
+        pieces = re.findall(r"\s*\S+", content) or [content]
+        delay = 0.0
+        if replay.tokens_per_s > 0:
+            delay = eval_count / replay.tokens_per_s / len(pieces)
+        for piece in pieces:
+            if stream is not None and piece:
+                stream(piece)
+            time.sleep(delay)
+        wall_s = time.perf_counter() - start
+
+        response = {
+            "model": model,
+            "message": message,
+            "done": True,
+            "load_duration": 0,
+            "prompt_eval_count": prompt_tokens,
+            "prompt_eval_duration": int(first_token_s * 1e9),
+            "eval_count": eval_count,
+            "eval_duration": int((wall_s - first_token_s) * 1e9),
+            "total_duration": int(wall_s * 1e9),
+        }
+        metrics.append(
+            A_GIS.Ai.Chatbot._get_metrics(
+                response=response,
+                wall_s=wall_s,
+                first_token_s=first_token_s if stream is not None else None,
+            )
+        )
+        return response
+
+    response = send()
+    messages.append(response["message"])
+    A_GIS.Log.append(response)
+
+    # Handle tool interaction.
+    while tool_calls := messages[-1].get("tool_calls", None):
+        tool_result = A_GIS.Ai.Chatbot._run_tool_calls(
+            tool_calls=tool_calls,
+            max_workers=tool_workers,
+            timeout=tool_timeout,
+            max_chars=tool_max_chars,
+        )
+        messages.extend(tool_result.messages)
+        tool_metrics.extend(tool_result.metrics)
+
+        if fit_context is not None:
+            messages = fit_context(messages=messages)
+        response = send()
+        messages.append(response["message"])
+        A_GIS.Log.append(response)
+
+    # Return a results struct.
+    return A_GIS.Code.make_struct(
+        messages=messages,
+        response=response,
+        metrics=metrics,
+        tool_metrics=tool_metrics,
+    )
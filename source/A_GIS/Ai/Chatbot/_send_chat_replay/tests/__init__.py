@@ -0,0 +1,127 @@
+import A_GIS.Ai.Chatbot.Replay._Replay
+import A_GIS.Ai.Chatbot.Replay.configure
+import A_GIS.Ai.Chatbot.chat
+import A_GIS.Ai.Chatbot.init
+import A_GIS.Code.make_struct
+import A_GIS.Log.append
+import json
+import pytest
+
+
+def add(*, a: int, b: int):
+    return A_GIS.Code.make_struct(sum=a + b)
+
+
+@pytest.fixture
+def replay(monkeypatch):
+    records = []
+    monkeypatch.setattr(
+        A_GIS.Log, "append", lambda *args, **kwargs: records.append(args)
+    )
+    A_GIS.Ai.Chatbot.Replay._Replay()
+    for name in ("script", "transcript", "latency_s", "tokens_per_s"):
+        monkeypatch.setattr(
+            A_GIS.Ai.Chatbot.Replay._Replay,
+            name,
+            getattr(A_GIS.Ai.Chatbot.Replay._Replay, name),
+        )
+    return records
+
+
+def test_echo(replay):
+    A_GIS.Ai.Chatbot.Replay._Replay.script = None
+    A_GIS.Ai.Chatbot.Replay._Replay.transcript = None
+    chatbot = A_GIS.Ai.Chatbot.init(provider="replay", model="any")
+    result = A_GIS.Ai.Chatbot.chat(chatbot=chatbot, message="hello")
+    assert result.response["message"]["content"] == "hello"
+
+
+def test_transcript(replay, tmp_path):
+    path = tmp_path / "transcript.jsonl"
+    path.write_text(
+        json.dumps("first answer")
+        + "\n"
+        + json.dumps({"message": {"role": "assistant", "content": "second"}})
+    )
+    A_GIS.Ai.Chatbot.Replay.configure(
+        transcript=path, latency_s=0.01, tokens_per_s=1000
+    )
+    chatbot = A_GIS.Ai.Chatbot.init(provider="replay", model="any")
+    pieces = []
+    result = A_GIS.Ai.Chatbot.chat(
+        chatbot=chatbot, message="one", stream=pieces.append
+    )
+    assert result.response["message"]["content"] == "first answer"
+    assert pieces == ["first", " answer"]
+    metrics = result.metrics[0]
+    assert metrics.time_to_first_token_s >= 0.01
+    assert metrics.completion_tokens == 3
+    assert metrics.prompt_tokens > 0
+
+    result = A_GIS.Ai.Chatbot.chat(chatbot=result.chatbot, message="two")
+    assert result.response["message"]["content"] == "second"
+    assert len(result.chatbot.messages) == 5
+
+
+def test_script_with_tools(replay):
+    def script(*, messages, model):
+        if messages[-1]["role"] == "tool":
+            sums = [json.loads(x["content"])["sum"] for x in messages[-2:]]
+            return f"The sums are {sums}."
+        return {
+            "tool_calls": [
+                {"function": {"name": f"{__name__}.add", "arguments": args}}
+                for args in ({"a": 1, "b": 2}, {"a": 3, "b": 4})
+            ],
+        }
+
+    A_GIS.Ai.Chatbot.Replay.configure(
+        script=script, latency_s=0, tokens_per_s=0
+    )
+    chatbot = A_GIS.Ai.Chatbot.init(provider="replay", model="any")
+    result = A_GIS.Ai.Chatbot.chat(chatbot=chatbot, message="add")
+    assert result.response["message"]["content"] == "The sums are [3, 7]."
+    assert len(result.metrics) == 2
+    assert len([x for x in replay if x]) == 2
+    assert [x["error"] for x in result.tool_metrics] == ["", ""]
+
+
+def big(*, n: int):
+    return A_GIS.Code.make_struct(text="x" * n)
+
+
+def test_tool_results_are_fitted_before_the_follow_up(replay):
+    seen = []
+
+    def script(*, messages, model):
+        if messages[-1]["role"] == "tool":
+            seen.append([len(x["content"]) for x in messages[-2:]])
+            return "Done."
+        return {
+            "tool_calls": [
+                {"function": {"name": f"{__name__}.big", "arguments": args}}
+                for args in ({"n": 6000}, {"n": 6000})
+            ],
+        }
+
+    A_GIS.Ai.Chatbot.Replay.configure(
+        script=script, latency_s=0, tokens_per_s=0
+    )
+    chatbot = A_GIS.Ai.Chatbot.init(
+        provider="replay",
+        model="any",
+        num_ctx=2000,
+        num_predict=100,
+        context_policy="elide",
+    )
+    result = A_GIS.Ai.Chatbot.chat(chatbot=chatbot, message="read")
+    assert result.response["message"]["content"] == "Done."
+    assert all(length < 2100 for length in seen[0])
+    assert [x["role"] for x in result.chatbot.messages] == [
+        "system",
+        "user",
+        "assistant",
+        "tool",
+        "tool",
+        "assistant",
+    ]
@@ -3,6 +3,7 @@ def chat(
     chatbot: type["A_GIS.Ai.Chatbot._Chatbot"],
     message: str,
     images=[],
+    stream=None,
     **kwargs,
 ):
     """Start a conversation with an AI chatbot.
@@ -23,6 +24,11 @@ def chat(
         images (list(str), optional):
             A list of image file paths or URLs to be sent alongside the
             message. If an empty list, no images are sent.
+        stream (callable, optional):
+            Called with each piece of the response content as it arrives,
+            e.g. `functools.partial(print, end="", flush=True)`. The full
+            response is still returned. Defaults to None, which waits for
+            the full response.
         **kwargs (dict, optional):
             Additional keyword arguments that may be accepted by the
             chatbot for processing.
@@ -40,16 +46,22 @@ def chat(
               any tools invoked by the chatbot as part of processing
               the message or images. This will be `None` if no tools
               were used.
+            - metrics (list): The latency metrics of each request sent to
+              the model, with time to first token, tokens per second,
+              prompt evaluation time and total latency, from
+              `A_GIS.Ai.Chatbot._get_metrics`.
     """
-    import copy
-
-    # Return the response of the chat. Note that the chatbot's messages sent
-    # as an argument are modified.
+    # Return the response of the chat from a fork of the chatbot, which
+    # shares the message history without copying it, so the chatbot sent as
+    # an argument is not modified.
     # _send_chat implementation must return a dataclass with
     #   - messages: list of messages at exit
     #   - response: response to chat
     #   - tool_response: response to tool request (or None if no tools)
-    chatbot2 = copy.deepcopy(chatbot)
-    response = chatbot2.chat(message=message, images=images, **kwargs)
+    #   - metrics: latency metrics of each request
+    chatbot2 = chatbot.fork()
+    response = chatbot2.chat(
+        message=message, images=images, stream=stream, **kwargs
+    )
     response.chatbot = chatbot2
     return response
@@ -0,0 +1,56 @@
+def chat_many(
+    *,
+    chatbot: type["A_GIS.Ai.Chatbot._Chatbot"],
+    messages: list[str],
+    images: list[list[str]] = [],
+    max_in_flight: int = 4,
+    timeout: float = None,
+    **kwargs,
+):
+    """Send independent chats to an AI chatbot concurrently.
+
+    This is the blocking form of `A_GIS.Ai.Chatbot.chat_many_async`, for
+    callers that would otherwise loop over `A_GIS.Ai.Chatbot.chat`. It can
+    not be called from a running event loop, where the coroutine should be
+    awaited instead.
+
+    Args:
+        chatbot (A_GIS.Ai.Chatbot._Chatbot):
+            The chatbot whose state every conversation starts from.
+        messages (list[str]):
+            The first message of each conversation.
+        images (list[list[str]], optional):
+            The images sent with each message, in the same order. Defaults
+            to [], which sends no images.
+        max_in_flight (int, optional):
+            The most requests sent at the same time. Defaults to 4.
+        timeout (float, optional):
+            Seconds after which a request is given up. Defaults to None,
+            which waits for every request.
+        **kwargs (dict, optional):
+            Additional keyword arguments passed to every chat.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - results (list): The result of `A_GIS.Ai.Chatbot.chat` for
+              each message in input order, or None if it failed.
+            - errors (list[str]): The error of each message in input
+              order, or "" if it succeeded.
+            - _max_in_flight (int): The concurrency limit used.
+            - _timeout (float): The timeout used.
+    """
+    import A_GIS.Ai.Chatbot.chat_many_async
+    import asyncio
+
+    return asyncio.run(
+        A_GIS.Ai.Chatbot.chat_many_async(
+            chatbot=chatbot,
+            messages=messages,
+            images=images,
+            max_in_flight=max_in_flight,
+            timeout=timeout,
+            **kwargs,
+        )
+    )
@@ -0,0 +1,88 @@
+import A_GIS.Ai.Chatbot._Chatbot
+import A_GIS.Ai.Chatbot.chat_many
+import A_GIS.Code.make_struct
+import threading
+import time
+
+
+class FakeSend:
+    """Answer with the reversed message after the given delay."""
+
+    def __init__(self, delays={}):
+        self.delays = delays
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def __call__(self, *, model, messages, tools, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        content = messages[-1]["content"]
+        time.sleep(self.delays.get(content, 0.05))
+        with self.lock:
+            self.active -= 1
+        if content == "fail":
+            raise RuntimeError("server error")
+        messages.append({"role": "assistant", "content": content[::-1]})
+        return A_GIS.Code.make_struct(
+            messages=messages, response={"message": messages[-1]}
+        )
+
+
+def get_chatbot(send):
+    return A_GIS.Ai.Chatbot._Chatbot(
+        model="fake",
+        mirostat=0,
+        num_predict=10,
+        num_ctx=10,
+        temperature=0.0,
+        provider="ollama",
+        system="Be brief.",
+        _send_chat=send,
+        messages=[],
+        tool_names=[],
+        tools=[],
+    )
+
+
+def test_order_and_limit():
+    send = FakeSend(delays={"abc": 0.2})
+    chatbot = get_chatbot(send)
+    messages = ["abc", "de", "f", "gh", "ij", "kl"]
+    result = A_GIS.Ai.Chatbot.chat_many(
+        chatbot=chatbot, messages=messages, max_in_flight=3
+    )
+    assert result.errors == [""] * len(messages)
+    assert [x.response["message"]["content"] for x in result.results] == [
+        m[::-1] for m in messages
+    ]
+    assert 1 < send.max_active <= 3
+
+    # Every conversation starts from the unchanged chatbot.
+    assert len(chatbot.messages) == 1
+    assert all(len(x.chatbot.messages) == 3 for x in result.results)
+
+
+def test_errors_and_timeout():
+    send = FakeSend(delays={"slow": 1.0})
+    chatbot = get_chatbot(send)
+    result = chatbot.chat_many(
+        messages=["ok", "fail", "slow"], max_in_flight=3, timeout=0.5
+    )
+    assert result.results[0].response["message"]["content"] == "ko"
+    assert result.results[1] is None
+    assert result.errors[1] == "RuntimeError: server error"
+    assert result.results[2] is None
+    assert result.errors[2].startswith("Timed out")
+
+
+def test_timed_out_request_keeps_its_slot():
+    send = FakeSend(delays={"slow": 0.5})
+    chatbot = get_chatbot(send)
+    result = chatbot.chat_many(
+        messages=["slow", "a", "b", "c"], max_in_flight=2, timeout=0.1
+    )
+    assert result.errors[0].startswith("Timed out")
+    assert result.errors[1:] == [""] * 3
+    assert send.max_active == 2
@@ -0,0 +1,116 @@
+async def chat_many_async(
+    *,
+    chatbot: type["A_GIS.Ai.Chatbot._Chatbot"],
+    messages: list[str],
+    images: list[list[str]] = [],
+    max_in_flight: int = 4,
+    timeout: float = None,
+    **kwargs,
+):
+    """Send independent chats to an AI chatbot concurrently.
+
+    Every message starts its own conversation from the current state of the
+    chatbot, exactly like `A_GIS.Ai.Chatbot.chat`, so the chatbot itself is
+    not modified. At most `max_in_flight` requests are sent at once, each on
+    a worker thread of its own so a local or remote model server always has
+    work queued. A request that takes longer than `timeout` seconds is
+    reported as an error instead of a result; the provider call itself can
+    not be interrupted, so it still finishes in the background and keeps
+    its slot until then.
+
+    Args:
+        chatbot (A_GIS.Ai.Chatbot._Chatbot):
+            The chatbot whose state every conversation starts from.
+        messages (list[str]):
+            The first message of each conversation.
+        images (list[list[str]], optional):
+            The images sent with each message, in the same order. Defaults
+            to [], which sends no images.
+        max_in_flight (int, optional):
+            The most requests sent at the same time. Defaults to 4.
+        timeout (float, optional):
+            Seconds after which a request is given up. Defaults to None,
+            which waits for every request.
+        **kwargs (dict, optional):
+            Additional keyword arguments passed to every chat.
+
+    Raises:
+        ValueError: If `max_in_flight` is below one or `images` does not
+            match `messages`.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - results (list): The result of `A_GIS.Ai.Chatbot.chat` for
+              each message in input order, or None if it failed.
+            - errors (list[str]): The error of each message in input
+              order, or "" if it succeeded.
+            - _max_in_flight (int): The concurrency limit used.
+            - _timeout (float): The timeout used.
+    """
+    import A_GIS.Ai.Chatbot.chat
+    import A_GIS.Code.make_struct
+    import asyncio
+    import concurrent.futures
+    import functools
+
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight={max_in_flight} must be at least 1!")
+    if len(images) not in (0, len(messages)):
+        raise ValueError(
+            f"Got {len(images)} image lists for {len(messages)} messages!"
+        )
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_in_flight)
+    results = [None] * len(messages)
+    errors = [""] * len(messages)
+
+    def release(future):
+        try:
+            loop.call_soon_threadsafe(semaphore.release)
+        except RuntimeError:
+            # The loop closed after giving up on this request.
+            pass
+
+    async def send(executor, i):
+        call = functools.partial(
+            A_GIS.Ai.Chatbot.chat,
+            chatbot=chatbot,
+            message=messages[i],
+            images=images[i] if images else [],
+            **kwargs,
+        )
+        await semaphore.acquire()
+        future = executor.submit(call)
+        # The slot is freed when the worker finishes, not when the wait
+        # times out, so a slow request still counts against the limit and
+        # the timeout of the next one only starts once a worker is free.
+        future.add_done_callback(release)
+        try:
+            results[i] = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)), timeout
+            )
+        except asyncio.TimeoutError:
+            errors[i] = f"Timed out after {timeout} seconds."
+        except Exception as e:
+            errors[i] = f"{type(e).__name__}: {e}"
+
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_in_flight, thread_name_prefix="A_GIS_CHAT"
+    )
+    try:
+        await asyncio.gather(
+            *(send(executor, i) for i in range(len(messages)))
+        )
+    finally:
+        # Do not wait for requests that timed out.
+        executor.shutdown(wait=False)
+
+    return A_GIS.Code.make_struct(
+        results=results,
+        errors=errors,
+        _max_in_flight=max_in_flight,
+        _timeout=timeout,
+    )
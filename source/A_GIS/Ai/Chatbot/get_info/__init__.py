@@ -1,4 +1,4 @@
-def get_info(*, model: str):
+def get_info(*, model: str, refresh: bool = False, http_base_url: str = None):
     """Retrieve information about a specified AI chatbot model.
 
     This function interacts with the OLLama API to fetch detailed
@@ -7,10 +7,21 @@ def get_info(*, model: str):
     related to the model's availability, configuration, and whether it
     includes tool integration features.
 
+    The information is resolved once per model and kept in
+    `A_GIS.Ai.Chatbot._Registry` until it expires, so repeated calls, such
+    as one per turn of a tool-using conversation, do not contact the
+    server.
+
     Args:
         model (str):
             The identifier for the AI chatbot model you want to retrieve
             information about.
+        refresh (bool, optional):
+            If True, ask the server again even if the information is
+            cached. Defaults to False.
+        http_base_url (str, optional):
+            The ollama server to ask. Defaults to None, which uses the
+            default server.
 
     Returns:
         A_GIS.Code.make_struct:
@@ -30,34 +41,59 @@ def get_info(*, model: str):
             - output_tag (str | None): An optional tag associated with
               the model's output, if available. Otherwise, None.
     """
-    import ollama
     import re
+    import time
     import A_GIS.Code.make_struct
+    import A_GIS.Ai.Chatbot._Registry
+    import A_GIS.Ai.Chatbot._get_client
     import A_GIS.Ai.Chatbot.list_models
 
-    context_length = None
-    has_tools = None
-    available_models = A_GIS.Ai.Chatbot.list_models()
-    available = model in available_models
-    output_tag = None
+    registry = A_GIS.Ai.Chatbot._Registry
+    registry()
+    available_models = A_GIS.Ai.Chatbot.list_models(
+        refresh=refresh, http_base_url=http_base_url
+    )
+
+    key = (http_base_url, model)
+    with registry.lock:
+        info = registry.info.get(key)
+    if refresh or info is None or not registry.is_fresh(info["resolved"]):
+        info = {
+            "available": model in available_models,
+            "context_length": None,
+            "has_tools": None,
+            "output_tag": None,
+            "resolved": None,
+        }
+
+        if info["available"]:
+            try:
+                client = A_GIS.Ai.Chatbot._get_client(
+                    provider="ollama", http_base_url=http_base_url
+                )
+                data = str(client.show(model=model)).replace("\n", " ")
+                pattern = r"context_length['\"]\s*:\s*(\d+),"
+                match = re.search(pattern, data)
+                if match:
+                    info["context_length"] = int(match.group(1))
+                info["has_tools"] = ".Tools" in data
+                info["resolved"] = time.monotonic()
 
-    if available:
-        try:
-            data = ollama.show(model=model)
-            pattern = r"context_length['\"]\s*:\s*(\d+),"
-            match = re.search(pattern, str(data).replace("\n", " "))
-            if match:
-                context_length = int(match.group(1))
-            has_tools = str(data).index(".Tools") >= 0
+            except BaseException:
+                pass
+        else:
+            info["resolved"] = time.monotonic()
 
-        except BaseException:
-            pass
+        # Failed lookups are retried on the next call.
+        if info["resolved"] is not None:
+            with registry.lock:
+                registry.info[key] = info
 
     return A_GIS.Code.make_struct(
         model=model,
-        available=available,
-        context_length=context_length,
-        has_tools=has_tools,
+        available=info["available"],
+        context_length=info["context_length"],
+        has_tools=info["has_tools"],
         available_models=available_models,
-        output_tag=output_tag,
+        output_tag=info["output_tag"],
     )
@@ -0,0 +1,109 @@
+import A_GIS.Ai.Chatbot._Clients
+import A_GIS.Ai.Chatbot.get_info
+import A_GIS.Ai.Chatbot.invalidate_info
+import A_GIS.Ai.Chatbot.list_models
+import A_GIS.Ai.Chatbot.prefetch_info
+import A_GIS.Ai.Chatbot._Registry
+import pytest
+import sys
+import types
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Count the requests to ollama servers with two models."""
+    calls = {"list": 0, "show": 0}
+    hosts = []
+    cards = {
+        "llama3.1:8b": "{'model_info': {'llama.context_length': 131072, "
+        "'x': 1}, 'template': '{{ if .Tools }}tools{{ end }}'}",
+        "llava:7b": "{'model_info': {'llama.context_length': 4096, "
+        "'x': 1}, 'template': '{{ .Prompt }}'}",
+    }
+
+    class Client:
+        def __init__(self, *, host=None):
+            hosts.append(host)
+
+        def list(self):
+            calls["list"] += 1
+            return {"models": [{"model": name} for name in cards]}
+
+        def show(self, *, model):
+            calls["show"] += 1
+            return cards[model]
+
+    monkeypatch.setitem(
+        sys.modules, "ollama", types.SimpleNamespace(Client=Client)
+    )
+    A_GIS.Ai.Chatbot._Clients()
+    monkeypatch.setattr(A_GIS.Ai.Chatbot._Clients, "clients", {})
+    A_GIS.Ai.Chatbot._Registry()
+    monkeypatch.setattr(A_GIS.Ai.Chatbot._Registry, "ttl", 300.0)
+    A_GIS.Ai.Chatbot.invalidate_info()
+    yield calls
+    A_GIS.Ai.Chatbot.invalidate_info()
+
+
+def test_get_info(server):
+    info = A_GIS.Ai.Chatbot.get_info(model="llama3.1:8b")
+    assert info.available
+    assert info.context_length == 131072
+    assert info.has_tools
+    assert info.available_models == ["llama3.1:8b", "llava:7b"]
+    assert server == {"list": 1, "show": 1}
+
+    # Repeated lookups do not contact the server.
+    for _ in range(5):
+        A_GIS.Ai.Chatbot.get_info(model="llama3.1:8b")
+    assert server == {"list": 1, "show": 1}
+
+    info = A_GIS.Ai.Chatbot.get_info(model="missing")
+    assert not info.available
+    assert info.has_tools is None
+
+    # Refresh and invalidation ask again.
+    A_GIS.Ai.Chatbot.get_info(model="llama3.1:8b", refresh=True)
+    assert server == {"list": 2, "show": 2}
+    assert A_GIS.Ai.Chatbot.invalidate_info(model="llama3.1:8b") == 1
+    A_GIS.Ai.Chatbot.get_info(model="llama3.1:8b")
+    assert server == {"list": 2, "show": 3}
+
+
+def test_expiry(server, monkeypatch):
+    A_GIS.Ai.Chatbot.get_info(model="llava:7b")
+    monkeypatch.setattr(A_GIS.Ai.Chatbot._Registry, "ttl", 0.0)
+    A_GIS.Ai.Chatbot.get_info(model="llava:7b")
+    assert server == {"list": 2, "show": 2}
+
+
+def test_prefetch(server):
+    infos = A_GIS.Ai.Chatbot.prefetch_info()
+    assert infos["llava:7b"].context_length == 4096
+    assert not infos["llava:7b"].has_tools
+    assert server == {"list": 1, "show": 2}
+
+    assert A_GIS.Ai.Chatbot.list_models(only_with_tools=True) == [
+        "llama3.1:8b"
+    ]
+    assert server == {"list": 1, "show": 2}
+
+
+def test_servers_are_cached_separately(server):
+    A_GIS.Ai.Chatbot.get_info(model="llava:7b")
+    A_GIS.Ai.Chatbot.get_info(
+        model="llava:7b", http_base_url="http://other:11434"
+    )
+    assert server == {"list": 2, "show": 2}
+    A_GIS.Ai.Chatbot.get_info(
+        model="llava:7b", http_base_url="http://other:11434"
+    )
+    assert server == {"list": 2, "show": 2}
+    assert (
+        A_GIS.Ai.Chatbot.invalidate_info(
+            model="llava:7b", http_base_url="http://other:11434"
+        )
+        == 1
+    )
+    A_GIS.Ai.Chatbot.get_info(model="llava:7b")
+    assert server == {"list": 2, "show": 2}
@@ -0,0 +1,48 @@
+def get_session(
+    *,
+    preload: bool = True,
+    max_sessions: int = 32,
+    **kwargs,
+) -> type["A_GIS.Ai.Chatbot._Chatbot"]:
+    """Return a shared chatbot for a fixed configuration and system prompt.
+
+    The first call with a configuration creates the chatbot with
+    `A_GIS.Ai.Chatbot.init`, keeping the model loaded for 30 minutes unless
+    `keep_alive` is given, and preloads it with `A_GIS.Ai.Chatbot.preload`.
+    Later calls in the process return the same chatbot, so the model is
+    warm and the server finds the system prompt in its KV cache. Chat with
+    `A_GIS.Ai.Chatbot.chat` or on `session.fork()`, which leave the session
+    itself at the bare system prompt, so every request shares that prefix.
+
+    Args:
+        preload (bool, optional):
+            Whether to preload a new session. Defaults to True.
+        max_sessions (int, optional):
+            The most sessions kept. All are dropped when the limit is
+            reached. Defaults to 32.
+        **kwargs (dict, optional):
+            The arguments of `A_GIS.Ai.Chatbot.init`.
+
+    Returns:
+        A_GIS.Ai.Chatbot._Chatbot:
+            The shared chatbot.
+    """
+    import A_GIS.Ai.Chatbot.init
+    import A_GIS.Ai.Chatbot.preload
+
+    kwargs.setdefault("keep_alive", "30m")
+    key = repr(sorted(kwargs.items()))
+    sessions = get_session.__dict__.setdefault("sessions", {})
+    session = sessions.get(key)
+    if session is None:
+        session = A_GIS.Ai.Chatbot.init(**kwargs)
+        if preload:
+            try:
+                session.preload()
+            except Exception:
+                # The first request loads the model anyway.
+                pass
+        if len(sessions) >= max_sessions:
+            sessions.clear()
+        sessions[key] = session
+    return session
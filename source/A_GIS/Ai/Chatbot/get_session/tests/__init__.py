@@ -0,0 +1,17 @@
+import A_GIS.Ai.Chatbot.get_session
+
+
+def test_get_session():
+    kwargs = dict(model="llama3.1:8b", system="Be brief.", preload=False)
+    session = A_GIS.Ai.Chatbot.get_session(**kwargs)
+    assert session.keep_alive == "30m"
+    assert A_GIS.Ai.Chatbot.get_session(**kwargs) is session
+    assert A_GIS.Ai.Chatbot.get_session(**kwargs, keep_alive=-1) is not session
+    assert A_GIS.Ai.Chatbot.get_session(**kwargs, num_ctx=2048) is not session
+
+    # Forks leave the session at its system prompt.
+    fork = session.fork()
+    fork.messages.append({"role": "user", "content": "hi"})
+    assert list(session.messages) == [
+        {"role": "system", "content": "Be brief."}
+    ]
@@ -9,6 +9,10 @@ def init(
     temperature=0.5,
     messages=[],
     tool_names=[],
+    context_policy: str = "truncate",
+    tokenizer=None,
+    keep_alive=None,
+    http_base_url: str = None,
 ) -> type["A_GIS.Ai.Chatbot._Chatbot"]:
     """Initialize a chatbot with specified configuration parameters.
 
@@ -48,6 +52,22 @@ def init(
         tool_names (List[str], optional):
             A list of names for tools the chatbot may interact with.
             Defaults to an empty list.
+        context_policy (str, optional):
+            What to do when the messages and the response would not fit
+            into `num_ctx` tokens, one of the policies of
+            `A_GIS.Ai.Chatbot.Context.fit`: "none", "truncate" the oldest
+            turns, "elide" large tool results or "summarize" the oldest
+            turns. Defaults to "truncate".
+        tokenizer (callable, optional):
+            Returns the tokens of a text, for counting the tokens of the
+            messages. Defaults to None, which estimates the counts.
+        keep_alive (str | int, optional):
+            How long an ollama server keeps the model loaded after each
+            request, e.g. "30m", or -1 for ever. Defaults to None, which
+            uses the server's default.
+        http_base_url (str, optional):
+            The server to send requests to instead of the provider's, e.g.
+            a local stand-in for load tests. Defaults to None.
 
     Returns:
         A_GIS.Ai.Chatbot._Chatbot:
@@ -80,4 +100,8 @@ def init(
         messages=messages,
         tool_names=tool_names,
         tools=[],
+        context_policy=context_policy,
+        tokenizer=tokenizer,
+        keep_alive=keep_alive,
+        http_base_url=http_base_url,
     )
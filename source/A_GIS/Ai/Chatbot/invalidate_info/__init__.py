@@ -0,0 +1,32 @@
+def invalidate_info(*, model: str = None, http_base_url: str = None):
+    """Forget cached model information so it is resolved again.
+
+    Call this after installing or removing models, or set the expiry with
+    `A_GIS_MODEL_INFO_TTL`.
+
+    Args:
+        model (str, optional):
+            The model whose information to forget. Defaults to None, which
+            forgets the list of installed models and every model's
+            information.
+        http_base_url (str, optional):
+            The ollama server whose information to forget. Defaults to None,
+            the default server. Ignored without a `model`, as then every
+            server's information is forgotten.
+
+    Returns:
+        int:
+            The number of models whose information was forgotten.
+    """
+    import A_GIS.Ai.Chatbot._Registry
+
+    registry = A_GIS.Ai.Chatbot._Registry
+    with registry.lock:
+        if model is not None:
+            key = (http_base_url, model)
+            return 0 if registry.info.pop(key, None) is None else 1
+        count = len(registry.info)
+        registry.info.clear()
+        registry.models.clear()
+        registry.models_time.clear()
+    return count
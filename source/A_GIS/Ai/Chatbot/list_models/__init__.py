@@ -1,24 +1,60 @@
-def list_models(*, only_with_tools: bool = False):
+def list_models(
+    *,
+    only_with_tools: bool = False,
+    refresh: bool = False,
+    http_base_url: str = None,
+):
     """Return a list of installed OLLaMA model names.
 
     This function interfaces with the OLLaMA library to obtain a list of
     all available model names. It imports the OLLaMA module, retrieves
     the list of models from the OLLaMA's `list` method, and then
-    extracts the model names from this list.
+    extracts the model names from this list. The list, and the tool
+    support of each model, are kept in `A_GIS.Ai.Chatbot._Registry` until
+    they expire.
+
+    Args:
+        only_with_tools (bool, optional):
+            If True, only return the models that support tools. Defaults to
+            False.
+        refresh (bool, optional):
+            If True, ask the server again even if the list is cached.
+            Defaults to False.
+        http_base_url (str, optional):
+            The ollama server to ask. Defaults to None, which uses the
+            default server.
 
     Returns:
         :
             list of str: A list containing the names of all installed
             OLLaMA models.
     """
-    import ollama
+    import time
+    import A_GIS.Ai.Chatbot._Registry
+    import A_GIS.Ai.Chatbot._get_client
     import A_GIS.Ai.Chatbot.get_info
 
-    all_models = [entry["model"] for entry in ollama.list()["models"]]
+    registry = A_GIS.Ai.Chatbot._Registry
+    registry()
+    with registry.lock:
+        all_models = registry.models.get(http_base_url)
+        fresh = registry.is_fresh(registry.models_time.get(http_base_url))
+    if refresh or all_models is None or not fresh:
+        client = A_GIS.Ai.Chatbot._get_client(
+            provider="ollama", http_base_url=http_base_url
+        )
+        all_models = [entry["model"] for entry in client.list()["models"]]
+        with registry.lock:
+            registry.models[http_base_url] = all_models
+            registry.models_time[http_base_url] = time.monotonic()
+
     models = []
     for model in all_models:
         if only_with_tools:
-            if not A_GIS.Ai.Chatbot.get_info(model=model).has_tools:
+            info = A_GIS.Ai.Chatbot.get_info(
+                model=model, http_base_url=http_base_url
+            )
+            if not info.has_tools:
                 continue
         models.append(model)
 
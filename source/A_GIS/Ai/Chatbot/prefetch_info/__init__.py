@@ -0,0 +1,45 @@
+def prefetch_info(
+    *,
+    models: list[str] = None,
+    max_workers: int = 4,
+    http_base_url: str = None,
+):
+    """Resolve the information of several models ahead of use.
+
+    The information of each model is looked up with
+    `A_GIS.Ai.Chatbot.get_info` on a few threads at once and kept in
+    `A_GIS.Ai.Chatbot._Registry`, so the first chat does not wait for it.
+
+    Args:
+        models (list[str], optional):
+            The models to resolve. Defaults to None, which resolves every
+            installed model.
+        max_workers (int, optional):
+            The most models resolved at the same time. Defaults to 4.
+        http_base_url (str, optional):
+            The ollama server to ask. Defaults to None, which uses the
+            default server.
+
+    Returns:
+        dict:
+            The result of `A_GIS.Ai.Chatbot.get_info` for each model name.
+    """
+    import A_GIS.Ai.Chatbot.get_info
+    import A_GIS.Ai.Chatbot.list_models
+    import concurrent.futures
+
+    if models is None:
+        models = A_GIS.Ai.Chatbot.list_models(
+            refresh=True, http_base_url=http_base_url
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers
+    ) as pool:
+        infos = pool.map(
+            lambda model: A_GIS.Ai.Chatbot.get_info(
+                model=model, http_base_url=http_base_url
+            ),
+            models,
+        )
+        return dict(zip(models, infos))
@@ -0,0 +1,62 @@
+def preload(*, chatbot: type["A_GIS.Ai.Chatbot._Chatbot"]):
+    """Load a chatbot's model and evaluate its system prompt ahead of use.
+
+    For an ollama chatbot, the leading system messages are sent with the
+    chatbot's options and a single predicted token. The server then has the
+    model loaded, for `chatbot.keep_alive` if set, and the system prompt in
+    its KV cache, so the next request with the same prefix and `num_ctx`
+    only evaluates the new messages. Other providers, and the "replay" mode
+    of `A_GIS.Ai.Chatbot.Cache`, need no preloading.
+
+    Args:
+        chatbot (A_GIS.Ai.Chatbot._Chatbot):
+            The chatbot to preload.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - metrics: The metrics of the preloading request from
+              `A_GIS.Ai.Chatbot._get_metrics`, or None if nothing was sent.
+            - _model (str): The model.
+            - _provider (str): The provider.
+    """
+    import A_GIS.Ai.Chatbot.Cache._Cache
+    import A_GIS.Ai.Chatbot._get_client
+    import A_GIS.Ai.Chatbot._get_metrics
+    import A_GIS.Code.make_struct
+    import time
+
+    A_GIS.Ai.Chatbot.Cache._Cache()
+    metrics = None
+    if (
+        chatbot.provider == "ollama"
+        and A_GIS.Ai.Chatbot.Cache._Cache.mode != "replay"
+    ):
+        import ollama
+
+        prefix = []
+        for message in chatbot.messages:
+            if message.get("role") != "system":
+                break
+            prefix.append(message)
+
+        start = time.perf_counter()
+        client = A_GIS.Ai.Chatbot._get_client(
+            provider="ollama", http_base_url=chatbot.http_base_url
+        )
+        response = client.chat(
+            model=chatbot.model,
+            messages=prefix,
+            options=ollama.Options(**chatbot._get_kwargs(num_predict=1)),
+            keep_alive=chatbot.keep_alive,
+        )
+        metrics = A_GIS.Ai.Chatbot._get_metrics(
+            response=response, wall_s=time.perf_counter() - start
+        )
+
+    return A_GIS.Code.make_struct(
+        metrics=metrics,
+        _model=chatbot.model,
+        _provider=chatbot.provider,
+    )
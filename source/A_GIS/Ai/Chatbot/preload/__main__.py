@@ -0,0 +1,48 @@
+"""Benchmark a cold model against a warm model with a cached prefix.
+
+Run with `python -m A_GIS.Ai.Chatbot.preload [model]` against a local
+ollama server. The model is unloaded first, then the same system prompt is
+sent cold, warm, and from a preloaded session.
+"""
+
+import A_GIS.Ai.Chatbot.chat
+import A_GIS.Ai.Chatbot.get_session
+import A_GIS.Ai.Chatbot.init
+import ollama
+import sys
+
+
+def unload(model):
+    ollama.chat(model=model, messages=[], keep_alive=0)
+
+
+def show(label, result):
+    metrics = result.metrics[0]
+    print(
+        f"{label:<20} load {metrics.load_s or 0:7.3f} s  "
+        f"prompt {metrics.prompt_tokens or 0:5d} tokens "
+        f"{metrics.prompt_eval_s or 0:7.3f} s  "
+        f"first token {metrics.time_to_first_token_s or 0:7.3f} s  "
+        f"total {metrics.total_s:7.3f} s"
+    )
+
+
+if __name__ == "__main__":
+    model = sys.argv[1] if len(sys.argv) > 1 else "llama3.1:8b"
+    system = "You are a careful assistant.\n" + "\n".join(
+        f"Rule {i}: answer in one short sentence about topic {i}."
+        for i in range(300)
+    )
+    kwargs = dict(model=model, system=system, num_ctx=8192, num_predict=16)
+
+    unload(model)
+    chatbot = A_GIS.Ai.Chatbot.init(**kwargs, keep_alive="5m")
+    show("cold", A_GIS.Ai.Chatbot.chat(chatbot=chatbot, message="Hi."))
+    show("warm", A_GIS.Ai.Chatbot.chat(chatbot=chatbot, message="Bye."))
+
+    unload(model)
+    session = A_GIS.Ai.Chatbot.get_session(**kwargs)
+    show(
+        "preloaded session",
+        A_GIS.Ai.Chatbot.chat(chatbot=session, message="Hi."),
+    )
@@ -1,7 +1,13 @@
 """
 """
-# Functions
-from .download import download
+import A_GIS.Code.Tree._LazyPackage
 
-# Packages
-from . import _helpers
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "download",
+    ],
+    packages=[
+        "_helpers",
+    ],
+)
@@ -1,9 +1,15 @@
 """
 """
-# Functions
-from .download_model_files import download_model_files
-from .get_download_links import get_download_links
-from .get_output_folder import get_output_folder
-from .parse_download_cli_args import parse_download_cli_args
-from .sanitize_model_and_branch_names import sanitize_model_and_branch_names
-from .start_download_threads import start_download_threads
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "download_model_files",
+        "get_download_links",
+        "get_output_folder",
+        "parse_download_cli_args",
+        "sanitize_model_and_branch_names",
+        "start_download_threads",
+    ],
+)
@@ -9,6 +9,7 @@ def download_model_files(
     start_from_scratch=False,
     threads=4,
     specific_file=None,
+    connections=4,
     is_llamacpp=False,
 ):
     import A_GIS.Ai.Llm._helpers.start_download_threads
@@ -38,10 +39,13 @@ def download_model_files(
     else:
         print(f"Downloading the model to {output_folder}")
 
-    A_GIS.Ai.Llm._helpers.start_download_threads(
+    return A_GIS.Ai.Llm._helpers.start_download_threads(
         session,
         links,
         output_folder,
         start_from_scratch=start_from_scratch,
         threads=threads,
+        sha256=sha256,
+        connections=connections,
+        progress_bar=progress_bar,
     )
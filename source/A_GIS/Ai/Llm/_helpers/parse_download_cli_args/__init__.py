@@ -15,6 +15,12 @@ def parse_download_cli_args():
         default=4,
         help="Number of files to download simultaneously.",
     )
+    parser.add_argument(
+        "--connections",
+        type=int,
+        default=4,
+        help="Number of byte ranges of a file to download simultaneously.",
+    )
     parser.add_argument(
         "--text-only",
         action="store_true",
@@ -1,14 +1,32 @@
 def start_download_threads(
-    session, file_list, output_folder, start_from_scratch=False, threads=4
+    session,
+    file_list,
+    output_folder,
+    start_from_scratch=False,
+    threads=4,
+    sha256=None,
+    connections=4,
+    progress_bar=None,
 ):
-    import A_GIS.File.download
-    import tqdm
+    import A_GIS.File.download_ranges
+    import concurrent.futures
 
-    tqdm.contrib.concurrent.thread_map(
-        lambda url: A_GIS.File.download(
-            session, url, output_folder, start_from_scratch=start_from_scratch
-        ),
-        file_list,
-        max_workers=threads,
-        disable=True,
-    )
+    # Expected checksums by file name.
+    expected = {name: value for name, value in sha256 or []}
+
+    def download(url):
+        name = url.rsplit("/", 1)[1]
+        return A_GIS.File.download_ranges(
+            url=url,
+            output_path=output_folder / name,
+            session=session,
+            expected_sha256=expected.get(name),
+            connections=connections,
+            start_from_scratch=start_from_scratch,
+            progress_bar=progress_bar,
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=threads
+    ) as executor:
+        return list(executor.map(download, file_list))
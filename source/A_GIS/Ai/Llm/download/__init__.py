@@ -3,6 +3,7 @@ def download(
     model,
     branch="main",
     threads=4,
+    connections=4,
     text_only=False,
     specific_file=None,
     output=None,
@@ -13,6 +14,10 @@ def download(
     """
     Downloads models from Hugging Face to models/username_modelname.
 
+    Every file is fetched over up to `connections` byte ranges in parallel,
+    and its SHA-256 is computed while it streams in, so the checksums are
+    validated after the download without reading the files again.
+
     Example:
     python download-model.py facebook/opt-1.3b
 
@@ -57,9 +62,11 @@ def download(
                 }
 
         def check_model_files(
-            self, model, branch, links, sha256, output_folder
+            self, model, branch, links, sha256, output_folder, hashes=None
         ):
-            # Validate the checksums
+            # Validate the checksums, using the ones computed while
+            # downloading when available.
+            hashes = hashes or {}
             validated = True
             for i in range(len(sha256)):
                 fpath = output_folder / sha256[i][0]
@@ -69,19 +76,21 @@ def download(
                     validated = False
                     continue
 
-                with open(output_folder / sha256[i][0], "rb") as f:
-                    file_hash = hashlib.file_digest(f, "sha256").hexdigest()
-                    if file_hash != sha256[i][1]:
-                        print(
-                            f"Checksum failed: {sha256[i][0]}  {sha256[i][1]}"
-                        )
-                        validated = False
-                    else:
-                        print(
-                            f"Checksum validated: {
-                                sha256[i][0]}  {
-                                sha256[i][1]}"
-                        )
+                file_hash = hashes.get(sha256[i][0])
+                if file_hash is None:
+                    with open(fpath, "rb") as f:
+                        file_hash = hashlib.file_digest(f, "sha256").hexdigest()
+                if file_hash != sha256[i][1]:
+                    print(
+                        f"Checksum failed: {sha256[i][0]}  {sha256[i][1]}"
+                    )
+                    validated = False
+                else:
+                    print(
+                        f"Checksum validated: {
+                            sha256[i][0]}  {
+                            sha256[i][1]}"
+                    )
 
             if validated:
                 print("[+] Validated checksums of all model files!")
@@ -131,7 +140,7 @@ def download(
         )
     else:
         # Download files
-        A_GIS.Ai.Llm._helpers.download_model_files(
+        results = A_GIS.Ai.Llm._helpers.download_model_files(
             downloader.session,
             model,
             branch,
@@ -141,6 +150,15 @@ def download(
             specific_file=specific_file,
             threads=threads,
             is_llamacpp=is_llamacpp,
+            connections=connections,
+        )
+        downloader.check_model_files(
+            model,
+            branch,
+            links,
+            sha256,
+            output_folder,
+            hashes={x.path.name: x.sha256 for x in results},
         )
 
     return output_folder
@@ -154,6 +172,7 @@ if __name__ == "__main__":
         model=args.MODEL,
         branch=args.branch,
         threads=args.threads,
+        connections=args.connections,
         text_only=args.text_only,
         specific_file=args.specific_file,
         output=args.output,
@@ -1,8 +1,14 @@
 """Interact with AI.
 """
-# Classes
-from ._Provider import _Provider
+import A_GIS.Code.Tree._LazyPackage
 
-# Packages
-from . import Chatbot
-from . import Llm
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    classes=[
+        "_Provider",
+    ],
+    packages=[
+        "Chatbot",
+        "Llm",
+    ],
+)
@@ -1,10 +1,16 @@
 """Deploy command line interfaces.
 """
-# Functions
-from .distill import distill
-from .get_console_width import get_console_width
-from .get_git_status import get_git_status
-from .get_name_and_path import get_name_and_path
-from .register import register
-from .run_git import run_git
-from .update_and_show_git_status import update_and_show_git_status
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "distill",
+        "get_console_width",
+        "get_git_status",
+        "get_name_and_path",
+        "register",
+        "run_git",
+        "update_and_show_git_status",
+    ],
+)
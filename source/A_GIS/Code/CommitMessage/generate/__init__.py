@@ -1,4 +1,6 @@
-def generate(*, do_commit=False, diff_args: list = ["--staged"], **kwargs):
+def generate(
+    *, do_commit=False, diff_args: list = ["--staged"], stream=None, **kwargs
+):
     """Generate a commit message based on git diff.
 
     This function leverages an AI chatbot to parse the output of a git diff and
@@ -10,6 +12,8 @@ def generate(*, do_commit=False, diff_args: list = ["--staged"], **kwargs):
             generated message. Defaults to False.
         diff_args (list of str): Additional arguments to pass to the git diff command.
             Defaults to ["--staged"].
+        stream (callable): Called with each piece of the model's response as it
+            arrives, to show progress. Defaults to None.
         kwargs: Arbitrary keyword arguments that will be passed to the AI chatbot.
 
     Raises:
@@ -62,9 +66,9 @@ def generate(*, do_commit=False, diff_args: list = ["--staged"], **kwargs):
     git_diff_output = A_GIS.Cli.run_git(mode="diff", args=diff_args).output
     if git_diff_output == "":
         raise ValueError(f"git diff with args={diff_args} was empty!")
-    content = coder.chat(message=git_diff_output).response["message"][
-        "content"
-    ]
+    content = coder.chat(message=git_diff_output, stream=stream).response[
+        "message"
+    ]["content"]
 
     output = A_GIS.Text.get_between_tags(
         text=content, begin_tag="<output>", end_tag="</output>"
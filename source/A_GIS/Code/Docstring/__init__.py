@@ -1,13 +1,19 @@
 """
 """
-# Functions
-from .check_short_description import check_short_description
-from .clean import clean
-from .fix_short_description import fix_short_description
-from .generate import generate
-from .init import init
-from .reformat import reformat
-from .to_string import to_string
+import A_GIS.Code.Tree._LazyPackage
 
-# Classes
-from ._Docstring import _Docstring
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "check_short_description",
+        "clean",
+        "fix_short_description",
+        "generate",
+        "init",
+        "reformat",
+        "to_string",
+    ],
+    classes=[
+        "_Docstring",
+    ],
+)
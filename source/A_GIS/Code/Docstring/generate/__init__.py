@@ -12,6 +12,7 @@ def generate(
     mirostat=2,
     reformat: bool = False,
     substitute_imports: bool = False,
+    stream=None,
     __tracking_hash=None,
 ) -> type["A_GIS.Code.Docstring._Docstring"]:
     """Generate high-quality Python code documentation using AI.
@@ -55,6 +56,9 @@ def generate(
             with equivalent ones for improved generation of docstrings.
             If False, uses the original import statements. Defaults to
             False.
+        stream (callable, optional):
+            Called with each piece of the model's response as it arrives,
+            to show progress. Defaults to None.
         __tracking_hash (str, optional):
             A unique hash used for tracking and debugging the function's
             execution. It can be set to any value but is typically left
@@ -68,7 +72,7 @@ def generate(
             documentation.
     """
 
-    import A_GIS.Ai.Chatbot.init
+    import A_GIS.Ai.Chatbot.get_session
     import A_GIS.Text.add_indent
     import A_GIS.Code.Docstring.clean
     import A_GIS.Text.get_between_tags
@@ -198,14 +202,14 @@ NOTE: It is very important to determine an accurate type for the return value.
 '''
 
     # Create the chatbot.
-    chatbot = A_GIS.Ai.Chatbot.init(
+    chatbot = A_GIS.Ai.Chatbot.get_session(
         model=model,
         temperature=temperature,
         num_ctx=num_ctx,
         num_predict=num_predict,
         mirostat=mirostat,
         system=system,
-    )
+    ).fork()
 
     # Set up the user query.
     code = A_GIS.Code.replace_docstring(
@@ -216,7 +220,7 @@ NOTE: It is very important to determine an accurate type for the return value.
     user = f"<code>\n{code}</code>"
 
     # Ask the bot and get the response.
-    response = chatbot.chat(message=user).response
+    response = chatbot.chat(message=user, stream=stream).response
     text = response["message"]["content"]
     text = A_GIS.Text.get_between_tags(
         text=text, begin_tag="<docstring>", end_tag="</docstring>"
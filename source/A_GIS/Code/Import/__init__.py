@@ -0,0 +1,13 @@
+"""Profile the import cost of A_GIS units.
+"""
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "_get_top_level_imports",
+        "_parse_importtime",
+        "compare",
+        "profile",
+    ],
+)
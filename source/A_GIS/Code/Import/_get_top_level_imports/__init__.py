@@ -0,0 +1,43 @@
+def _get_top_level_imports(*, code: str) -> list[str]:
+    """List the modules a piece of code imports at module level.
+
+    Only `import` statements in the module body itself are considered, not
+    the ones inside functions or classes, since those run on first call
+    rather than on import. Relative imports are skipped.
+
+    Args:
+        code (str):
+            The source code of the module.
+
+    Returns:
+        list[str]:
+            The absolute names of the imported modules, in order and
+            without duplicates. Empty if the code cannot be parsed.
+    """
+    import A_GIS.Code.Parse.get
+    import ast
+
+    try:
+        tree = A_GIS.Code.Parse.get(code=code)
+    except SyntaxError:
+        return []
+
+    # Guarded imports, e.g. in try or if blocks, also run on import.
+    modules = []
+    pending = list(tree.body)
+    while pending:
+        node = pending.pop(0)
+        if isinstance(node, ast.Import):
+            modules.extend(x.name for x in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level == 0 and node.module:
+                modules.append(node.module)
+        elif isinstance(node, (ast.If, ast.Try, ast.With)):
+            for field in ("body", "orelse", "handlers", "finalbody"):
+                for child in getattr(node, field, []):
+                    if isinstance(child, ast.ExceptHandler):
+                        pending.extend(child.body)
+                    else:
+                        pending.append(child)
+
+    return list(dict.fromkeys(modules))
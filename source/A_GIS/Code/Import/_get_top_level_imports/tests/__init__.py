@@ -0,0 +1,27 @@
+import A_GIS.Code.Import._get_top_level_imports
+
+
+def test_module_level_only():
+    code = """
+import dataclasses
+import os.path
+from typing import Any
+from . import sibling
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def f():
+    import requests
+
+class _C:
+    import json
+"""
+    modules = A_GIS.Code.Import._get_top_level_imports(code=code)
+    assert modules == ["dataclasses", "os.path", "typing", "numpy"]
+
+
+def test_unparsable_code():
+    assert A_GIS.Code.Import._get_top_level_imports(code="def f(") == []
@@ -0,0 +1,50 @@
+def _parse_importtime(*, text: str) -> dict:
+    """Parse the output of `python -X importtime` into an import tree.
+
+    Each `import time:` line holds the self and cumulative time in
+    microseconds and the module name, indented by two spaces per nesting
+    level. Lines are printed when a module finishes importing, so the
+    children of a module always precede it. A name repeated at a shallower
+    level is an outer import that only loaded the parent packages of that
+    module first, so its time is merged into the existing entry and its
+    children are moved up a level.
+
+    Args:
+        text (str):
+            The stderr text of a process run with `-X importtime`.
+
+    Returns:
+        dict:
+            A dictionary mapping each module name to a dictionary with
+            `self_us`, `cumulative_us`, `parent` (None for modules
+            imported at top level) and `children` (list of module names
+            in import order).
+    """
+    import re
+
+    pattern = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)")
+
+    nodes = {}
+    pending = {}
+    for line in text.splitlines():
+        match = pattern.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        depth = (len(indent) - 1) // 2
+        children = pending.pop(depth + 1, [])
+        if name in nodes:
+            nodes[name]["self_us"] += int(self_us)
+            pending.setdefault(depth, []).extend(children)
+            continue
+        for child in children:
+            nodes[child]["parent"] = name
+        nodes[name] = {
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+            "parent": None,
+            "children": children,
+        }
+        pending.setdefault(depth, []).append(name)
+
+    return nodes
@@ -0,0 +1,37 @@
+"""Tests for parsing `python -X importtime` output."""
+
+import A_GIS.Code.Import._parse_importtime
+
+TEXT = """\
+import time: self [us] | cumulative | imported package
+import time:        10 |         10 |   _io
+import time:        20 |         30 | io
+import time:         5 |          5 |       A_GIS.Code.Tree._LazyPackage
+import time:         7 |         12 |     A_GIS.Code.Tree
+import time:         2 |         14 |   A_GIS.Code.Tree._LazyPackage
+import time:       100 |        114 | A_GIS
+"""
+
+
+def test_tree_structure():
+    nodes = A_GIS.Code.Import._parse_importtime(text=TEXT)
+    assert nodes["io"]["children"] == ["_io"]
+    assert nodes["_io"]["parent"] == "io"
+    assert nodes["io"]["parent"] is None
+    assert nodes["io"]["self_us"] == 20
+    assert nodes["io"]["cumulative_us"] == 30
+
+
+def test_repeated_name_is_merged():
+    nodes = A_GIS.Code.Import._parse_importtime(text=TEXT)
+    lazy = nodes["A_GIS.Code.Tree._LazyPackage"]
+    assert lazy["self_us"] == 7
+    assert lazy["cumulative_us"] == 5
+    assert lazy["parent"] == "A_GIS.Code.Tree"
+    assert nodes["A_GIS.Code.Tree"]["parent"] == "A_GIS"
+    assert nodes["A_GIS"]["children"] == ["A_GIS.Code.Tree"]
+
+
+def test_ignores_other_lines():
+    nodes = A_GIS.Code.Import._parse_importtime(text="Usage: a-gis\n")
+    assert nodes == {}
@@ -0,0 +1,100 @@
+def compare(
+    *,
+    baseline: dict,
+    snapshot: dict,
+    tolerance: float = 0.2,
+    min_us: int = 1000,
+):
+    """Compare an import-time snapshot against a saved baseline.
+
+    Both arguments are snapshots as returned by
+    `A_GIS.Code.Import.profile` (usually the baseline is read back from
+    JSON). A module regresses when its cumulative import time grew by more
+    than `min_us` and by more than `tolerance` relative to the baseline.
+    Modules that are newly imported and cost at least `min_us` are
+    reported separately, since they usually mean a new top-level
+    dependency.
+
+    Args:
+        baseline (dict):
+            The reference snapshot.
+        snapshot (dict):
+            The snapshot to check.
+        tolerance (float, optional):
+            Allowed relative growth before a module counts as regressed.
+            Defaults to 0.2.
+        min_us (int, optional):
+            Allowed absolute growth in microseconds. Defaults to 1000.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - regressed (bool): Whether the total or any module regressed
+              or a costly new module appeared.
+            - total_change_us (int): Change of the total import time.
+            - regressions (list[dict]): Modules with `name`,
+              `baseline_us`, `current_us` and `change_us`, largest change
+              first.
+            - added (list[dict]): New modules with `name` and
+              `current_us`, slowest first.
+            - removed (list[str]): Modules no longer imported.
+            - error (str): Error message if the snapshots are not
+              comparable, else "".
+    """
+    import A_GIS.Code.make_struct
+
+    error = ""
+    if baseline.get("mode") != snapshot.get("mode"):
+        error = (
+            f"Baseline mode={baseline.get('mode')} differs from snapshot "
+            f"mode={snapshot.get('mode')}!"
+        )
+
+    def is_regression(old, new):
+        return new - old > min_us and new > old * (1 + tolerance)
+
+    old_modules = baseline.get("modules", {})
+    new_modules = snapshot.get("modules", {})
+
+    regressions = []
+    added = []
+    for name, new in new_modules.items():
+        if name not in old_modules:
+            if new["cumulative_us"] >= min_us:
+                added.append(
+                    {"name": name, "current_us": new["cumulative_us"]}
+                )
+            continue
+        old = old_modules[name]
+        if is_regression(old["cumulative_us"], new["cumulative_us"]):
+            regressions.append(
+                {
+                    "name": name,
+                    "baseline_us": old["cumulative_us"],
+                    "current_us": new["cumulative_us"],
+                    "change_us": new["cumulative_us"] - old["cumulative_us"],
+                }
+            )
+    regressions.sort(key=lambda x: -x["change_us"])
+    added.sort(key=lambda x: -x["current_us"])
+    removed = sorted(set(old_modules) - set(new_modules))
+
+    old_total = baseline.get("total_us", 0)
+    new_total = snapshot.get("total_us", 0)
+    regressed = error == "" and (
+        is_regression(old_total, new_total)
+        or len(regressions) > 0
+        or len(added) > 0
+    )
+
+    return A_GIS.Code.make_struct(
+        regressed=regressed,
+        total_change_us=new_total - old_total,
+        regressions=regressions,
+        added=added,
+        removed=removed,
+        error=error,
+        _tolerance=tolerance,
+        _min_us=min_us,
+    )
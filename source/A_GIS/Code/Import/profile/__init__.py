@@ -0,0 +1,194 @@
+def profile(
+    *,
+    mode: str = "units",
+    package_name: str = "A_GIS",
+    min_us: int = 10000,
+    python: str = None,
+):
+    """Profile the import time of a package under `python -X importtime`.
+
+    This function imports the package in a fresh interpreter with
+    CPython's import-time instrumentation enabled and turns the report
+    into an import tree. Units of the package that import a third-party
+    module at top level, found statically from their source, are flagged as
+    heavy when that module cost at least `min_us` to import, since A_GIS
+    units are expected to import their dependencies inside the function
+    body. Standard library modules are not flagged. The returned snapshot
+    can be saved as JSON and later passed to `A_GIS.Code.Import.compare` to
+    detect regressions.
+
+    Args:
+        mode (str, optional):
+            What to import. One of "package" (only the package root),
+            "units" (the package and every functional unit below it) or
+            "cli" (run `python -m <package_name> --help`). Defaults to
+            "units".
+        package_name (str, optional):
+            The package to profile. Defaults to "A_GIS".
+        min_us (int, optional):
+            The cumulative import time in microseconds above which a
+            third-party top-level import of a unit is flagged as heavy.
+            Defaults to 10000.
+        python (str, optional):
+            The interpreter to use. Defaults to the current one.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - total_us (int): Total import time of all top-level imports.
+            - nodes (dict): Import tree from
+              `A_GIS.Code.Import._parse_importtime`.
+            - units (list[dict]): Modules of the package with `name`,
+              `self_us` and `cumulative_us`, slowest first.
+            - heavy (list[dict]): Heavy third-party top-level imports with
+              `unit`, `module` and `cumulative_us`, slowest first.
+            - errors (dict): Import errors by unit name in "units" mode.
+            - snapshot (dict): JSON-serializable baseline of the run.
+            - error (str): Error message if the run failed, else "".
+    """
+    import A_GIS.Code.make_struct
+    import A_GIS.Code.Import._get_top_level_imports
+    import A_GIS.Code.Import._parse_importtime
+    import importlib.util
+    import json
+    import os
+    import pathlib
+    import platform
+    import subprocess
+    import sys
+    import textwrap
+
+    if python is None:
+        python = sys.executable
+
+    # Make sure the child interpreter finds the same package.
+    spec = importlib.util.find_spec(package_name)
+    location = pathlib.Path(spec.origin).parent.parent
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(location), *filter(None, [env.get("PYTHONPATH")])]
+    )
+
+    # Assemble the command for the mode.
+    error = ""
+    if mode == "cli":
+        command = [python, "-X", "importtime", "-m", package_name, "--help"]
+    elif mode == "package":
+        script = f"import {package_name}\nprint('{{}}')"
+        command = [python, "-X", "importtime", "-c", script]
+    elif mode == "units":
+        script = textwrap.dedent(
+            f"""
+            import json, pathlib
+            package = __import__({package_name!r})
+            root = pathlib.Path(package.__file__).parent
+            errors = {{}}
+            for file in sorted(root.rglob("__init__.py")):
+                parts = file.parent.relative_to(root.parent).parts
+                if "tests" in parts or "__pycache__" in parts:
+                    continue
+                name = ".".join(parts)
+                try:
+                    __import__(name)
+                except BaseException as e:
+                    errors[name] = f"{{type(e).__name__}}: {{e}}"
+            print(json.dumps(errors))
+            """
+        )
+        command = [python, "-X", "importtime", "-c", script]
+    else:
+        command = None
+        error = f"Unknown mode={mode}! Should be one of package, units, cli."
+
+    # Run the instrumented interpreter.
+    nodes = {}
+    errors = {}
+    if command is not None:
+        completed = subprocess.run(
+            command, capture_output=True, text=True, env=env
+        )
+        nodes = A_GIS.Code.Import._parse_importtime(text=completed.stderr)
+        if completed.returncode != 0:
+            other = [
+                line
+                for line in completed.stderr.splitlines()
+                if not line.startswith("import time:")
+            ]
+            error = "\n".join(other[-10:])
+        elif mode == "units":
+            errors = json.loads(completed.stdout.splitlines()[-1])
+
+    # Collect the units of the package.
+    prefix = package_name + "."
+    units = []
+    for name, node in nodes.items():
+        if name == package_name or name.startswith(prefix):
+            units.append(
+                {
+                    "name": name,
+                    "self_us": node["self_us"],
+                    "cumulative_us": node["cumulative_us"],
+                }
+            )
+
+    # A module shows up in the report only under the first unit that
+    # imports it, so the top-level imports of every unit are found from its
+    # source and joined with the measured cost of each module.
+    heavy = []
+    root = pathlib.Path(spec.submodule_search_locations[0])
+    for file in sorted(root.rglob("__init__.py")):
+        parts = file.parent.relative_to(root.parent).parts
+        if "tests" in parts or "__pycache__" in parts:
+            continue
+        name = ".".join(parts)
+        modules = A_GIS.Code.Import._get_top_level_imports(
+            code=file.read_text(encoding="utf-8")
+        )
+        for module in modules:
+            top = module.split(".")[0]
+            if top == package_name or top in sys.stdlib_module_names:
+                continue
+            node = nodes.get(module, nodes.get(top))
+            if node is not None and node["cumulative_us"] >= min_us:
+                heavy.append(
+                    {
+                        "unit": name,
+                        "module": module,
+                        "cumulative_us": node["cumulative_us"],
+                    }
+                )
+    units.sort(key=lambda x: -x["cumulative_us"])
+    heavy.sort(key=lambda x: -x["cumulative_us"])
+
+    total_us = sum(
+        node["cumulative_us"]
+        for node in nodes.values()
+        if node["parent"] is None
+    )
+    snapshot = {
+        "mode": mode,
+        "package_name": package_name,
+        "python": platform.python_version(),
+        "total_us": total_us,
+        "modules": {
+            name: {
+                "self_us": node["self_us"],
+                "cumulative_us": node["cumulative_us"],
+            }
+            for name, node in nodes.items()
+        },
+    }
+
+    return A_GIS.Code.make_struct(
+        total_us=total_us,
+        nodes=nodes,
+        units=units,
+        heavy=heavy,
+        errors=errors,
+        snapshot=snapshot,
+        error=error,
+        _mode=mode,
+        _package_name=package_name,
+        _min_us=min_us,
+    )
@@ -0,0 +1,9 @@
+class _Cache:
+    """Validated manifest entries of this process, by package directory.
+
+    `A_GIS.Code.Manifest.read` keeps its result here so that later reads in
+    the same process only need to stat the files, like `_Log` keeps the
+    logger for the whole process.
+    """
+
+    entries = {}
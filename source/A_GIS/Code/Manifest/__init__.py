@@ -0,0 +1,16 @@
+"""Static manifest of the units in a package.
+"""
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "_get_path",
+        "_parse_module",
+        "read",
+        "update",
+    ],
+    classes=[
+        "_Cache",
+    ],
+)
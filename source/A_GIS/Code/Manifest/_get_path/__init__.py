@@ -0,0 +1,5 @@
+def _get_path(*, root: type["pathlib.Path"]) -> type["pathlib.Path"]:
+    """Return the path of the unit manifest for a package root directory."""
+    import pathlib
+
+    return pathlib.Path(root) / "manifest.json"
@@ -0,0 +1,92 @@
+def _parse_module(*, code: str, filename: str = "__init__.py") -> dict:
+    """Extract the manifest data of one module from its source code.
+
+    This function statically inspects a module without importing it. It
+    collects the top-level functions and classes, the first line of the
+    first docstring (as `A_GIS.Code.parse_docstring` with
+    `only_description=True` would) and the header of the first top-level
+    function (as `A_GIS.Code.Unit.get` would in `function_definition`). If
+    the code cannot be parsed by the running interpreter, it has no
+    functions, classes or description, as for `A_GIS.Code.list` in its
+    "static" and "import" modes, and its kind is "module".
+
+    Args:
+        code (str):
+            The source code of the module.
+        filename (str, optional):
+            The file name of the module, used to recognize packages
+            (`__init__.py`) and programs (`__main__.py`). Defaults to
+            "__init__.py".
+
+    Returns:
+        dict:
+            A dictionary with the following keys:
+
+            - kind (str): One of "package", "function", "class",
+              "program" or "module".
+            - description (str): First docstring line or "".
+            - definition (str): Header of the first top-level function
+              without the trailing colon, or "".
+            - functions (list[str]): Names of top-level functions.
+            - classes (list[str]): Names of top-level classes.
+    """
+    import A_GIS.Code.Parse.get
+    import ast
+
+    # Collect top-level functions and classes and the docstring.
+    description = ""
+    functions = []
+    classes = []
+    parsed = True
+    try:
+        tree = A_GIS.Code.Parse.get(code=code)
+        functions = [
+            x.name
+            for x in tree.body
+            if isinstance(x, (ast.FunctionDef, ast.AsyncFunctionDef))
+        ]
+        classes = [x.name for x in tree.body if isinstance(x, ast.ClassDef)]
+        docstring = ast.get_docstring(tree)
+        if not docstring:
+            for x in tree.body:
+                try:
+                    docstring = ast.get_docstring(x)
+                    break
+                except TypeError:
+                    pass
+        if docstring:
+            description = docstring.lstrip().split("\n")[0]
+    except SyntaxError:
+        parsed = False
+
+    # Get the header of the first top-level function.
+    definition = []
+    for line in code.split("\n"):
+        line = line.rstrip()
+        if line.startswith("def") or len(definition) > 0:
+            definition.append(line)
+            if line.endswith(":"):
+                break
+    definition = "\n".join(definition).rstrip().removesuffix(":")
+
+    # Classify the module.
+    if filename == "__main__.py":
+        kind = "program"
+    elif not parsed:
+        kind = "module"
+    elif filename == "__init__.py" and not functions and not classes:
+        kind = "package"
+    elif classes and not functions:
+        kind = "class"
+    elif functions and not classes:
+        kind = "function"
+    else:
+        kind = "module"
+
+    return {
+        "kind": kind,
+        "description": description,
+        "definition": definition,
+        "functions": functions,
+        "classes": classes,
+    }
@@ -0,0 +1,47 @@
+import A_GIS.Code.Manifest._parse_module
+
+
+def test_function_unit():
+    code = '''def f(*, x: int) -> int:
+    """Add one to x.
+
+    Args:
+        x (int): The input.
+    """
+    return x + 1
+'''
+    entry = A_GIS.Code.Manifest._parse_module(code=code)
+    assert entry["kind"] == "function"
+    assert entry["functions"] == ["f"]
+    assert entry["classes"] == []
+    assert entry["description"] == "Add one to x."
+    assert entry["definition"] == "def f(*, x: int) -> int"
+
+
+def test_package():
+    code = '"""A package.\n\nMore text.\n"""\nimport os\n'
+    entry = A_GIS.Code.Manifest._parse_module(code=code)
+    assert entry["kind"] == "package"
+    assert entry["description"] == "A package."
+    assert entry["definition"] == ""
+
+
+def test_class_and_program():
+    code = 'class _Thing:\n    """Hold a thing."""\n'
+    entry = A_GIS.Code.Manifest._parse_module(code=code)
+    assert entry["kind"] == "class"
+    assert entry["description"] == "Hold a thing."
+    entry = A_GIS.Code.Manifest._parse_module(
+        code="def main():\n    pass\n", filename="__main__.py"
+    )
+    assert entry["kind"] == "program"
+
+
+def test_unparsable_code():
+    code = "def f(\n    *,\n    x,\n):\n    return (\n"
+    entry = A_GIS.Code.Manifest._parse_module(code=code)
+    assert entry["functions"] == []
+    assert entry["classes"] == []
+    assert entry["kind"] == "module"
+    assert entry["description"] == ""
+    assert entry["definition"] == "def f(\n    *,\n    x,\n)"
@@ -0,0 +1,137 @@
+def read(
+    *,
+    package_name: str = "A_GIS",
+    root: type["pathlib.Path"] = None,
+    validate: bool = True,
+):
+    """Read the unit manifest of a package without importing its units.
+
+    The manifest written by `A_GIS.Code.Manifest.update` maps every module
+    of the package to its kind, path, first docstring line, function
+    header, top-level functions and classes, and the SHA-256 hash of its
+    source. With `validate` enabled, the package directory is walked and
+    every module whose modification time or size changed is hashed. Entries
+    whose hash no longer matches, and modules missing from the manifest,
+    are parsed again with `A_GIS.Code.Manifest._parse_module`, and entries
+    of deleted modules are dropped. The validated entries are kept for the
+    rest of the process, so repeated reads only stat the files. The
+    manifest file itself is not modified.
+
+    Args:
+        package_name (str, optional):
+            The name of the package. Defaults to "A_GIS".
+        root (pathlib.Path, optional):
+            The directory of the package. Defaults to the location found
+            by `importlib.util.find_spec(package_name)`.
+        validate (bool, optional):
+            Whether to check every entry against the files on disk.
+            Defaults to True.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - entries (dict): Module name to a dictionary with `kind`,
+              `path` (absolute), `hash`, `mtime_ns`, `size`,
+              `description`, `definition`, `functions` and `classes`.
+            - refreshed (list[str]): Modules whose entry was parsed
+              again because it was stale or missing since the last read.
+            - removed (list[str]): Modules dropped from the manifest.
+            - path (pathlib.Path): The manifest file.
+            - _package_name (str): The package name.
+    """
+    import A_GIS.Code.make_struct
+    import A_GIS.Code.Manifest._Cache
+    import A_GIS.Code.Manifest._get_path
+    import A_GIS.Code.Manifest._parse_module
+    import hashlib
+    import importlib.util
+    import json
+    import os
+    import pathlib
+
+    if root is None:
+        spec = importlib.util.find_spec(package_name)
+        root = spec.submodule_search_locations[0]
+    root = pathlib.Path(root)
+
+    # Start from the entries validated earlier in this process, else from
+    # the stored ones, with paths relative to the package root.
+    path = A_GIS.Code.Manifest._get_path(root=root)
+    stored = A_GIS.Code.Manifest._Cache.entries.get(str(root))
+    if stored is None:
+        stored = {}
+        if path.exists():
+            with open(path, "r") as f:
+                stored = json.load(f).get("entries", {})
+
+    entries = {}
+    refreshed = []
+    if not validate:
+        for name, entry in stored.items():
+            entries[name] = {**entry, "path": str(root / entry["path"])}
+        return A_GIS.Code.make_struct(
+            entries=entries,
+            refreshed=refreshed,
+            removed=[],
+            path=path,
+            _package_name=package_name,
+        )
+
+    # Walk the package like pkgutil does, only into directories that are
+    # packages themselves. Plain os.path keeps repeated reads cheap.
+    validated = {}
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = sorted(
+            x
+            for x in dirs
+            if os.path.exists(os.path.join(directory, x, "__init__.py"))
+        )
+        relative = os.path.relpath(directory, root)
+        parts = [root.name]
+        if relative != ".":
+            parts += relative.split(os.sep)
+        for file in sorted(files):
+            stem, extension = os.path.splitext(file)
+            if extension != ".py" or not stem.isidentifier():
+                continue
+            name = ".".join(parts if stem == "__init__" else [*parts, stem])
+            file_path = os.path.join(directory, file)
+            stat = os.stat(file_path)
+
+            # Files with the same modification time and size are trusted
+            # without hashing them.
+            entry = stored.get(name)
+            if (
+                entry is None
+                or entry.get("mtime_ns") != stat.st_mtime_ns
+                or entry.get("size") != stat.st_size
+            ):
+                with open(file_path, "rb") as f:
+                    source = f.read()
+                hash = hashlib.sha256(source).hexdigest()
+                if entry is None or entry["hash"] != hash:
+                    entry = A_GIS.Code.Manifest._parse_module(
+                        code=source.decode("utf-8"), filename=file
+                    )
+                    entry["hash"] = hash
+                    refreshed.append(name)
+                entry = {
+                    **entry,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                }
+            validated[name] = {
+                **entry,
+                "path": "/".join([*parts[1:], file]),
+            }
+            entries[name] = {**entry, "path": file_path}
+    A_GIS.Code.Manifest._Cache.entries[str(root)] = validated
+
+    return A_GIS.Code.make_struct(
+        entries=entries,
+        refreshed=refreshed,
+        removed=sorted(set(stored) - set(entries)),
+        path=path,
+        _package_name=package_name,
+    )
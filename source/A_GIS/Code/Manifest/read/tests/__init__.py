@@ -0,0 +1,45 @@
+import A_GIS.Code.Manifest.read
+import A_GIS.Code.Manifest.update
+import json
+import os
+import pathlib
+
+
+def _write_package(root: pathlib.Path):
+    (root / "greet").mkdir(parents=True)
+    (root / "__init__.py").write_text('"""Test package."""\n')
+    (root / "greet" / "__init__.py").write_text(
+        'def greet(*, name):\n    """Say hello."""\n    return name\n'
+    )
+
+
+def test_only_changed_files_are_parsed(tmp_path):
+    root = tmp_path / "_manifest_package"
+    _write_package(root)
+    first = A_GIS.Code.Manifest.read(package_name=root.name, root=root)
+    assert sorted(first.refreshed) == [root.name, f"{root.name}.greet"]
+    assert first.entries[f"{root.name}.greet"]["functions"] == ["greet"]
+
+    second = A_GIS.Code.Manifest.read(package_name=root.name, root=root)
+    assert second.refreshed == []
+
+    # Touching a file without changing it does not parse it again.
+    file = root / "greet" / "__init__.py"
+    os.utime(file, ns=(0, 0))
+    again = A_GIS.Code.Manifest.read(package_name=root.name, root=root)
+    assert again.refreshed == []
+
+    file.write_text('def greet(*, name):\n    """Say hi."""\n')
+    third = A_GIS.Code.Manifest.read(package_name=root.name, root=root)
+    assert third.refreshed == [f"{root.name}.greet"]
+    assert third.entries[f"{root.name}.greet"]["description"] == "Say hi."
+
+
+def test_update_writes_relative_paths(tmp_path):
+    root = tmp_path / "_manifest_package"
+    _write_package(root)
+    result = A_GIS.Code.Manifest.update(root=root)
+    assert result.written
+    entries = json.loads(result.path.read_text())["entries"]
+    assert entries[f"{root.name}.greet"]["path"] == "greet/__init__.py"
+    assert not A_GIS.Code.Manifest.update(root=root).written
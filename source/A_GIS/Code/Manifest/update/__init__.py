@@ -0,0 +1,60 @@
+def update(*, root: type["pathlib.Path"]):
+    """Write the unit manifest of a package to disk.
+
+    This function reads the current manifest with
+    `A_GIS.Code.Manifest.read`, which re-parses only the modules whose
+    content hash changed, and writes it back next to the package
+    `__init__.py` as `manifest.json`. Paths are stored relative to the
+    package directory. The file is only rewritten when its content changed,
+    so a no-op update leaves it untouched. The manifest is generated by
+    `a-gis update`, or before building a distribution, and is not kept
+    under version control.
+
+    Args:
+        root (pathlib.Path):
+            The package directory, e.g. the result of
+            `A_GIS.Code.find_root`.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - path (pathlib.Path): The manifest file.
+            - written (bool): Whether the file was written.
+            - refreshed (list[str]): Modules whose entry was re-parsed.
+            - removed (list[str]): Modules dropped from the manifest.
+    """
+    import A_GIS.Code.make_struct
+    import A_GIS.Code.Manifest.read
+    import A_GIS.File.write
+    import json
+    import pathlib
+
+    root = pathlib.Path(root)
+    manifest = A_GIS.Code.Manifest.read(package_name=root.name, root=root)
+
+    # Store paths relative to the package root so the file can be shipped.
+    entries = {}
+    for name, entry in sorted(manifest.entries.items()):
+        relative = pathlib.Path(entry["path"]).relative_to(root).as_posix()
+        entries[name] = {**entry, "path": relative}
+
+    content = json.dumps(
+        {"package_name": root.name, "entries": entries},
+        indent=1,
+        sort_keys=True,
+    )
+    content += "\n"
+    written = not manifest.path.exists()
+    if not written:
+        with open(manifest.path, "r") as f:
+            written = f.read() != content
+    if written:
+        A_GIS.File.write(content=content, file=manifest.path)
+
+    return A_GIS.Code.make_struct(
+        path=manifest.path,
+        written=written,
+        refreshed=manifest.refreshed,
+        removed=manifest.removed,
+    )
@@ -0,0 +1,41 @@
+class _Cache:
+    """Process-wide parse trees and counters of `A_GIS.Code.Parse.get`.
+
+    The trees are kept in least recently used order by the SHA-256 of the
+    source and the kind of tree. Their memory is estimated from the size of
+    the source, `bytes_per_byte` bytes per source byte, which is about what
+    both `ast` and `libcst` trees take. The limit is read once from
+    `A_GIS_PARSE_CACHE_MAX_BYTES`, 256 MiB by default, and can be changed
+    with `A_GIS.Code.Parse.configure`.
+    """
+
+    kinds = ("ast", "cst")
+    bytes_per_byte = 20
+    initialized = False
+    entries = None
+    lock = None
+    max_bytes = None
+    bytes = 0
+    hits = 0
+    misses = 0
+    evictions = 0
+
+    def __init__(self):
+        if not _Cache.initialized:
+            self._do_initialize()
+
+    @staticmethod
+    def _do_initialize():
+        import collections
+        import os
+        import threading
+
+        if _Cache.initialized:
+            return
+
+        _Cache.entries = collections.OrderedDict()
+        _Cache.lock = threading.Lock()
+        _Cache.max_bytes = int(
+            os.environ.get("A_GIS_PARSE_CACHE_MAX_BYTES", str(256 << 20))
+        )
+        _Cache.initialized = True
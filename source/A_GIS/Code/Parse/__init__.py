@@ -0,0 +1,16 @@
+"""Process-wide cache of parsed source code.
+"""
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "clear",
+        "configure",
+        "get",
+        "get_stats",
+    ],
+    classes=[
+        "_Cache",
+    ],
+)
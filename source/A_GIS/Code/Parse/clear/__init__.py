@@ -0,0 +1,19 @@
+def clear():
+    """Drop all trees from the parse cache and reset its counters.
+
+    Returns:
+        int:
+            The number of dropped trees.
+    """
+    import A_GIS.Code.Parse._Cache
+
+    cache = A_GIS.Code.Parse._Cache
+    cache()
+    with cache.lock:
+        count = len(cache.entries)
+        cache.entries.clear()
+        cache.bytes = 0
+        cache.hits = 0
+        cache.misses = 0
+        cache.evictions = 0
+    return count
@@ -0,0 +1,27 @@
+def configure(*, max_bytes: int = None):
+    """Configure the process-wide cache of `A_GIS.Code.Parse.get`.
+
+    Args:
+        max_bytes (int, optional):
+            The estimated size above which the least recently used trees
+            are dropped. Defaults to None, which keeps the current size,
+            initially 256 MiB.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the resulting `max_bytes`.
+    """
+    import A_GIS.Code.Parse._Cache
+    import A_GIS.Code.make_struct
+
+    cache = A_GIS.Code.Parse._Cache
+    cache()
+    if max_bytes is not None:
+        with cache.lock:
+            cache.max_bytes = max_bytes
+            while cache.bytes > cache.max_bytes and cache.entries:
+                _, (_, evicted) = cache.entries.popitem(last=False)
+                cache.bytes -= evicted
+                cache.evictions += 1
+
+    return A_GIS.Code.make_struct(max_bytes=cache.max_bytes)
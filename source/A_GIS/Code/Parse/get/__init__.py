@@ -0,0 +1,71 @@
+def get(*, code: str, kind: str = "ast"):
+    """Return the parse tree of some code from a process-wide cache.
+
+    The same source is parsed by many units during one run, for example
+    `A_GIS.Code.Tree.get`, `A_GIS.Code.distill` and
+    `A_GIS.Code.parse_docstring` for every file of `A_GIS.Code.Tree.recurse`
+    or `catalog`. This function parses every distinct source only once per
+    kind and hands out the same tree afterwards, keyed by the SHA-256 of the
+    code. The least recently used trees are dropped when their estimated
+    size exceeds the limit set with `A_GIS.Code.Parse.configure`.
+
+    The trees are shared, so they must not be modified. `libcst` trees are
+    immutable anyway, but `ast` trees are not.
+
+    Args:
+        code (str): The Python code to parse.
+        kind (str, optional): "ast" for an `ast.Module` or "cst" for a
+            `libcst.Module`. Defaults to "ast".
+
+    Raises:
+        ValueError: If the kind is not known.
+        SyntaxError: If the code cannot be parsed with `ast`.
+        libcst.ParserSyntaxError: If the code cannot be parsed with
+            `libcst`. Errors are not cached.
+
+    Returns:
+        ast.Module or libcst.Module: The parse tree.
+    """
+    import A_GIS.Code.Parse._Cache
+    import hashlib
+
+    cache = A_GIS.Code.Parse._Cache
+    cache()
+    if kind not in cache.kinds:
+        raise ValueError(
+            f"Unknown parse tree kind={kind}! Should be one of "
+            + ", ".join(cache.kinds)
+            + "."
+        )
+
+    key = (hashlib.sha256(code.encode()).hexdigest(), kind)
+    with cache.lock:
+        entry = cache.entries.get(key)
+        if entry is not None:
+            cache.entries.move_to_end(key)
+            cache.hits += 1
+            return entry[0]
+        cache.misses += 1
+
+    # Parse outside of the lock, so other threads are not held up.
+    if kind == "ast":
+        import ast
+
+        tree = ast.parse(code)
+    else:
+        import libcst
+
+        tree = libcst.parse_module(code)
+
+    size = len(code) * cache.bytes_per_byte
+    with cache.lock:
+        if key not in cache.entries:
+            cache.entries[key] = (tree, size)
+            cache.bytes += size
+        tree = cache.entries[key][0]
+        while cache.bytes > cache.max_bytes and len(cache.entries) > 1:
+            _, (_, evicted) = cache.entries.popitem(last=False)
+            cache.bytes -= evicted
+            cache.evictions += 1
+
+    return tree
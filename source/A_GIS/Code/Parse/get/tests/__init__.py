@@ -0,0 +1,75 @@
+import A_GIS.Code.distill
+import A_GIS.Code.Parse.clear
+import A_GIS.Code.Parse.configure
+import A_GIS.Code.Parse.get
+import A_GIS.Code.Parse.get_stats
+import A_GIS.Code.Tree.get
+import ast
+import pytest
+
+CODE = 'def greet():\n    """Say hello."""\n    return "hello"\n'
+
+
+@pytest.fixture(autouse=True)
+def cache():
+    A_GIS.Code.Parse.clear()
+    limit = A_GIS.Code.Parse.get_stats()._max_bytes
+    yield
+    A_GIS.Code.Parse.configure(max_bytes=limit)
+    A_GIS.Code.Parse.clear()
+
+
+def test_same_code_is_parsed_once():
+    tree = A_GIS.Code.Parse.get(code=CODE)
+    assert isinstance(tree, ast.Module)
+    assert A_GIS.Code.Parse.get(code=CODE) is tree
+    stats = A_GIS.Code.Parse.get_stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_kinds_are_cached_separately():
+    import libcst
+
+    tree = A_GIS.Code.Parse.get(code=CODE, kind="cst")
+    assert isinstance(tree, libcst.Module)
+    assert tree.code == CODE
+    A_GIS.Code.Parse.get(code=CODE)
+    assert A_GIS.Code.Parse.get_stats().entries == 2
+    with pytest.raises(ValueError):
+        A_GIS.Code.Parse.get(code=CODE, kind="tokens")
+
+
+def test_units_share_the_tree():
+    A_GIS.Code.Tree.get(code=CODE)
+    A_GIS.Code.distill(code=CODE)
+    stats = A_GIS.Code.Parse.get_stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_distill_leaves_the_cached_tree_alone():
+    tree = A_GIS.Code.Parse.get(code=CODE)
+    before = ast.dump(tree)
+    assert "Say hello" not in A_GIS.Code.distill(code=CODE)
+    assert ast.dump(tree) == before
+
+
+def test_least_recently_used_is_evicted():
+    codes = [f"x = {i}\n" for i in range(3)]
+    size = len(codes[0]) * A_GIS.Code.Parse._Cache.bytes_per_byte
+    A_GIS.Code.Parse.configure(max_bytes=2 * size)
+    A_GIS.Code.Parse.get(code=codes[0])
+    A_GIS.Code.Parse.get(code=codes[1])
+    A_GIS.Code.Parse.get(code=codes[0])
+    A_GIS.Code.Parse.get(code=codes[2])
+    stats = A_GIS.Code.Parse.get_stats()
+    assert stats.evictions == 1
+    assert stats.bytes == 2 * size
+    A_GIS.Code.Parse.get(code=codes[0])
+    assert A_GIS.Code.Parse.get_stats().hits == 2
+
+
+def test_syntax_errors_are_not_cached():
+    with pytest.raises(SyntaxError):
+        A_GIS.Code.Parse.get(code="def (")
+    assert A_GIS.Code.Parse.get_stats().entries == 0
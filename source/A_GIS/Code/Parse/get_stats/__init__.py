@@ -0,0 +1,31 @@
+def get_stats():
+    """Return the counters and size of the parse cache.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - hits (int): Trees handed out from the cache.
+            - misses (int): Trees that had to be parsed.
+            - hit_rate (float): The fraction of hits, or 0 without lookups.
+            - evictions (int): Trees dropped to stay within the limit.
+            - entries (int): Trees in the cache.
+            - bytes (int): Estimated size of the cached trees.
+            - _max_bytes (int): The size limit.
+    """
+    import A_GIS.Code.Parse._Cache
+    import A_GIS.Code.make_struct
+
+    cache = A_GIS.Code.Parse._Cache
+    cache()
+    with cache.lock:
+        lookups = cache.hits + cache.misses
+        return A_GIS.Code.make_struct(
+            hits=cache.hits,
+            misses=cache.misses,
+            hit_rate=cache.hits / lookups if lookups else 0.0,
+            evictions=cache.evictions,
+            entries=len(cache.entries),
+            bytes=cache.bytes,
+            _max_bytes=cache.max_bytes,
+        )
@@ -0,0 +1,66 @@
+import importlib
+import sys
+import types
+
+class _LazyPackage(types.ModuleType):
+    """Package module that imports its children on first attribute access.
+
+    Package `__init__.py` files written by `A_GIS.Code.Tree.update` with
+    `lazy=True` only declare their children and call `_LazyPackage.install`,
+    so `import A_GIS` does not import every functional unit up front.
+    Function and class units are bound to the object they define, exactly
+    like the eager `from .x import x` form.
+    """
+
+    def __getattr__(self, name):
+        children = self.__dict__.get("_children", {})
+        if name not in children:
+            raise AttributeError(
+                f"module {self.__name__!r} has no attribute {name!r}"
+            )
+
+        # Importing the child binds it on this package through __setattr__.
+        module = importlib.import_module(f"{self.__name__}.{name}")
+        if name not in self.__dict__:
+            setattr(self, name, module)
+        return self.__dict__[name]
+
+    def __setattr__(self, name, value):
+        # The import system binds a child module to its parent package, which
+        # would shadow the function or class the unit defines.
+        kind = self.__dict__.get("_children", {}).get(name)
+        if (
+            kind in ("function", "class")
+            and isinstance(value, types.ModuleType)
+            and value.__name__ == f"{self.__name__}.{name}"
+        ):
+            value = getattr(value, name, value)
+        super().__setattr__(name, value)
+
+    def __dir__(self):
+        children = self.__dict__.get("_children", {})
+        return sorted(set(super().__dir__()) | set(children))
+
+    @staticmethod
+    def install(
+        *,
+        name: str,
+        functions: tuple[str, ...] = (),
+        classes: tuple[str, ...] = (),
+        packages: tuple[str, ...] = (),
+    ):
+        """Turn the already imported package `name` into a lazy package."""
+        module = sys.modules[name]
+        children = {}
+        children.update({x: "function" for x in functions})
+        children.update({x: "class" for x in classes})
+        children.update({x: "package" for x in packages})
+        module._children = children
+        module.__class__ = _LazyPackage
+
+        # Children imported before the switch are still bound as modules.
+        for child in children:
+            if child in module.__dict__:
+                setattr(module, child, module.__dict__[child])
+
+        return module
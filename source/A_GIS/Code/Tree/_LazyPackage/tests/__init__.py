@@ -0,0 +1,76 @@
+"""Tests for lazy-loading package modules."""
+
+import A_GIS.Code.Tree._LazyPackage
+import importlib
+import pathlib
+import sys
+import pytest
+
+
+def _write_package(root: pathlib.Path, name: str):
+    """Write a small lazy package with one function and one sub-package."""
+    package = root / name
+    (package / "greet").mkdir(parents=True)
+    (package / "Sub").mkdir()
+    (package / "__init__.py").write_text(
+        '"""Lazy test package."""\n'
+        "import A_GIS.Code.Tree._LazyPackage\n"
+        "A_GIS.Code.Tree._LazyPackage.install(\n"
+        "    name=__name__,\n"
+        '    functions=["greet"],\n'
+        '    packages=["Sub"],\n'
+        ")\n"
+    )
+    (package / "greet" / "__init__.py").write_text(
+        'def greet(*, name):\n    return f"hello {name}"\n'
+    )
+    (package / "Sub" / "__init__.py").write_text('"""Sub package."""\n')
+
+
+@pytest.fixture
+def lazy_package(tmp_path, monkeypatch):
+    name = "_lazy_package_under_test"
+    _write_package(tmp_path, name)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    for module in list(sys.modules):
+        if module.startswith(name):
+            del sys.modules[module]
+
+
+def test_children_not_imported_up_front(lazy_package):
+    package = importlib.import_module(lazy_package)
+    assert isinstance(package, A_GIS.Code.Tree._LazyPackage)
+    assert f"{lazy_package}.greet" not in sys.modules
+    assert f"{lazy_package}.Sub" not in sys.modules
+
+
+def test_attribute_access_imports_function(lazy_package):
+    package = importlib.import_module(lazy_package)
+    assert package.greet(name="a") == "hello a"
+    assert f"{lazy_package}.greet" in sys.modules
+    assert package.Sub.__name__ == f"{lazy_package}.Sub"
+
+
+def test_submodule_import_binds_function(lazy_package):
+    importlib.import_module(f"{lazy_package}.greet")
+    package = sys.modules[lazy_package]
+    assert callable(package.greet)
+    assert package.greet(name="b") == "hello b"
+
+
+def test_dir_lists_children(lazy_package):
+    package = importlib.import_module(lazy_package)
+    assert {"greet", "Sub"} <= set(dir(package))
+    assert f"{lazy_package}.greet" not in sys.modules
+
+
+def test_unknown_attribute(lazy_package):
+    package = importlib.import_module(lazy_package)
+    with pytest.raises(AttributeError):
+        package.missing
+
+
+def test_installer_name_is_not_exported(lazy_package):
+    package = importlib.import_module(lazy_package)
+    assert "_LazyPackage" not in dir(package)
@@ -1,50 +1,74 @@
-import libcst
+import ast
 
-class _Visitor(libcst.CSTVisitor):
-    def __init__(self, root):
+class _Visitor(ast.NodeVisitor):
+    """Collect the functions and classes of a module as `_Tree` nodes.
+
+    The body of every node is sliced from the source lines, from its first
+    decorator to its last line, without the indentation of the definition,
+    so nothing is rendered again.
+    The hash of a node is computed with `A_GIS.Code.Tree._get_hash` after
+    its children, so it covers their hashes.
+    """
+
+    def __init__(self, root, code=""):
         self.stack = [root]
         self.structure = {}
+        self.lines = code.splitlines(keepends=True)
         # Keep track of the current position in the hierarchy
         self.current_structure = self.structure
 
     def visit_Any(self, type, node):
         import A_GIS.Code.Tree._Tree
-        import A_GIS.Text.hash
+        import A_GIS.Code.Tree._get_hash
 
-        name = node.name.value
+        name = node.name
         self.stack.append(name)
 
         original_structure = self.current_structure
 
-        code = libcst.Module([node]).code
-        self.current_structure[name] = A_GIS.Code.Tree._Tree(
+        # Remove only the indentation of the definition itself, so lines
+        # that are indented less, e.g. inside multi-line strings, are kept.
+        start = min([node.lineno] + [x.lineno for x in node.decorator_list])
+        indent = node.col_offset
+        code = "".join(
+            (
+                line[indent:]
+                if line[:indent].isspace() and len(line) > indent
+                else line
+            )
+            for line in self.lines[start - 1 : node.end_lineno]
+        )
+        tree = A_GIS.Code.Tree._Tree(
             **{
                 "_type": type,
                 "file": self.current_file,
                 "name": name,
                 "full_name": ".".join(self.stack),
                 "body": code,
-                "hash": A_GIS.Text.hash(text=code),
+                "hash": None,
                 "children": {},
             }
         )
+        self.current_structure[name] = tree
 
         # Move into the class's scope in the hierarchy
-        self.current_structure = self.current_structure[name].children
-        for element in node.body.body:
+        self.current_structure = tree.children
+        for element in node.body:
             if isinstance(
-                element, (libcst.FunctionDef, libcst.ClassDef)
+                element, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
             ):  # Extendable to other types
-                element.visit(self)
+                self.visit(element)
+        tree.hash = A_GIS.Code.Tree._get_hash(tree=tree)
 
         # Restore the structure back to the parent's scope after finishing with
         # the class
         self.current_structure = original_structure
         self.stack.pop()
-        return False
 
-    def visit_FunctionDef(self, node: libcst.FunctionDef) -> None:
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         return self.visit_Any("function", node)
 
-    def visit_ClassDef(self, node: libcst.ClassDef) -> None:
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
         return self.visit_Any("class", node)
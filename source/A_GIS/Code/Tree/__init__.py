@@ -1,16 +1,29 @@
 """
 """
-# Functions
-from .get import get
-from .init import init
-from .init_from_file import init_from_file
-from .print import print
-from .recurse import recurse
-from .to_json import to_json
-from .to_string import to_string
-from .update import update
-from .update_path_to_package import update_path_to_package
+from ._LazyPackage import _LazyPackage
 
-# Classes
-from ._Tree import _Tree
-from ._Visitor import _Visitor
+_LazyPackage.install(
+    name=__name__,
+    functions=[
+        "_get_hash",
+        "_get_install_code",
+        "_get_update_path",
+        "diff",
+        "from_json",
+        "get",
+        "init",
+        "init_from_file",
+        "init_from_path",
+        "print",
+        "recurse",
+        "to_json",
+        "to_string",
+        "update",
+        "update_path_to_package",
+    ],
+    classes=[
+        "_LazyPackage",
+        "_Tree",
+        "_Visitor",
+    ],
+)
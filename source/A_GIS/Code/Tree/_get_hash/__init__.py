@@ -0,0 +1,16 @@
+def _get_hash(*, tree: type["A_GIS.Code.Tree._Tree"]) -> str:
+    """Return the Merkle hash of a tree node from its children's hashes.
+
+    The SHA-256 covers the type, the name and the body of the node, and the
+    name and hash of every child in sorted order. The children must already
+    have their hashes, so a whole tree is hashed bottom-up in one pass, and
+    two nodes with the same hash have the same subtree.
+    """
+    import hashlib
+
+    h = hashlib.sha256()
+    h.update(f"{tree._type}\n{tree.name}\n".encode("utf-8"))
+    h.update(hashlib.sha256(tree.body.encode("utf-8")).digest())
+    for name in sorted(tree.children):
+        h.update(f"\n{name}\n{tree.children[name].hash}".encode("utf-8"))
+    return h.hexdigest()
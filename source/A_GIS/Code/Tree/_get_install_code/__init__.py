@@ -0,0 +1,39 @@
+def _get_install_code(
+    *,
+    installer: str = "A_GIS.Code.Tree._LazyPackage",
+    functions: list[str] = [],
+    classes: list[str] = [],
+    packages: list[str] = [],
+) -> str:
+    """Return the `install` call of a lazy package `__init__.py`.
+
+    `A_GIS.Code.Tree.update` writes it and
+    `A_GIS.Code.Tree.update_path_to_package` rewrites it with a new child,
+    so both produce the same text. Empty lists are left out.
+
+    Args:
+        installer (str, optional):
+            How the package refers to `A_GIS.Code.Tree._LazyPackage`.
+            Defaults to its full name.
+        functions (list[str], optional):
+            The function units of the package.
+        classes (list[str], optional):
+            The class units of the package.
+        packages (list[str], optional):
+            The sub-packages of the package.
+
+    Returns:
+        str:
+            The call, ending with a newline.
+    """
+    code = f"{installer}.install(\n    name=__name__,\n"
+    for keyword, names in (
+        ("functions", functions),
+        ("classes", classes),
+        ("packages", packages),
+    ):
+        if len(names) > 0:
+            code += f"    {keyword}=[\n"
+            code += "".join(f'        "{x}",\n' for x in sorted(set(names)))
+            code += "    ],\n"
+    return code + ")\n"
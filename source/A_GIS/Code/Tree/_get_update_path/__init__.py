@@ -0,0 +1,5 @@
+def _get_update_path(*, root: type["pathlib.Path"]) -> type["pathlib.Path"]:
+    """Return the path of the incremental update state for a package root."""
+    import pathlib
+
+    return pathlib.Path(root) / "update.json"
@@ -0,0 +1,57 @@
+def diff(
+    *,
+    old: type["A_GIS.Code.Tree._Tree"],
+    new: type["A_GIS.Code.Tree._Tree"],
+):
+    """Find what changed between two trees by comparing Merkle hashes.
+
+    The trees are walked top-down together. A subtree with the same hash in
+    both is the same and is not looked into, so comparing two versions of
+    a package only visits the path to what actually changed. Both trees
+    need Merkle hashes, as made by `A_GIS.Code.Tree.init`,
+    `A_GIS.Code.Tree.init_from_path` or loaded with
+    `A_GIS.Code.Tree.from_json`.
+
+    Args:
+        old (A_GIS.Code.Tree._Tree): The earlier tree, e.g. a snapshot.
+        new (A_GIS.Code.Tree._Tree): The later tree, e.g. the working copy.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - changed (list[str]): Full names of the nodes in both trees
+              whose hash differs, parents before their children.
+            - added (list[str]): Full names of the nodes only in `new`.
+            - removed (list[str]): Full names of the nodes only in `old`.
+            - visited (int): The number of node pairs compared.
+    """
+    import A_GIS.Code.make_struct
+    import collections
+
+    changed = []
+    added = []
+    removed = []
+    visited = 0
+
+    pending = collections.deque([(old, new)])
+    while pending:
+        a, b = pending.popleft()
+        visited += 1
+        if a.hash == b.hash:
+            continue
+        changed.append(b.full_name)
+        for name in sorted(set(a.children) | set(b.children)):
+            if name not in b.children:
+                removed.append(a.children[name].full_name)
+            elif name not in a.children:
+                added.append(b.children[name].full_name)
+            else:
+                pending.append((a.children[name], b.children[name]))
+
+    return A_GIS.Code.make_struct(
+        changed=changed,
+        added=added,
+        removed=removed,
+        visited=visited,
+    )
@@ -0,0 +1,93 @@
+import A_GIS.Code.Tree.diff
+import A_GIS.Code.Tree.from_json
+import A_GIS.Code.Tree.init
+import A_GIS.Code.Tree.init_from_path
+import A_GIS.Code.Tree.to_json
+
+
+def _make_package(root):
+    (root / "Sub").mkdir(parents=True)
+    (root / "__init__.py").write_text('"""Pkg.\n"""\n')
+    (root / "Sub" / "__init__.py").write_text('"""Sub.\n"""\n')
+    for folder, name in [(root, "greet"), (root / "Sub", "other")]:
+        (folder / name).mkdir()
+        (folder / name / "__init__.py").write_text(
+            f"def {name}():\n    return 1\n"
+        )
+    (root / "Shape").mkdir()
+    (root / "Shape" / "__init__.py").write_text(
+        "class Shape:\n"
+        "    @property\n"
+        "    def area(self):\n"
+        "        return 0\n\n"
+        "    def scale(self):\n"
+        "        return self\n"
+    )
+
+
+def test_hashes_cover_children():
+    code = "class A:\n    def f(self):\n        return 1\n"
+    tree = A_GIS.Code.Tree.init(code=code, _type="class", name="A")
+    a = tree.children["A"]
+    assert a.children["f"].body == "def f(self):\n    return 1\n"
+    changed = A_GIS.Code.Tree.init(
+        code=code.replace("1", "2"), _type="class", name="A"
+    )
+    assert changed.hash != tree.hash
+    assert changed.children["A"].hash != a.hash
+
+
+def test_string_contents_are_not_dedented():
+    code = 'class A:\n    def f(self):\n        return """\nx\n  y"""\n'
+    tree = A_GIS.Code.Tree.init(code=code, _type="class", name="A")
+    f = tree.children["A"].children["f"]
+    assert f.body == 'def f(self):\n    return """\nx\n  y"""\n'
+
+
+def test_decorators_are_part_of_the_body(tmp_path):
+    _make_package(tmp_path / "Pkg")
+    tree = A_GIS.Code.Tree.init_from_path(path=tmp_path / "Pkg")
+    area = tree.children["Shape"].children["Shape"].children["area"]
+    assert area.body.startswith("@property\ndef area(self):")
+    assert area.full_name == "Pkg.Shape.Shape.area"
+
+
+def test_unchanged_subtrees_are_pruned(tmp_path):
+    root = tmp_path / "Pkg"
+    _make_package(root)
+    old = A_GIS.Code.Tree.init_from_path(path=root)
+    same = A_GIS.Code.Tree.diff(old=old, new=old)
+    assert same.changed == [] and same.visited == 1
+
+    (root / "Sub" / "other" / "__init__.py").write_text(
+        "def other():\n    return 2\n"
+    )
+    new = A_GIS.Code.Tree.init_from_path(path=root)
+    result = A_GIS.Code.Tree.diff(old=old, new=new)
+    assert result.changed == [
+        "Pkg",
+        "Pkg.Sub",
+        "Pkg.Sub.other",
+        "Pkg.Sub.other.other",
+    ]
+    assert result.added == [] and result.removed == []
+    assert result.visited == 6
+
+
+def test_snapshot_round_trip(tmp_path):
+    root = tmp_path / "Pkg"
+    _make_package(root)
+    old = A_GIS.Code.Tree.init_from_path(path=root)
+    snapshot = A_GIS.Code.Tree.from_json(text=old.to_json())
+    assert snapshot.hash == old.hash
+    assert A_GIS.Code.Tree.diff(old=snapshot, new=old).changed == []
+
+    (root / "greet" / "__init__.py").write_text(
+        "def greet():\n    return 1\n\n\ndef helper():\n    pass\n"
+    )
+    (root / "Shape" / "__init__.py").unlink()
+    (root / "Shape").rmdir()
+    new = A_GIS.Code.Tree.init_from_path(path=root)
+    result = A_GIS.Code.Tree.diff(old=snapshot, new=new)
+    assert result.added == ["Pkg.greet.helper"]
+    assert result.removed == ["Pkg.Shape"]
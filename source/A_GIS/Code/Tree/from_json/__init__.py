@@ -0,0 +1,20 @@
+def from_json(*, text: str) -> type["A_GIS.Code.Tree._Tree"]:
+    """Load a tree saved with `A_GIS.Code.Tree.to_json`.
+
+    The stored hashes are kept as they are, so a snapshot can be compared
+    with a new tree by `A_GIS.Code.Tree.diff` without hashing it again.
+
+    Args:
+        text (str): The JSON text of the tree.
+
+    Returns:
+        A_GIS.Code.Tree._Tree: The tree, with `file` as a string.
+    """
+    import A_GIS.Code.Tree._Tree
+    import json
+
+    def build(data):
+        children = {k: build(v) for k, v in data["children"].items()}
+        return A_GIS.Code.Tree._Tree(**{**data, "children": children})
+
+    return build(json.loads(text))
@@ -36,6 +36,7 @@ def get(
             its value being another dictionary containing its type
             (`_type`) and any nested structures.
     """
+    import A_GIS.Code.Parse.get
     import ast
 
     class __HierarchyVisitor(ast.NodeVisitor):
@@ -66,7 +67,10 @@ def get(
                 self.visit(child_node)
             self.current_scope = previous_scope
 
-    nodes = ast.parse(code)
+        # Coroutine functions are units like any other function.
+        visit_AsyncFunctionDef = visit_FunctionDef
+
+    nodes = A_GIS.Code.Parse.get(code=code)
     hierarchy_visitor = __HierarchyVisitor()
     hierarchy_visitor.visit(nodes)
 
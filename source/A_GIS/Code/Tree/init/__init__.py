@@ -5,8 +5,12 @@ def init(*, code: str, _type="", file="", name="", full_name="", root=""):
     the provided source code to populate its children attribute using a visitor pattern. The
     visitor pattern provides a way to build a new representation of the information in the
     syntax tree. It separates the algorithm for traversing the data structure from the data
-    structure itself. This function uses the `libcst` library, which is a parsing framework that
-    helps Python developers to write flexible and robust code analysis tools.
+    structure itself. The code is parsed with `ast`, through the shared
+    `A_GIS.Code.Parse.get` cache.
+
+    The hash of every node is a Merkle hash from `A_GIS.Code.Tree._get_hash`,
+    computed bottom-up in the same pass, so the hash of the returned tree
+    covers the hashes of all its functions and classes.
 
     Args:
         code (str): The source code to be analyzed.
@@ -23,24 +27,26 @@ def init(*, code: str, _type="", file="", name="", full_name="", root=""):
         Tree: An instance of the `Tree` class representing the initialized code structure.
     """
 
+    import A_GIS.Code.Parse.get
     import A_GIS.Code.Tree._Tree
     import A_GIS.Code.Tree._Visitor
-    import A_GIS.Text.hash
-    import libcst
+    import A_GIS.Code.Tree._get_hash
 
     # Do the work.
-    visitor = A_GIS.Code.Tree._Visitor(root=root)
-    tree = libcst.parse_module(code)
+    visitor = A_GIS.Code.Tree._Visitor(root=root, code=code)
+    tree = A_GIS.Code.Parse.get(code=code)
     visitor.current_file = file
-    tree.visit(visitor)
+    visitor.visit(tree)
 
     # Populate the data structure.
-    return A_GIS.Code.Tree._Tree(
+    tree = A_GIS.Code.Tree._Tree(
         _type=_type,
         file=file,
         name=name,
         full_name=full_name,
         body=code,
-        hash=A_GIS.Text.hash(text=code),
+        hash=None,
         children=visitor.structure,
     )
+    tree.hash = A_GIS.Code.Tree._get_hash(tree=tree)
+    return tree
@@ -0,0 +1,76 @@
+def init_from_path(
+    *,
+    path: type["pathlib.Path"],
+    ignore_list: set[str] = {"tests"},
+    _full_name: str = None,
+):
+    """Initialize a tree for a whole package directory.
+
+    The package and its sub-packages become "package" nodes, whose body is
+    their `__init__.py`, and every unit directory becomes a node from
+    `A_GIS.Code.Tree.init` with its functions and classes. Directories are
+    found like `A_GIS.Code.Tree.recurse` does. Every hash is a Merkle hash
+    from `A_GIS.Code.Tree._get_hash`, computed bottom-up in this single
+    pass, so the hash of the package covers everything below it. Save the
+    result with `A_GIS.Code.Tree.to_json`, load it back with
+    `A_GIS.Code.Tree.from_json` and compare two trees with
+    `A_GIS.Code.Tree.diff`.
+
+    Args:
+        path (pathlib.Path):
+            The package directory.
+        ignore_list (set[str], optional):
+            Directory names to skip. Defaults to `{"tests"}`.
+        _full_name (str, optional):
+            The dotted name of the package, used by the recursive calls.
+            Defaults to the directory name.
+
+    Returns:
+        A_GIS.Code.Tree._Tree: The tree of the package.
+    """
+    import A_GIS.Code.Tree._Tree
+    import A_GIS.Code.Tree._get_hash
+    import A_GIS.Code.Tree.get
+    import A_GIS.Code.Tree.init
+    import A_GIS.Code.guess_type
+    import A_GIS.File.read
+    import pathlib
+
+    path = pathlib.Path(path)
+    full_name = path.name if _full_name is None else _full_name
+
+    children = {}
+    for entry in sorted(path.iterdir()):
+        if entry.name in ignore_list or entry.name.startswith("__"):
+            continue
+        file = entry / "__init__.py"
+        if not entry.is_dir() or not file.exists():
+            continue
+        code = A_GIS.File.read(file=file)
+        child_name = f"{full_name}.{entry.name}"
+        if A_GIS.Code.Tree.get(code=code) == {}:
+            children[entry.name] = init_from_path(
+                path=entry, ignore_list=ignore_list, _full_name=child_name
+            )
+        else:
+            children[entry.name] = A_GIS.Code.Tree.init(
+                code=code,
+                _type=A_GIS.Code.guess_type(code=code, filename=file.name),
+                file=file,
+                name=entry.name,
+                full_name=child_name,
+                root=child_name,
+            )
+
+    file = path / "__init__.py"
+    tree = A_GIS.Code.Tree._Tree(
+        _type="package",
+        file=file,
+        name=path.name,
+        full_name=full_name,
+        body=A_GIS.File.read(file=file) if file.exists() else "",
+        hash=None,
+        children=children,
+    )
+    tree.hash = A_GIS.Code.Tree._get_hash(tree=tree)
+    return tree
@@ -1,4 +1,12 @@
-def update(*, tree: dict):
+def update(
+    *,
+    tree: dict,
+    lazy: bool = True,
+    root: type["pathlib.Path"] = None,
+    incremental: bool = True,
+    max_workers: int = None,
+    _state: dict = None,
+):
     """Update the code structure represented by a dictionary.
 
     This function recursively updates the code structure provided in
@@ -8,16 +16,153 @@ def update(*, tree: dict):
     existing docstring. For individual files (non-package), it reformats
     the code and writes it back to the file.
 
+    With `lazy` enabled, package files do not import their children
+    directly. They declare them through
+    `A_GIS.Code.Tree._LazyPackage.install` instead, so each child is only
+    imported on first attribute access. The packages that contain
+    `A_GIS.Code.Tree._LazyPackage` import it under an alias, which they
+    delete again, as they are still being imported when it runs, and
+    `A_GIS.Code.Tree` imports it as the class it lists anyway.
+
+    Incremental updates keep the modification time, size and SHA-256 of
+    every file they wrote in `update.json`, next to the root package
+    `__init__.py`, together with the versions of autopep8 and black and a
+    hash of the source of `A_GIS.Code.reformat`. A unit file is
+    reformatted only when its content differs from what the last update
+    left, and all of them when the formatters changed. A package file is
+    only read when it, or the list of its children, changed, and only
+    written when the generated content differs. Files with the recorded
+    modification time and size are not even read, so an update without
+    changes costs a `stat` per file. The state file is not kept under
+    version control, and an unreadable one is treated as empty.
+
+    The unit files that need reformatting are collected over the whole tree
+    and reformatted at the end by `A_GIS.Code.reformat_files`, in parallel.
+    A file that fails to format is reported in `errors` and left out of the
+    state, so it is tried again by the next update.
+
     Args:
         tree (dict):
             A dictionary representing a code structure. If it contains
             `_type` key with value "package", it is treated as a package
             containing sub-packages, functions, and classes. Each item
             in the tree can be recursively another tree or a file path.
+        lazy (bool, optional):
+            Whether to write lazy-loading package files. Defaults to True.
+        root (pathlib.Path, optional):
+            The package directory whose `update.json` keeps the state of
+            incremental updates. Defaults to the directory of the first
+            package in `tree`.
+        incremental (bool, optional):
+            Whether to skip the files that did not change since the last
+            update. Defaults to True.
+        max_workers (int, optional):
+            The number of processes reformatting the unit files with
+            `A_GIS.Code.reformat_files`. Defaults to one per CPU.
+        _state (dict, optional):
+            The update state shared by the recursive calls.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - reformatted (list[str]): Unit files that were reformatted.
+            - written (list[str]): Files whose content changed.
+            - skipped (int): Files that were unchanged since the last
+              update.
+            - errors (dict): File to error message of the unit files that
+              could not be reformatted. They are left as they are.
+            - slowest (list[tuple]): The unit files that took the longest
+              to reformat, as `(seconds, file)`.
     """
-    import A_GIS.File.write
-    import A_GIS.File.read
+    import A_GIS.Code.make_struct
+    import A_GIS.Code.parse_docstring
     import A_GIS.Code.reformat
+    import A_GIS.Code.reformat_files
+    import A_GIS.Code.replace_from_imports
+    import A_GIS.Code.Tree._LazyPackage
+    import A_GIS.Code.Tree._get_install_code
+    import A_GIS.Code.Tree._get_update_path
+    import A_GIS.File.read
+    import A_GIS.File.write
+    import hashlib
+    import json
+    import os
+    import pathlib
+    import sys
+
+    # Load the state of the last update on the outermost call.
+    top = _state is None
+    if top:
+        if root is None:
+            files = [tree.get("_file")] + [
+                x.get("_file") for x in tree.values() if isinstance(x, dict)
+            ]
+            files = [x for x in files if x is not None]
+            root = pathlib.Path(files[0]).parent if files else None
+        _state = {
+            "path": None,
+            "files": {},
+            "seen": {},
+            "pending": [],
+            "reformatted": [],
+            "written": [],
+            "skipped": 0,
+        }
+        if root is not None:
+            import importlib.metadata
+
+            formatter = []
+            for name in ("reformat", "replace_from_imports"):
+                with open(sys.modules[f"A_GIS.Code.{name}"].__file__) as f:
+                    formatter.append(f.read())
+            for name in ("autopep8", "black"):
+                try:
+                    formatter.append(importlib.metadata.version(name))
+                except importlib.metadata.PackageNotFoundError:
+                    formatter.append("")
+            _state["formatter"] = hashlib.sha256(
+                "\n".join(formatter).encode()
+            ).hexdigest()
+            _state["path"] = A_GIS.Code.Tree._get_update_path(root=root)
+            if incremental and _state["path"].exists():
+                # An unreadable state only costs a full update.
+                try:
+                    with open(_state["path"], "r") as f:
+                        stored = json.load(f)
+                except (ValueError, OSError):
+                    stored = {}
+                if not isinstance(stored, dict):
+                    stored = {}
+                if stored.get("formatter") == _state["formatter"]:
+                    _state["files"] = stored.get("files", {})
+
+    def unchanged(file, key=None):
+        # Whether the file is as the last update left it.
+        entry = _state["files"].get(file)
+        if entry is None or entry.get("key") != key:
+            return False
+        stat = os.stat(file)
+        if (
+            entry["mtime_ns"] != stat.st_mtime_ns
+            or entry["size"] != stat.st_size
+        ):
+            return False
+        _state["seen"][file] = entry
+        _state["skipped"] += 1
+        return True
+
+    def record(file, content, key=None, written=False):
+        if written:
+            A_GIS.File.write(content=content, file=file)
+            _state["written"].append(file)
+        stat = os.stat(file)
+        _state["seen"][file] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": hashlib.sha256(content.encode()).hexdigest(),
+            "key": key,
+        }
 
     imports = None
     is_package = False
@@ -36,24 +181,99 @@ def update(*, tree: dict):
             elif tree[name]["_type"] == "class":
                 imports["Classes"].append(f"from .{name} import {name}")
 
-        update(tree=tree[name])
+        update(tree=tree[name], lazy=lazy, _state=_state)
 
     if is_package:
-        existing = A_GIS.File.read(file=tree["_file"])
-        docstring = (
-            A_GIS.Code.parse_docstring(code=existing, clean=False) or ""
-        )
-        code = f'"""{docstring}\n"""\n'
-        first = True
-        for k, v in imports.items():
-            if len(v) > 0:
-                if not first:
-                    code += "\n"
-                first = False
-                code += "# {}\n{}\n".format(k, "\n".join(sorted(v)))
-        A_GIS.File.write(content=code, file=tree["_file"])
+        file = tree["_file"]
+
+        # The packages above the installer are still being imported when it
+        # runs, so they can not reach it by its full name yet, and its own
+        # package lists it as a class anyway.
+        header = "import A_GIS.Code.Tree._LazyPackage\n\n"
+        installer = "A_GIS.Code.Tree._LazyPackage"
+        installer_file = pathlib.Path(
+            sys.modules["A_GIS.Code.Tree._LazyPackage"].__file__
+        ).resolve()
+        directory = pathlib.Path(file).resolve().parent
+        if directory == installer_file.parents[1]:
+            header = "from ._LazyPackage import _LazyPackage\n\n"
+            installer = "_LazyPackage"
+        elif directory in installer_file.parents:
+            header = "import A_GIS.Code.Tree._LazyPackage as _installer\n\n"
+            installer = "_installer"
+        key = hashlib.sha256(
+            json.dumps([lazy, header, imports], sort_keys=True).encode()
+        ).hexdigest()
+        if not unchanged(file, key):
+            existing = A_GIS.File.read(file=file)
+            docstring = (
+                A_GIS.Code.parse_docstring(code=existing, clean=False) or ""
+            )
+            code = f'"""{docstring}\n"""\n'
+            if lazy:
+                code += header
+                code += A_GIS.Code.Tree._get_install_code(
+                    installer=installer,
+                    **{
+                        k.lower(): [x.split(" ")[-1] for x in v]
+                        for k, v in imports.items()
+                    },
+                )
+                if installer == "_installer":
+                    code += "del _installer\n"
+            else:
+                first = True
+                for k, v in imports.items():
+                    if len(v) > 0:
+                        if not first:
+                            code += "\n"
+                        first = False
+                        code += "# {}\n{}\n".format(k, "\n".join(sorted(v)))
+            record(file, code, key, written=code != existing)
     elif "_file" in tree:
-        code = A_GIS.File.read(file=tree["_file"])
-        A_GIS.File.write(
-            content=A_GIS.Code.reformat(code=code), file=tree["_file"]
+        file = tree["_file"]
+        if not unchanged(file):
+            code = A_GIS.File.read(file=file)
+            entry = _state["files"].get(file)
+            if (
+                entry is not None
+                and entry.get("key") is None
+                and entry["hash"] == hashlib.sha256(code.encode()).hexdigest()
+            ):
+                # Only touched, the content is still formatted.
+                _state["skipped"] += 1
+                record(file, code)
+            else:
+                _state["pending"].append(file)
+
+    # Reformat the changed unit files together, in parallel.
+    errors = {}
+    slowest = []
+    if top and _state["pending"]:
+        result = A_GIS.Code.reformat_files(
+            files=_state["pending"], max_workers=max_workers, write=False
         )
+        for x in result.results:
+            if x["error"] is None:
+                _state["reformatted"].append(x["file"])
+                record(x["file"], x["formatted"], written=x["changed"])
+        errors = result.errors
+        slowest = result.slowest
+
+    # Keep the state of the files that are still in the tree.
+    if top and _state["path"] is not None:
+        if _state["seen"] != _state["files"] or not _state["path"].exists():
+            content = json.dumps(
+                {"formatter": _state["formatter"], "files": _state["seen"]},
+                indent=1,
+                sort_keys=True,
+            )
+            A_GIS.File.write(content=content + "\n", file=_state["path"])
+
+    return A_GIS.Code.make_struct(
+        reformatted=_state["reformatted"],
+        written=_state["written"],
+        skipped=_state["skipped"],
+        errors=errors,
+        slowest=slowest,
+    )
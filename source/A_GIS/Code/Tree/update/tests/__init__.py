@@ -0,0 +1,122 @@
+import A_GIS.Code.reformat
+import A_GIS.Code.Tree.recurse
+import A_GIS.Code.Tree.update
+import os
+import pytest
+
+
+@pytest.fixture
+def reformatted(monkeypatch):
+    calls = []
+
+    def reformat(*, code):
+        calls.append(code)
+        return code.replace("x=1", "x = 1")
+
+    monkeypatch.setattr(A_GIS.Code, "reformat", reformat)
+    return calls
+
+
+def _make_tree(root):
+    (root / "greet").mkdir(parents=True)
+    (root / "__init__.py").write_text('"""Pkg.\n"""\n')
+    (root / "greet" / "__init__.py").write_text(
+        "def greet():\n    x=1\n    return x\n"
+    )
+    (root / "other").mkdir()
+    (root / "other" / "__init__.py").write_text("def other():\n    pass\n")
+
+
+def _update(root, **kwargs):
+    tree = A_GIS.Code.Tree.recurse(path=root)
+    return A_GIS.Code.Tree.update(tree=tree, max_workers=1, **kwargs)
+
+
+def test_second_update_skips_everything(tmp_path, reformatted):
+    root = tmp_path / "Pkg"
+    _make_tree(root)
+    first = _update(root)
+    assert len(first.reformatted) == 2
+    assert "x = 1" in (root / "greet" / "__init__.py").read_text()
+    assert (root / "update.json").exists()
+    package = (root / "__init__.py").read_text()
+    assert '"greet",' in package
+
+    reformatted.clear()
+    second = _update(root)
+    assert reformatted == []
+    assert second.written == []
+    assert second.skipped == 3
+    assert (root / "__init__.py").read_text() == package
+
+
+def test_only_changed_unit_is_reformatted(tmp_path, reformatted):
+    root = tmp_path / "Pkg"
+    _make_tree(root)
+    _update(root)
+    (root / "other" / "__init__.py").write_text(
+        "def other():\n    x=1\n    return x\n"
+    )
+    reformatted.clear()
+    result = _update(root)
+    assert result.reformatted == [str(root / "other" / "__init__.py")]
+    assert result.written == [str(root / "other" / "__init__.py")]
+
+
+def test_touched_file_is_not_reformatted(tmp_path, reformatted):
+    root = tmp_path / "Pkg"
+    _make_tree(root)
+    _update(root)
+    file = root / "greet" / "__init__.py"
+    os.utime(file, ns=(0, 0))
+    reformatted.clear()
+    result = _update(root)
+    assert reformatted == []
+    assert result.skipped == 3
+
+
+def test_new_unit_rewrites_package(tmp_path, reformatted):
+    root = tmp_path / "Pkg"
+    _make_tree(root)
+    _update(root)
+    (root / "third").mkdir()
+    (root / "third" / "__init__.py").write_text("def third():\n    pass\n")
+    result = _update(root)
+    assert str(root / "__init__.py") in result.written
+    assert '"third",' in (root / "__init__.py").read_text()
+
+
+def test_not_incremental_reformats_all(tmp_path, reformatted):
+    root = tmp_path / "Pkg"
+    _make_tree(root)
+    _update(root)
+    reformatted.clear()
+    _update(root, incremental=False)
+    assert len(reformatted) == 2
+
+
+def test_failed_unit_is_retried(tmp_path, monkeypatch):
+    root = tmp_path / "Pkg"
+    _make_tree(root)
+
+    def reformat(*, code):
+        raise SyntaxError("cannot format")
+
+    monkeypatch.setattr(A_GIS.Code, "reformat", reformat)
+    first = _update(root)
+    assert len(first.errors) == 2
+    assert first.reformatted == []
+    second = _update(root)
+    assert len(second.errors) == 2
+
+
+def test_corrupt_state_is_ignored(tmp_path, reformatted):
+    root = tmp_path / "Pkg"
+    _make_tree(root)
+    _update(root)
+    (root / "update.json").write_text('{"files": ')
+    reformatted.clear()
+    result = _update(root)
+    assert result.skipped == 0
+    assert result.written == []
+    assert '"files": {' in (root / "update.json").read_text()
@@ -5,12 +5,17 @@ def update_path_to_package(
 
     uses A_GIS Unit standards
 
+    A child missing from a lazy package is added to the lists of its
+    `install` call, other packages get an import statement.
     """
 
     import A_GIS.File.touch
     import A_GIS.File.write
     import A_GIS.File.read
     import A_GIS.Code.find_root
+    import A_GIS.Code.Parse.get
+    import A_GIS.Code.Tree._get_install_code
+    import ast
 
     if root is None:
         root = A_GIS.Code.find_root(path=path, throw_if_not_found=True)
@@ -22,13 +27,52 @@ def update_path_to_package(
         A_GIS.File.touch(path=package_file)
         code = A_GIS.File.read(file=package_file)
 
-        # Use A_GIS standards to tell if a function.
-        if child.name[0].islower():
+        # Use A_GIS standards to tell functions, classes and packages apart.
+        if child.name.lstrip("_")[:1].islower():
+            kind = "functions"
             import_statement = "from ." + child.name + " import " + child.name
         else:
+            kind = "classes" if child.name.startswith("_") else "packages"
             import_statement = "from . import " + child.name
 
-        if code.find(import_statement) < 0:
+        # Lazy packages list their children in the install call.
+        install = None
+        if ".install(" in code:
+            for node in ast.walk(A_GIS.Code.Parse.get(code=code)):
+                if (
+                    isinstance(node, ast.Call)
+                    and isinstance(node.func, ast.Attribute)
+                    and node.func.attr == "install"
+                ):
+                    install = node
+                    break
+
+        if install is not None:
+            names = {"functions": [], "classes": [], "packages": []}
+            for keyword in install.keywords:
+                if keyword.arg in names and isinstance(
+                    keyword.value, ast.List
+                ):
+                    names[keyword.arg] = [
+                        x.value
+                        for x in keyword.value.elts
+                        if isinstance(x, ast.Constant)
+                    ]
+            if not any(child.name in x for x in names.values()):
+                names[kind].append(child.name)
+                lines = code.splitlines(keepends=True)
+                code = (
+                    "".join(lines[: install.lineno - 1])
+                    + A_GIS.Code.Tree._get_install_code(
+                        installer=ast.get_source_segment(
+                            code, install.func.value
+                        ),
+                        **names,
+                    )
+                    + "".join(lines[install.end_lineno :])
+                )
+                A_GIS.File.write(content=code, file=package_file)
+        elif code.find(import_statement) < 0:
             code += (
                 "\n\n#Temporary add from A_GIS.Code.Tree.update_path_to_package\n"
                 + import_statement
@@ -0,0 +1,43 @@
+import A_GIS.Code.Tree.update_path_to_package
+import pathlib
+
+
+def _write_lazy_package(path: pathlib.Path, functions: list[str]):
+    listed = "".join(f'        "{x}",\n' for x in functions)
+    path.write_text(
+        '"""Mentions "greet" in the docstring.\n"""\n'
+        "import A_GIS.Code.Tree._LazyPackage\n\n"
+        "A_GIS.Code.Tree._LazyPackage.install(\n"
+        "    name=__name__,\n"
+        f"    functions=[\n{listed}    ],\n"
+        ")\n"
+    )
+
+
+def test_listed_child_is_kept(tmp_path):
+    _write_lazy_package(tmp_path / "__init__.py", ["greet"])
+    before = (tmp_path / "__init__.py").read_text()
+    A_GIS.Code.Tree.update_path_to_package(
+        path=tmp_path / "greet", root=tmp_path
+    )
+    assert (tmp_path / "__init__.py").read_text() == before
+
+
+def test_mentioned_child_is_added(tmp_path):
+    _write_lazy_package(tmp_path / "__init__.py", ["other"])
+    A_GIS.Code.Tree.update_path_to_package(
+        path=tmp_path / "greet", root=tmp_path
+    )
+    code = (tmp_path / "__init__.py").read_text()
+    assert "from .greet import greet" not in code
+    assert '        "greet",\n        "other",\n    ],\n' in code
+    assert code.startswith('"""Mentions "greet" in the docstring.\n"""\n')
+
+
+def test_new_kinds_are_listed(tmp_path):
+    _write_lazy_package(tmp_path / "__init__.py", ["other"])
+    A_GIS.Code.Tree.update_path_to_package(
+        path=tmp_path / "_Shape", root=tmp_path
+    )
+    code = (tmp_path / "__init__.py").read_text()
+    assert '    classes=[\n        "_Shape",\n    ],\n' in code
@@ -1,9 +1,15 @@
 """
 """
-# Functions
-from .check import check
-from .fix import fix
-from .generate import generate
-from .init_from_path import init_from_path
-from .is_path import is_path
-from .to_path import to_path
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "check",
+        "fix",
+        "generate",
+        "init_from_path",
+        "is_path",
+        "to_path",
+    ],
+)
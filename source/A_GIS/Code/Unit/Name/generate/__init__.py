@@ -19,7 +19,7 @@ def generate(
     import A_GIS.Log.append
     import A_GIS.Text.add_indent
     import A_GIS.Code.Unit.Name.fix
-    import A_GIS.Ai.Chatbot.init
+    import A_GIS.Ai.Chatbot.get_session
     import A_GIS.Code.make_struct
 
     # Create a list of examples.
@@ -76,14 +76,14 @@ Be careful about introducing unnecessary hierarchy for synonymous concepts.
 
 """
 
-    chatbot = A_GIS.Ai.Chatbot.init(
+    chatbot = A_GIS.Ai.Chatbot.get_session(
         model=model,
         system=system,
         temperature=temperature,
         num_ctx=10000,
         num_predict=20000,
         mirostat=2,
-    )
+    ).fork()
     x = chatbot.chat(
         message=f"""
 Brainstorm at least 10 names for the following function:
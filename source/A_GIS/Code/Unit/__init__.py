@@ -1,29 +1,35 @@
 """
 """
-# Functions
-from ._check_body_block import _check_body_block
-from ._check_imports import _check_imports
-from ._has_imports import _has_imports
-from ._parse_first_pass import _parse_first_pass
-from ._process_args_name_code import _process_args_name_code
-from ._wrap_single_block import _wrap_single_block
-from .absorb import absorb
-from .calculate_embedding import calculate_embedding
-from .check import check
-from .get import get
-from .get_git_status import get_git_status
-from .move import move
-from .read import read
-from .recommend import recommend
-from .show_nav_tree import show_nav_tree
-from .substitute_imports import substitute_imports
-from .to_string import to_string
-from .touch import touch
+import A_GIS.Code.Tree._LazyPackage
 
-# Classes
-from ._Unit import _Unit
-
-# Packages
-from . import Example
-from . import Name
-from . import Test
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "_check_body_block",
+        "_check_imports",
+        "_has_imports",
+        "_parse_first_pass",
+        "_process_args_name_code",
+        "_wrap_single_block",
+        "absorb",
+        "calculate_embedding",
+        "check",
+        "get",
+        "get_git_status",
+        "move",
+        "read",
+        "recommend",
+        "show_nav_tree",
+        "substitute_imports",
+        "to_string",
+        "touch",
+    ],
+    classes=[
+        "_Unit",
+    ],
+    packages=[
+        "Example",
+        "Name",
+        "Test",
+    ],
+)
@@ -1,36 +1,50 @@
 """Generic functions whose key input/output is a code string.
 """
-# Functions
-from ._distill_imports import _distill_imports
-from .calculate_embedding import calculate_embedding
-from .collect_imports import collect_imports
-from .convert_multiline import convert_multiline
-from .distill import distill
-from .extract_python import extract_python
-from .find_root import find_root
-from .generate import generate
-from .get_schema import get_schema
-from .get_source import get_source
-from .guess_name import guess_name
-from .guess_type import guess_type
-from .highlight import highlight
-from .insert_into_function import insert_into_function
-from .is_class import is_class
-from .is_function import is_function
-from .is_package import is_package
-from .is_program import is_program
-from .list import list
-from .make_struct import make_struct
-from .pack_into_function import pack_into_function
-from .parse_docstring import parse_docstring
-from .reformat import reformat
-from .rename_function import rename_function
-from .replace_docstring import replace_docstring
-from .replace_from_imports import replace_from_imports
-from .split import split
+import A_GIS.Code.Tree._LazyPackage as _installer
 
-# Packages
-from . import CommitMessage
-from . import Docstring
-from . import Tree
-from . import Unit
+_installer.install(
+    name=__name__,
+    functions=[
+        "_distill_imports",
+        "_list_functions",
+        "_reformat_file",
+        "calculate_embedding",
+        "collect_imports",
+        "convert_multiline",
+        "distill",
+        "extract_python",
+        "find_root",
+        "generate",
+        "get_schema",
+        "get_source",
+        "get_struct_type",
+        "guess_name",
+        "guess_type",
+        "highlight",
+        "insert_into_function",
+        "is_class",
+        "is_function",
+        "is_package",
+        "is_program",
+        "list",
+        "make_struct",
+        "pack_into_function",
+        "parse_docstring",
+        "reformat",
+        "reformat_files",
+        "rename_function",
+        "replace_docstring",
+        "replace_from_imports",
+        "split",
+    ],
+    packages=[
+        "CommitMessage",
+        "Docstring",
+        "Import",
+        "Manifest",
+        "Parse",
+        "Tree",
+        "Unit",
+    ],
+)
+del _installer
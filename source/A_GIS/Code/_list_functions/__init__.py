@@ -0,0 +1,31 @@
+def _list_functions(*, file: str) -> list:
+    """List the functions a module defines, from its source alone.
+
+    Used by `A_GIS.Code.list` in "static" mode, also in worker processes.
+    These are the functions importing the module would give it as its own:
+    the `def` and `async def` statements at the top level, including those
+    inside top-level `if`, `try` and `with` blocks. A module that cannot be
+    parsed has no functions, like a module that fails to import.
+    """
+    import ast
+
+    try:
+        with open(file, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+        return []
+
+    names = []
+    pending = list(tree.body)
+    while pending:
+        node = pending.pop(0)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            names.append(node.name)
+        elif isinstance(node, (ast.If, ast.Try, ast.With)):
+            for field in ("body", "orelse", "handlers", "finalbody"):
+                for child in getattr(node, field, []):
+                    if isinstance(child, ast.ExceptHandler):
+                        pending.extend(child.body)
+                    else:
+                        pending.append(child)
+    return sorted(set(names))
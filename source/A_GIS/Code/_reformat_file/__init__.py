@@ -0,0 +1,30 @@
+def _reformat_file(*, file: str) -> dict:
+    """Reformat one file for `A_GIS.Code.reformat_files` in a worker.
+
+    The file is read and formatted with `A_GIS.Code.reformat`, but not
+    written. A plain dictionary is returned, because it has to be sent back
+    from the worker process, with the `file`, its `code`, the `formatted`
+    code, or None on failure, the formatter time in `seconds` and the
+    `error` message, if any.
+    """
+    import A_GIS.Code.reformat
+    import time
+
+    code = None
+    formatted = None
+    error = None
+    start = time.perf_counter()
+    try:
+        with open(file, "r") as f:
+            code = f.read()
+        formatted = A_GIS.Code.reformat(code=code)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    return {
+        "file": file,
+        "code": code,
+        "formatted": formatted,
+        "seconds": time.perf_counter() - start,
+        "error": error,
+    }
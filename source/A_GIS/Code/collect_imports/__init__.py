@@ -8,6 +8,7 @@ def collect_imports(*, code: str):
     Returns:
         list: A list of top-level import statements as strings.
     """
+    import A_GIS.Code.Parse.get
     import libcst
 
     class TopLevelImportCollector(libcst.CSTVisitor):
@@ -26,7 +27,7 @@ def collect_imports(*, code: str):
             # Reconstruct the source code for the import node
             return libcst.Module([]).code_for_node(node)
 
-    tree = libcst.parse_module(code)
+    tree = A_GIS.Code.Parse.get(code=code, kind="cst")
     collector = TopLevelImportCollector()
     tree.visit(collector)
     return collector.imports
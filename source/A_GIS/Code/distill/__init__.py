@@ -33,20 +33,40 @@ def distill(*, code: str) -> str:
             return (param1, param2)
     """
 
+    import A_GIS.Code.Parse.get
     import ast
+    import copy
     import re
-    import A_GIS.Code._distill_imports
-
-    # Parse the code into an abstract syntax tree (AST).
-    # Walk through all nodes in the AST to identify docstrings and multiline
-    # string literals, and replace them with standard strings.
-    parsed = ast.parse(code)
-    for node in ast.walk(parsed):
-        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Str):
-            node.value = ast.Constant(value="")
-
-    # Fix imports.
-    distilled_code = A_GIS.Code._distill_imports(code=code)
+
+    # Replace docstrings and multiline string literals with standard
+    # strings. The parsed tree is shared through `A_GIS.Code.Parse.get`, so
+    # only the nodes above a replaced string are copied.
+    def blank(node):
+        if (
+            isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str)
+        ):
+            return ast.Expr(value=ast.Constant(value=""))
+        changes = {}
+        for field, value in ast.iter_fields(node):
+            if isinstance(value, list):
+                new = [
+                    blank(x) if isinstance(x, ast.AST) else x for x in value
+                ]
+                if any(x is not y for x, y in zip(new, value)):
+                    changes[field] = new
+            elif isinstance(value, ast.AST):
+                new = blank(value)
+                if new is not value:
+                    changes[field] = new
+        if changes:
+            node = copy.copy(node)
+            for field, value in changes.items():
+                setattr(node, field, value)
+        return node
+
+    parsed = blank(A_GIS.Code.Parse.get(code=code))
 
     # Remove any blank lines or blank docstrings.
     distilled_code = re.sub(
@@ -0,0 +1,54 @@
+def get_struct_type(*, fields: tuple, slots: bool = False):
+    """Return the cached result dataclass for the given fields.
+
+    The dataclass named 'Result' is created once per combination of field
+    names, field types and `slots`, and then reused, which is what lets
+    `A_GIS.Code.make_struct` avoid building a new class on every call. The
+    most recently created 1024 types are kept.
+
+    Call it directly for a slotted result type, which uses less memory and
+    has faster attribute access, e.g.
+    `A_GIS.Code.get_struct_type(fields=(("x", float),), slots=True)(x=1.0)`.
+    Slotted instances do not accept new attributes. They have a read-only
+    `__dict__` property with a shallow copy of their fields, so
+    `result.__dict__` and `vars(result)` keep working.
+
+    Args:
+        fields (tuple):
+            The `(name, type)` pairs of the fields, in order.
+        slots (bool, optional):
+            Whether to generate the dataclass with `__slots__`. Defaults to
+            False.
+
+    Returns:
+        type:
+            The dataclass.
+    """
+    import dataclasses
+
+    cache = get_struct_type.__dict__.setdefault("cache", {})
+    key = (fields, slots)
+    ResultType = cache.get(key)
+    if ResultType is not None:
+        return ResultType
+
+    ResultType = dataclasses.make_dataclass("Result", fields, slots=slots)
+    if slots:
+        # Dataclasses drop `__dict__` from the namespace of slotted classes,
+        # so the property is added in a slotted subclass instead.
+        names = tuple(name for name, _ in fields)
+        ResultType = type(
+            "Result",
+            (ResultType,),
+            {
+                "__slots__": (),
+                "__dict__": property(
+                    lambda self: {x: getattr(self, x) for x in names}
+                ),
+            },
+        )
+
+    if len(cache) >= 1024:
+        del cache[next(iter(cache))]
+    cache[key] = ResultType
+    return ResultType
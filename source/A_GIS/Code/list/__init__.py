@@ -3,13 +3,28 @@ def list(
     package_name="A_GIS",
     ignore=["_", "tests"],
     functions_only: bool = False,
+    mode: str = "manifest",
+    max_workers: int = None,
 ):
     """List all modules and functions in a package.
 
+    In "manifest" mode the package is enumerated from the unit manifest
+    (see `A_GIS.Code.Manifest.read`) without importing any module. In
+    "static" mode the package directory is walked and every module is
+    parsed with `ast`, in parallel, without importing or executing
+    anything and without a manifest. In "import" mode every module is
+    imported and inspected, which runs their top-level imports and reports
+    the modules that fail to import. All modes give the same result for
+    modules that import cleanly.
+
     Args:
         package_name: Name of package to list contents of
         ignore: List of strings to ignore in module names
         functions_only: Whether to only return functions
+        mode: How to enumerate the package, "manifest", "static" or
+            "import"
+        max_workers: Number of processes parsing the modules in "static"
+            mode, defaults to one per CPU
 
     Returns:
         A_GIS.Code.make_struct containing:
@@ -26,48 +41,126 @@ def list(
     import sys
     import typing
 
-    # Get package path
-    package = importlib.import_module(package_name)
-    package_path = package.__path__
-
     modules = []
     functions = []
     sources = {}  # Maps names to their source files
 
-    # Walk through all modules
-    for importer, full_name, ispkg in pkgutil.walk_packages(
-        path=package_path, prefix=package_name + ".", onerror=lambda x: None
-    ):
-        # Get module path using find_spec instead of find_module
-        spec = importer.find_spec(full_name)
-        if spec is None or spec.origin is None:
-            continue
-
-        path = spec.origin
-
-        include = True
+    def is_included(full_name):
         for x in full_name.split("."):
             if any(x.startswith(i) for i in ignore):
-                include = False
-                break
-
-        if not include:
-            continue
-
-        if not functions_only:
-            modules.append(full_name)
-            sources[full_name] = path
-
-        try:
-            module = importlib.import_module(full_name)
-            for name, obj in inspect.getmembers(module):
-                if inspect.isfunction(obj) and obj.__module__ == full_name:
-                    full_func_name = f"{full_name}.{name}"
-                    functions.append(full_func_name)
-                    sources[full_func_name] = path
-        except Exception as e:
-            print(f"Error importing {full_name}: {e}", file=sys.stderr)
-            continue
+                return False
+        return True
+
+    # Enumerate from the manifest without importing anything.
+    if mode == "manifest":
+        import A_GIS.Code.Manifest.read
+
+        manifest = A_GIS.Code.Manifest.read(package_name=package_name)
+        for full_name, entry in manifest.entries.items():
+            if full_name == package_name or not is_included(full_name):
+                continue
+            if not functions_only:
+                modules.append(full_name)
+                sources[full_name] = entry["path"]
+            for name in entry["functions"]:
+                full_func_name = f"{full_name}.{name}"
+                functions.append(full_func_name)
+                sources[full_func_name] = entry["path"]
+
+    # Walk the package directory and parse the modules.
+    elif mode == "static":
+        import A_GIS.Code._list_functions
+        import concurrent.futures
+        import importlib.util
+        import os
+
+        spec = importlib.util.find_spec(package_name)
+        root = spec.submodule_search_locations[0]
+
+        # Only descend into directories that are packages, like pkgutil.
+        files = {}
+        for directory, dirs, names in os.walk(root):
+            dirs[:] = sorted(
+                x
+                for x in dirs
+                if os.path.exists(os.path.join(directory, x, "__init__.py"))
+            )
+            relative = os.path.relpath(directory, root)
+            parts = [package_name]
+            if relative != ".":
+                parts += relative.split(os.sep)
+            for name in sorted(names):
+                stem, extension = os.path.splitext(name)
+                if extension != ".py" or not stem.isidentifier():
+                    continue
+                full_name = ".".join(
+                    parts if stem == "__init__" else [*parts, stem]
+                )
+                if full_name != package_name and is_included(full_name):
+                    files[full_name] = os.path.join(directory, name)
+
+        # Parse the modules in parallel.
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers > 1 and len(files) > 1:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers
+            ) as executor:
+                futures = {
+                    x: executor.submit(A_GIS.Code._list_functions, file=y)
+                    for x, y in files.items()
+                }
+                names = {x: y.result() for x, y in futures.items()}
+        else:
+            names = {
+                x: A_GIS.Code._list_functions(file=y) for x, y in files.items()
+            }
+
+        for full_name, path in files.items():
+            if not functions_only:
+                modules.append(full_name)
+                sources[full_name] = path
+            for name in names[full_name]:
+                full_func_name = f"{full_name}.{name}"
+                functions.append(full_func_name)
+                sources[full_func_name] = path
+
+    # Otherwise import every module and inspect it.
+    else:
+        # Get package path
+        package = importlib.import_module(package_name)
+        package_path = package.__path__
+
+        # Walk through all modules
+        for importer, full_name, ispkg in pkgutil.walk_packages(
+            path=package_path,
+            prefix=package_name + ".",
+            onerror=lambda x: None,
+        ):
+            # Get module path using find_spec instead of find_module
+            spec = importer.find_spec(full_name)
+            if spec is None or spec.origin is None:
+                continue
+
+            path = spec.origin
+
+            if not is_included(full_name):
+                continue
+
+            if not functions_only:
+                modules.append(full_name)
+                sources[full_name] = path
+
+            try:
+                module = importlib.import_module(full_name)
+                for name, obj in inspect.getmembers(module):
+                    if inspect.isfunction(obj) and obj.__module__ == full_name:
+                        full_func_name = f"{full_name}.{name}"
+                        functions.append(full_func_name)
+                        sources[full_func_name] = path
+            except Exception as e:
+                print(f"Error importing {full_name}: {e}", file=sys.stderr)
+                continue
 
     return A_GIS.Code.make_struct(
         modules=sorted(modules),
@@ -2,7 +2,8 @@ import sys
 import A_GIS.Code.list
 import json
 
-result = A_GIS.Code.list()
+mode = sys.argv[1] if len(sys.argv) > 1 else "manifest"
+result = A_GIS.Code.list(mode=mode)
 print(json.dumps({
     "modules": result.modules,
     "functions": result.functions
@@ -0,0 +1,81 @@
+import A_GIS.Code.list
+import pytest
+
+
+def _make_package(root):
+    package = root / "static_pkg"
+    (package / "Sub" / "tests").mkdir(parents=True)
+    (package / "__init__.py").write_text('"""Top."""\n')
+    (package / "helpers.py").write_text(
+        "import os\n"
+        "from os.path import join\n\n"
+        "def visible():\n    pass\n\n"
+        "async def fetch():\n    pass\n\n"
+        "def _hidden():\n    pass\n\n"
+        "class Shape:\n    def area(self):\n        pass\n\n"
+        "try:\n    def guarded():\n        pass\n"
+        "except ImportError:\n    pass\n"
+    )
+    (package / "Sub" / "__init__.py").write_text(
+        "def in_package():\n    pass\n"
+    )
+    (package / "Sub" / "tool.py").write_text(
+        "if True:\n    def conditional():\n        pass\n"
+    )
+    (package / "Sub" / "tests" / "__init__.py").write_text(
+        "def test_nothing():\n    pass\n"
+    )
+    (package / "_private.py").write_text("def secret():\n    pass\n")
+    (package / "notes").mkdir()
+    (package / "notes" / "draft.py").write_text("def draft():\n    pass\n")
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    import sys
+
+    _make_package(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "static_pkg"
+    for name in [x for x in sys.modules if x.startswith("static_pkg")]:
+        del sys.modules[name]
+
+
+@pytest.mark.parametrize("functions_only", [False, True])
+def test_static_mode_matches_import_mode(package, functions_only):
+    imported = A_GIS.Code.list(
+        package_name=package, functions_only=functions_only, mode="import"
+    )
+    static = A_GIS.Code.list(
+        package_name=package,
+        functions_only=functions_only,
+        mode="static",
+        max_workers=2,
+    )
+    assert static.modules == imported.modules
+    assert static.functions == imported.functions
+    assert static.sources == imported.sources
+
+
+def test_static_mode_finds_definitions(package):
+    result = A_GIS.Code.list(package_name=package, mode="static")
+    assert result.modules == [
+        "static_pkg.Sub",
+        "static_pkg.Sub.tool",
+        "static_pkg.helpers",
+    ]
+    assert result.functions == [
+        "static_pkg.Sub.in_package",
+        "static_pkg.Sub.tool.conditional",
+        "static_pkg.helpers._hidden",
+        "static_pkg.helpers.fetch",
+        "static_pkg.helpers.guarded",
+        "static_pkg.helpers.visible",
+    ]
+
+
+def test_static_mode_does_not_import(package):
+    import sys
+
+    A_GIS.Code.list(package_name=package, mode="static", max_workers=1)
+    assert not any(x.startswith(package) for x in sys.modules)
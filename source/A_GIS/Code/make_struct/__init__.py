@@ -1,11 +1,13 @@
 def make_struct(**kwargs):
     """Create a dataclass instance from keyword arguments dynamically.
 
-    This function dynamically generates a dataclass based on the provided
-    keyword arguments and their types, and then returns an instance of that
-    class initialized with the given values. This allows for the creation of
-    custom data classes at runtime without explicitly defining them
-    beforehand.
+    This function returns an instance of a dataclass whose fields are the
+    provided keyword arguments, typed by their values. The dataclass is
+    created on first use for each combination of field names and types and
+    cached by `A_GIS.Code.get_struct_type`, so repeated calls with the same
+    shape of result do not build a new class each time. Results are not
+    slotted, since callers may add attributes to them. Use
+    `A_GIS.Code.get_struct_type` with `slots=True` for slotted results.
 
     Args:
         **kwargs (dict):
@@ -16,13 +18,13 @@ def make_struct(**kwargs):
 
     Returns:
         dataclass (ResultType):
-            An instance of the dynamically created dataclass with the fields
-            and values specified by the keyword arguments.
+            An instance of the dataclass with the fields and values specified
+            by the keyword arguments.
             The name of the dataclass is 'Result'.
     """
-    import dataclasses
+    import A_GIS.Code.get_struct_type
 
-    ResultType = dataclasses.make_dataclass(
-        "Result", [(k, type(v)) for k, v in kwargs.items()]
+    ResultType = A_GIS.Code.get_struct_type(
+        fields=tuple((k, type(v)) for k, v in kwargs.items())
     )
     return ResultType(**kwargs)
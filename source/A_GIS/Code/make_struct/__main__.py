@@ -0,0 +1,38 @@
+"""Benchmark `A_GIS.Code.make_struct` against building a new class per call.
+
+Run with `python -m A_GIS.Code.make_struct`.
+"""
+
+import A_GIS.Code.get_struct_type
+import A_GIS.Code.make_struct
+import A_GIS.Dev.benchmark
+import dataclasses
+
+
+def make_struct_uncached(**kwargs):
+    """The previous `make_struct`, which created a new dataclass each call."""
+    ResultType = dataclasses.make_dataclass(
+        "Result", [(k, type(v)) for k, v in kwargs.items()]
+    )
+    return ResultType(**kwargs)
+
+
+def make_struct_slotted(**kwargs):
+    """A slotted result from the cached types."""
+    ResultType = A_GIS.Code.get_struct_type(
+        fields=tuple((k, type(v)) for k, v in kwargs.items()), slots=True
+    )
+    return ResultType(**kwargs)
+
+
+if __name__ == "__main__":
+    kwargs = {"path": "a", "values": [1, 2], "error": "", "_name": "b"}
+    for function in [
+        make_struct_uncached,
+        A_GIS.Code.make_struct,
+        make_struct_slotted,
+    ]:
+        result = A_GIS.Dev.benchmark(function=function, kwargs=kwargs)
+        print(
+            f"{function.__name__:>22}: {result.per_call * 1e6:10.2f} us/call"
+        )
@@ -0,0 +1,33 @@
+import A_GIS.Code.make_struct
+import A_GIS.Code.get_struct_type
+import dataclasses
+
+
+def test_fields_and_dict():
+    result = A_GIS.Code.make_struct(a=1, b="x", _c=None)
+    assert result.a == 1
+    assert result.b == "x"
+    assert result._c is None
+    assert result.__dict__ == {"a": 1, "b": "x", "_c": None}
+    assert type(result).__name__ == "Result"
+    assert dataclasses.is_dataclass(result)
+
+
+def test_type_is_reused():
+    first = A_GIS.Code.make_struct(a=1, b="x")
+    second = A_GIS.Code.make_struct(a=2, b="y")
+    assert type(first) is type(second)
+    assert type(first) is not type(A_GIS.Code.make_struct(a=1.0, b="x"))
+    assert type(first) is not type(A_GIS.Code.make_struct(b="x", a=1))
+
+
+def test_slots():
+    ResultType = A_GIS.Code.get_struct_type(
+        fields=(("a", int), ("b", str)), slots=True
+    )
+    result = ResultType(a=1, b="x")
+    assert not hasattr(type(result), "__weakref__")
+    assert result.__dict__ == {"a": 1, "b": "x"}
+    assert vars(result) == {"a": 1, "b": "x"}
+    result.a = 2
+    assert result.a == 2
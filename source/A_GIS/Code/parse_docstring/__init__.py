@@ -31,10 +31,11 @@ def parse_docstring(
             uncleaned docstring if both flags are set to False.
     """
 
+    import A_GIS.Code.Parse.get
     import ast
 
     # Parse the code into an abstract syntax tree (AST)
-    tree = ast.parse(code)
+    tree = A_GIS.Code.Parse.get(code=code)
 
     # Get the docstring of the first module-level entity
     docstring = ast.get_docstring(tree)
@@ -1,13 +1,8 @@
-import A_GIS.Code.Unit.touch
-import A_GIS.Code.reformat
-import A_GIS.File.read
-import A_GIS.File.write
+import A_GIS.Code.reformat_files
 import sys
-import pathlib
-import subprocess
 
-for z in sys.argv[1:]:
-    file=pathlib.Path(z)
-    code = A_GIS.File.read(file=file)
-    formatted_code = A_GIS.Code.reformat(code=code)
-    A_GIS.File.write(content=formatted_code, file=file)
+result = A_GIS.Code.reformat_files(files=sys.argv[1:])
+for file, error in result.errors.items():
+    print(f"error {file}: {error}")
+for seconds, file in result.slowest:
+    print(f"{seconds:8.3f}s {file}")
@@ -0,0 +1,90 @@
+def reformat_files(
+    *,
+    files: list,
+    max_workers: int = None,
+    write: bool = True,
+):
+    """Reformat many files in parallel with `A_GIS.Code.reformat`.
+
+    Formatting is CPU-bound, so the files are spread over a process pool
+    with `max_workers` processes, by default one per CPU. With a single
+    worker, or a single file, they are formatted in this process instead.
+    A file that fails to format is reported in `errors` and left untouched,
+    without stopping the others. The formatted files are written back by
+    this process in the order of `files`, and only when their content
+    changed, so the outcome does not depend on the scheduling.
+
+    Args:
+        files (list[pathlib.Path]): The files to reformat.
+        max_workers (int, optional): The number of worker processes.
+            Defaults to `os.cpu_count()`.
+        write (bool, optional): Whether to write the formatted files.
+            Defaults to True.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - results (list[dict]): For every file, in the order of
+              `files`, its `file`, `code`, `formatted` code, whether it
+              `changed`, the formatter time in `seconds` and the `error`.
+            - changed (list[str]): The files whose content changed.
+            - errors (dict): File to error message of the failed files.
+            - slowest (list[tuple]): The ten files that took the longest,
+              as `(seconds, file)`, slowest first.
+            - total_s (float): The wall-clock time of the whole run.
+            - _max_workers (int): The number of workers used.
+    """
+    import A_GIS.Code._reformat_file
+    import A_GIS.Code.make_struct
+    import A_GIS.File.write
+    import concurrent.futures
+    import os
+    import time
+
+    files = [str(x) for x in files]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(files)))
+
+    # Format in this process or in the pool.
+    start = time.perf_counter()
+    if max_workers == 1:
+        results = [A_GIS.Code._reformat_file(file=x) for x in files]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            futures = [
+                executor.submit(A_GIS.Code._reformat_file, file=x)
+                for x in files
+            ]
+            results = [x.result() for x in futures]
+
+    # Write the results back from this process.
+    changed = []
+    errors = {}
+    for result in results:
+        result["changed"] = (
+            result["error"] is None and result["formatted"] != result["code"]
+        )
+        if result["error"] is not None:
+            errors[result["file"]] = result["error"]
+        elif result["changed"]:
+            changed.append(result["file"])
+            if write:
+                A_GIS.File.write(
+                    content=result["formatted"], file=result["file"]
+                )
+    slowest = sorted(
+        ((x["seconds"], x["file"]) for x in results), reverse=True
+    )[:10]
+
+    return A_GIS.Code.make_struct(
+        results=results,
+        changed=changed,
+        errors=errors,
+        slowest=slowest,
+        total_s=time.perf_counter() - start,
+        _max_workers=max_workers,
+    )
@@ -0,0 +1,47 @@
+import A_GIS.Code.reformat
+import A_GIS.Code.reformat_files
+import pytest
+
+
+@pytest.fixture
+def reformat(monkeypatch):
+    def reformat(*, code):
+        if "fail" in code:
+            raise SyntaxError("cannot format")
+        return code.replace("x=1", "x = 1")
+
+    monkeypatch.setattr(A_GIS.Code, "reformat", reformat)
+
+
+def test_errors_do_not_stop_the_run(tmp_path, reformat):
+    files = []
+    for name, code in [("a", "x=1\n"), ("b", "fail\n"), ("c", "x = 1\n")]:
+        files.append(tmp_path / f"{name}.py")
+        files[-1].write_text(code)
+    result = A_GIS.Code.reformat_files(files=files, max_workers=1)
+    assert [x["file"] for x in result.results] == [str(x) for x in files]
+    assert result.changed == [str(files[0])]
+    assert list(result.errors) == [str(files[1])]
+    assert result.errors[str(files[1])].startswith("SyntaxError")
+    assert files[0].read_text() == "x = 1\n"
+    assert files[1].read_text() == "fail\n"
+    assert len(result.slowest) == 3
+
+
+def test_without_write_files_are_kept(tmp_path, reformat):
+    file = tmp_path / "a.py"
+    file.write_text("x=1\n")
+    result = A_GIS.Code.reformat_files(files=[file], write=False)
+    assert result.results[0]["formatted"] == "x = 1\n"
+    assert file.read_text() == "x=1\n"
+
+
+def test_pool_keeps_the_order(tmp_path):
+    files = [tmp_path / f"{i}.py" for i in range(6)]
+    for file in files[::2]:
+        file.write_text("x = 1\n")
+    result = A_GIS.Code.reformat_files(files=files, max_workers=3)
+    assert result._max_workers == 3
+    assert [x["file"] for x in result.results] == [str(x) for x in files]
+    for file in files[1::2]:
+        assert result.errors[str(file)].startswith("FileNotFoundError")
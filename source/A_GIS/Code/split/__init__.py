@@ -10,6 +10,7 @@ def split(*, code: str):
            - names (list): The names of top-level declarations.
            - bodies (list): The corresponding code of the declarations as strings.
     """
+    import A_GIS.Code.Parse.get
     import libcst
     import A_GIS.Code.make_struct
 
@@ -45,7 +46,7 @@ def split(*, code: str):
             # Decrement depth after leaving a block
             self.current_depth -= 1
 
-    tree = libcst.parse_module(code)
+    tree = A_GIS.Code.Parse.get(code=code, kind="cst")
     splitter = TopLevelSplitter(code)
     tree.visit(splitter)
     return A_GIS.Code.make_struct(names=splitter.names, bodies=splitter.bodies)
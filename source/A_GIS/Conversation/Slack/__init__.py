@@ -1,6 +1,12 @@
 """
 """
-# Functions
-from ._extract_thread import _extract_thread
-from .extract_threads import extract_threads
-from .load_data import load_data
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "_extract_thread",
+        "extract_threads",
+        "load_data",
+    ],
+)
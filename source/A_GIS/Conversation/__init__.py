@@ -1,4 +1,10 @@
 """Transform conversations to useful data.
 """
-# Packages
-from . import Slack
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    packages=[
+        "Slack",
+    ],
+)
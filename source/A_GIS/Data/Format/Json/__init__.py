@@ -1,6 +1,12 @@
 """Manipulate the JSON data format.
 """
-# Functions
-from .load_from_db import load_from_db
-from .read import read
-from .save_to_db import save_to_db
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "load_from_db",
+        "read",
+        "save_to_db",
+    ],
+)
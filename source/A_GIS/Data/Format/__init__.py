@@ -1,4 +1,10 @@
 """Formats for representing data.
 """
-# Packages
-from . import Json
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    packages=[
+        "Json",
+    ],
+)
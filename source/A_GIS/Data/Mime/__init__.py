@@ -1,9 +1,15 @@
 """
 """
-# Functions
-from ._detect_mime_from_filelike import _detect_mime_from_filelike
-from ._detect_mime_from_path import _detect_mime_from_path
-from ._detect_mime_from_source import _detect_mime_from_source
-from ._detect_mime_from_url import _detect_mime_from_url
-from ._detect_mime_type import _detect_mime_type
-from .detect import detect
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "_detect_mime_from_filelike",
+        "_detect_mime_from_path",
+        "_detect_mime_from_source",
+        "_detect_mime_from_url",
+        "_detect_mime_type",
+        "detect",
+    ],
+)
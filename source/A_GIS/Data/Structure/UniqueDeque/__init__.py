@@ -1,4 +1,10 @@
 """
 """
-# Functions
-from .create import create
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "create",
+    ],
+)
@@ -1,4 +1,10 @@
 """
 """
-# Packages
-from . import UniqueDeque
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    packages=[
+        "UniqueDeque",
+    ],
+)
@@ -1,6 +1,12 @@
 """Manage and manipulate data.
 """
-# Packages
-from . import Format
-from . import Mime
-from . import Structure
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    packages=[
+        "Format",
+        "Mime",
+        "Structure",
+    ],
+)
@@ -1,10 +1,16 @@
 """
 """
-# Functions
-from ._convert_inline_math import _convert_inline_math
-from ._convert_math_blocks import _convert_math_blocks
-from ._process_issue import _process_issue
-from .format_issue import format_issue
-from .get_report import get_report
-from .get_report_script import get_report_script
-from .get_report_style import get_report_style
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "_convert_inline_math",
+        "_convert_math_blocks",
+        "_process_issue",
+        "format_issue",
+        "get_report",
+        "get_report_script",
+        "get_report_style",
+    ],
+)
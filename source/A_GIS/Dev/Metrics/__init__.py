@@ -1,27 +1,33 @@
 """Metrics module for A_GIS.
 """
-# Functions
-from ._download_and_hash_image import _download_and_hash_image
-from ._extract_image_urls import _extract_image_urls
-from ._extract_scl import _extract_scl
-from ._extract_sdl import _extract_sdl
-from ._filter_by_label import _filter_by_label
-from ._filter_closed_only import _filter_closed_only
-from ._get_activity_started_at import _get_activity_started_at
-from ._get_completed import _get_completed
-from ._get_first_mr_created_at import _get_first_mr_created_at
-from ._get_raw_data_gitlab_sqa import _get_raw_data_gitlab_sqa
-from ._get_started_at import _get_started_at
-from ._label_times import _label_times
-from ._project_time_to_close import _project_time_to_close
-from .calculate_halflife import calculate_halflife
-from .filter_issues import filter_issues
-from .get_closure_stats import get_closure_stats
-from .get_dates import get_dates
-from .get_raw_data import get_raw_data
-from .plot_halflife import plot_halflife
-from .process_images import process_images
-from .process_issue import process_issue
+import A_GIS.Code.Tree._LazyPackage
 
-# Packages
-from . import Defects
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "_download_and_hash_image",
+        "_extract_image_urls",
+        "_extract_scl",
+        "_extract_sdl",
+        "_filter_by_label",
+        "_filter_closed_only",
+        "_get_activity_started_at",
+        "_get_completed",
+        "_get_first_mr_created_at",
+        "_get_raw_data_gitlab_sqa",
+        "_get_started_at",
+        "_label_times",
+        "_project_time_to_close",
+        "calculate_halflife",
+        "filter_issues",
+        "get_closure_stats",
+        "get_dates",
+        "get_raw_data",
+        "plot_halflife",
+        "process_images",
+        "process_issue",
+    ],
+    packages=[
+        "Defects",
+    ],
+)
@@ -1,4 +1,13 @@
 """Develop software.
 """
-# Packages
-from . import Metrics
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "benchmark",
+    ],
+    packages=[
+        "Metrics",
+    ],
+)
@@ -0,0 +1,44 @@
+def benchmark(
+    *,
+    function: callable,
+    kwargs: dict = {},
+    number: int = 1000,
+    repeat: int = 5,
+):
+    """Measure the per-call cost of a function.
+
+    The function is called `number` times with `kwargs` in each of `repeat`
+    rounds, and the fastest round is reported, as `timeit` recommends for
+    micro-benchmarks.
+
+    Args:
+        function (callable):
+            The function to call.
+        kwargs (dict, optional):
+            The keyword arguments to pass to the function. Defaults to {}.
+        number (int, optional):
+            The number of calls per round. Defaults to 1000.
+        repeat (int, optional):
+            The number of rounds. Defaults to 5.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - per_call (float): Seconds per call in the fastest round.
+            - rounds (list[float]): Seconds per call in every round.
+            - _number (int): The number of calls per round.
+            - _repeat (int): The number of rounds.
+    """
+    import A_GIS.Code.make_struct
+    import timeit
+
+    timer = timeit.Timer(lambda: function(**kwargs))
+    rounds = [x / number for x in timer.repeat(repeat=repeat, number=number)]
+
+    return A_GIS.Code.make_struct(
+        per_call=min(rounds),
+        rounds=rounds,
+        _number=number,
+        _repeat=repeat,
+    )
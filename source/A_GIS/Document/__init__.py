@@ -14,5 +14,11 @@ This module explores the following.
 - Can a document be converted back to data?
 - Can we identify components of a document and extract them?
 """
-# Functions
-from .extract_images import extract_images
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "extract_images",
+    ],
+)
@@ -1,5 +1,11 @@
 """
 """
-# Functions
-from .delete import delete
-from .identify import identify
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "delete",
+        "identify",
+    ],
+)
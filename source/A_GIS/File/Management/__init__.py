@@ -1,7 +1,13 @@
 """Manage files in a database.
 """
-# Functions
-from .get_collection import get_collection
-from .get_nearest import get_nearest
-from .monitor import monitor
-from .prune_deleted import prune_deleted
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "get_collection",
+        "get_nearest",
+        "monitor",
+        "prune_deleted",
+    ],
+)
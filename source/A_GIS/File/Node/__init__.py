@@ -1,12 +1,18 @@
 """
 """
-# Functions
-from ._get_dir_root import _get_dir_root
-from .classify import classify
-from .generate_dirname import generate_dirname
-from .generate_filename import generate_filename
-from .generate_purpose import generate_purpose
-from .get_context import get_context
-from .get_root import get_root
-from .list_branches import list_branches
-from .move import move
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "_get_dir_root",
+        "classify",
+        "generate_dirname",
+        "generate_filename",
+        "generate_purpose",
+        "get_context",
+        "get_root",
+        "list_branches",
+        "move",
+    ],
+)
@@ -33,7 +33,7 @@ def generate_purpose(
         str:
             A Markdown formatted purpose for the directory.
     """
-    import A_GIS.Ai.Chatbot.init
+    import A_GIS.Ai.Chatbot.get_session
     import os
     import pathlib
     import A_GIS.File.read_to_text
@@ -203,13 +203,13 @@ def generate_purpose(
 {reminder}
     """
 
-    chatbot = A_GIS.Ai.Chatbot.init(
+    chatbot = A_GIS.Ai.Chatbot.get_session(
         model="reflection",
         system=system_prompt,
         num_predict=15000,
         num_ctx=30000,
         temperature=0.7,
-    )
+    ).fork()
 
     purpose_file_path = (directory / "_leaf.node.md").resolve()
 
@@ -0,0 +1,283 @@
+def download_ranges(
+    *,
+    url: str,
+    output_path,
+    session=None,
+    expected_sha256: str = None,
+    connections: int = 4,
+    min_range_size: int = 64 * 1024 * 1024,
+    chunk_size: int = 1024 * 1024,
+    start_from_scratch: bool = False,
+    max_retries: int = 3,
+    timeout: float = 10,
+    progress_bar=None,
+):
+    """Download a file over several connections, hashing it as it streams in.
+
+    A HEAD request gives the size of the file and whether the server accepts
+    byte ranges. If it does, the file is split into at most `connections`
+    ranges of at least `min_range_size` bytes, which are fetched in parallel
+    and written into the preallocated output file with `os.pwrite`. Otherwise
+    the whole file is fetched over one connection.
+
+    The SHA-256 is computed while downloading. A hash cursor follows the
+    contiguous prefix of the file that has been written: chunks that land
+    right at the cursor are hashed from memory, and the ranges written ahead
+    of it are read back with `os.pread` as soon as the cursor reaches them,
+    while they are still in the page cache. No second pass over the finished
+    file is needed.
+
+    The progress of every range is saved in a `<output_path>.ranges` file.
+    An interrupted download continues each range where it stopped, and a
+    failed range is retried up to `max_retries` times from its last byte.
+    The sidecar is removed when the download is complete.
+
+    Args:
+        url (str): The URL of the file.
+        output_path (Path): The file to write.
+        session (requests.Session, optional): The session for the requests.
+            Defaults to a new session.
+        expected_sha256 (str, optional): The SHA-256 the file should have.
+        connections (int, optional): The maximum number of ranges fetched in
+            parallel. Defaults to 4.
+        min_range_size (int, optional): The smallest range worth its own
+            connection. Defaults to 64 MiB.
+        chunk_size (int, optional): The size of the streamed chunks. Defaults
+            to 1 MiB.
+        start_from_scratch (bool, optional): If True, ignore any previous
+            partial download. Defaults to False.
+        max_retries (int, optional): How often a failed range is resumed.
+            Defaults to 3.
+        timeout (float, optional): The timeout of the requests in seconds.
+            Defaults to 10.
+        progress_bar (tqdm.tqdm, optional): Updated with the number of bytes
+            of every chunk.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - path (Path): The downloaded file.
+            - size (int): The size of the file in bytes.
+            - sha256 (str): The SHA-256 of the file.
+            - valid (bool): Whether it matches `expected_sha256`, or None if
+              none was given.
+            - ranges (int): The number of ranges that were fetched.
+            - resumed_bytes (int): The bytes kept from a previous download.
+    """
+    import A_GIS.Code.make_struct
+    import concurrent.futures
+    import hashlib
+    import json
+    import os
+    import pathlib
+    import threading
+
+    if session is None:
+        import requests
+
+        session = requests.Session()
+
+    output_path = pathlib.Path(output_path)
+    state_path = output_path.with_name(output_path.name + ".ranges")
+    if start_from_scratch:
+        for path in (output_path, state_path):
+            if path.exists():
+                path.unlink()
+
+    # Find out the size and whether ranges are supported.
+    head = session.head(url, allow_redirects=True, timeout=timeout)
+    head.raise_for_status()
+    url = head.url or url
+    size = head.headers.get("Content-Length")
+    size = int(size) if size is not None else None
+    etag = head.headers.get("ETag")
+    ranged = (
+        size is not None
+        and head.headers.get("Accept-Ranges", "").lower() == "bytes"
+    )
+
+    # Continue a previous download or split the file into new ranges.
+    state = None
+    had_state = state_path.exists()
+    if had_state and output_path.exists():
+        try:
+            state = json.loads(state_path.read_text())
+        except ValueError:
+            state = None
+        if state is not None and (
+            not ranged
+            or state.get("size") != size
+            or state.get("etag") != etag
+        ):
+            state = None
+    if state is not None:
+        ranges = state["ranges"]
+    elif ranged:
+        if (
+            not had_state
+            and output_path.exists()
+            and output_path.stat().st_size == size
+        ):
+            # Complete from an earlier run, so only the hash is missing. A
+            # file with an unreadable or stale sidecar is preallocated and
+            # unfinished, so it is downloaded again.
+            ranges = [[0, size - 1, size]]
+        else:
+            count = max(1, min(connections, size // max(1, min_range_size)))
+            bounds = [size * i // count for i in range(count + 1)]
+            ranges = [
+                [bounds[i], bounds[i + 1] - 1, 0]
+                for i in range(count)
+                if bounds[i + 1] > bounds[i]
+            ]
+            with open(output_path, "wb") as f:
+                f.truncate(size)
+    else:
+        ranges = [[0, None, 0]]
+        with open(output_path, "wb"):
+            pass
+    resumed_bytes = sum(done for _, _, done in ranges)
+
+    lock = threading.Lock()
+    hash_lock = threading.Lock()
+    stop = threading.Event()
+    cursor = {
+        "offset": 0,
+        "range": 0,
+        "saved": resumed_bytes,
+        "sha256": hashlib.sha256(),
+    }
+
+    def save_state():
+        if not ranged:
+            return
+        temp_path = state_path.with_name(state_path.name + ".tmp")
+        with lock:
+            text = json.dumps(
+                {"url": url, "size": size, "etag": etag, "ranges": ranges}
+            )
+        temp_path.write_text(text)
+        os.replace(temp_path, state_path)
+
+    def available():
+        # Bytes written contiguously after the hash cursor.
+        with lock:
+            while cursor["range"] < len(ranges):
+                start, end, done = ranges[cursor["range"]]
+                if end is not None and cursor["offset"] > end:
+                    cursor["range"] += 1
+                    continue
+                return start + done - cursor["offset"]
+            return 0
+
+    def advance(offset=None, data=None):
+        # Move the hash cursor as far as the written data allows.
+        while available() > 0:
+            if not hash_lock.acquire(blocking=False):
+                return
+            try:
+                while (count := available()) > 0:
+                    if data is not None and offset == cursor["offset"]:
+                        block = data
+                    else:
+                        block = os.pread(
+                            fd, min(count, 8 * chunk_size), cursor["offset"]
+                        )
+                    data = None
+                    cursor["sha256"].update(block)
+                    with lock:
+                        cursor["offset"] += len(block)
+            finally:
+                hash_lock.release()
+
+    def fetch(index):
+        retries = 0
+        while True:
+            start, end, done = ranges[index]
+            if end is not None and start + done > end:
+                return
+            headers = (
+                {"Range": f"bytes={start + done}-{end}"} if ranged else {}
+            )
+            try:
+                with session.get(
+                    url, headers=headers, stream=True, timeout=timeout
+                ) as r:
+                    r.raise_for_status()
+                    if ranged and r.status_code != 206:
+                        raise OSError(f"No partial content for range {index}.")
+                    for data in r.iter_content(chunk_size):
+                        if stop.is_set():
+                            return
+                        offset = start + ranges[index][2]
+                        view = memoryview(data)
+                        while view:
+                            written = os.pwrite(fd, view, offset)
+                            view = view[written:]
+                            offset += written
+                        with lock:
+                            ranges[index][2] += len(data)
+                            unsaved = (
+                                sum(x[2] for x in ranges) - cursor["saved"]
+                            )
+                        if progress_bar is not None:
+                            progress_bar.update(len(data))
+                        advance(offset - len(data), data)
+                        if unsaved >= 64 * chunk_size:
+                            with lock:
+                                cursor["saved"] += unsaved
+                            save_state()
+                if end is not None and start + ranges[index][2] <= end:
+                    raise OSError(f"Range {index} ended early.")
+                return
+            except Exception:
+                if stop.is_set() or retries >= max_retries:
+                    raise
+                retries += 1
+                if not ranged:
+                    # Without ranges the download starts over.
+                    with lock:
+                        ranges[index][2] = 0
+                        cursor["offset"] = 0
+                        cursor["sha256"] = hashlib.sha256()
+                    os.truncate(fd, 0)
+
+    if ranged:
+        save_state()
+    fd = os.open(output_path, os.O_RDWR)
+    try:
+        if progress_bar is not None and resumed_bytes:
+            progress_bar.update(resumed_bytes)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(ranges)
+        ) as executor:
+            futures = [executor.submit(fetch, i) for i in range(len(ranges))]
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+            except BaseException:
+                stop.set()
+                for future in futures:
+                    future.cancel()
+                raise
+        advance()
+    except BaseException:
+        save_state()
+        raise
+    finally:
+        os.close(fd)
+
+    if state_path.exists():
+        state_path.unlink()
+    size = cursor["offset"]
+    digest = cursor["sha256"].hexdigest()
+
+    return A_GIS.Code.make_struct(
+        path=output_path,
+        size=size,
+        sha256=digest,
+        valid=None if expected_sha256 is None else digest == expected_sha256,
+        ranges=len(ranges),
+        resumed_bytes=resumed_bytes,
+        _url=url,
+        _expected_sha256=expected_sha256,
+    )
@@ -0,0 +1,149 @@
+import A_GIS.File.download_ranges
+import hashlib
+import http.server
+import json
+import os
+import pytest
+import requests
+import threading
+
+
+class _RangeHandler(http.server.BaseHTTPRequestHandler):
+    data = b""
+    ranges = True
+    requests = []
+    fail_after = None
+
+    def log_message(self, *args):
+        pass
+
+    def _headers(self, status, length, start=None):
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        if self.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if start is not None:
+            end = start + length - 1
+            self.send_header(
+                "Content-Range", f"bytes {start}-{end}/{len(self.data)}"
+            )
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._headers(200, len(self.data))
+
+    def do_GET(self):
+        header = self.headers.get("Range")
+        type(self).requests.append(header)
+        if header is None or not self.ranges:
+            start, end, status = 0, len(self.data) - 1, 200
+        else:
+            start, end = header.split("=")[1].split("-")
+            start, end, status = int(start), int(end), 206
+        body = self.data[start : end + 1]
+        self._headers(status, len(body), start if status == 206 else None)
+        if self.fail_after is not None and start > 0:
+            # Send part of the body and drop the connection once.
+            type(self).fail_after, limit = None, self.fail_after
+            self.wfile.write(body[:limit])
+            self.wfile.flush()
+            self.connection.shutdown(2)
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    _RangeHandler.data = os.urandom(300_000)
+    _RangeHandler.ranges = True
+    _RangeHandler.requests = []
+    _RangeHandler.fail_after = None
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}/model.bin"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_ranges_are_reassembled_and_hashed(server, tmp_path):
+    expected = hashlib.sha256(_RangeHandler.data).hexdigest()
+    result = A_GIS.File.download_ranges(
+        url=server,
+        output_path=tmp_path / "model.bin",
+        expected_sha256=expected,
+        connections=4,
+        min_range_size=50_000,
+        chunk_size=8192,
+    )
+    assert result.ranges == 4
+    assert result.sha256 == expected
+    assert result.valid
+    assert (tmp_path / "model.bin").read_bytes() == _RangeHandler.data
+    assert not (tmp_path / "model.bin.ranges").exists()
+    assert sorted(_RangeHandler.requests) == [
+        "bytes=0-74999",
+        "bytes=150000-224999",
+        "bytes=225000-299999",
+        "bytes=75000-149999",
+    ]
+
+
+def test_failed_range_is_resumed(server, tmp_path):
+    _RangeHandler.fail_after = 10_000
+    result = A_GIS.File.download_ranges(
+        url=server,
+        output_path=tmp_path / "model.bin",
+        connections=2,
+        min_range_size=50_000,
+        chunk_size=4096,
+    )
+    assert result.sha256 == hashlib.sha256(_RangeHandler.data).hexdigest()
+    # The second range is resumed after the bytes it received, however the
+    # server happened to chunk them.
+    starts = [
+        int(r[len("bytes=") :].split("-")[0])
+        for r in _RangeHandler.requests
+        if r is not None
+    ]
+    assert any(150_000 < s <= 160_000 for s in starts)
+
+
+def test_interrupted_download_continues(server, tmp_path):
+    output_path = tmp_path / "model.bin"
+    data = _RangeHandler.data
+    output_path.write_bytes(data[:100_000] + bytes(200_000))
+    state = {
+        "url": server,
+        "size": len(data),
+        "etag": None,
+        "ranges": [[0, 149_999, 100_000], [150_000, 299_999, 0]],
+    }
+    (tmp_path / "model.bin.ranges").write_text(json.dumps(state))
+    result = A_GIS.File.download_ranges(url=server, output_path=output_path)
+    assert result.resumed_bytes == 100_000
+    assert sorted(_RangeHandler.requests) == [
+        "bytes=100000-149999",
+        "bytes=150000-299999",
+    ]
+    assert result.sha256 == hashlib.sha256(data).hexdigest()
+    assert output_path.read_bytes() == data
+
+
+def test_without_ranges_one_connection_is_used(server, tmp_path):
+    _RangeHandler.ranges = False
+    result = A_GIS.File.download_ranges(
+        url=server, output_path=tmp_path / "model.bin", min_range_size=1000
+    )
+    assert result.ranges == 1
+    assert _RangeHandler.requests == [None]
+    assert result.sha256 == hashlib.sha256(_RangeHandler.data).hexdigest()
+
+
+def test_full_size_file_with_stale_sidecar_is_downloaded(server, tmp_path):
+    output_path = tmp_path / "model.bin"
+    output_path.write_bytes(bytes(len(_RangeHandler.data)))
+    (tmp_path / "model.bin.ranges").write_text("{not json")
+    result = A_GIS.File.download_ranges(url=server, output_path=output_path)
+    assert result.resumed_bytes == 0
+    assert output_path.read_bytes() == _RangeHandler.data
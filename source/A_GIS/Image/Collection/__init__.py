@@ -1,6 +1,12 @@
 """
 """
-# Functions
-from .init import init
-from .insert import insert
-from .search import search
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "init",
+        "insert",
+        "search",
+    ],
+)
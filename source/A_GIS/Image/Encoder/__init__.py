@@ -1,5 +1,11 @@
 """
 """
-# Functions
-from .encode import encode
-from .init import init
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "encode",
+        "init",
+    ],
+)
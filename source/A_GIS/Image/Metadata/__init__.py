@@ -1,6 +1,12 @@
 """Manipulate metadata in images.
 """
-# Functions
-from .get import get
-from .modify import modify
-from .remove import remove
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "get",
+        "modify",
+        "remove",
+    ],
+)
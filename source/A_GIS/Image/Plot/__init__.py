@@ -1,5 +1,11 @@
 """Manipulate scientific plots.
 """
-# Functions
-from .decompose import decompose
-from .extract_caption import extract_caption
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "decompose",
+        "extract_caption",
+    ],
+)
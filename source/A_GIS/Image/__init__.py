@@ -1,20 +1,26 @@
 """Manage and manipulate images.
 """
-# Functions
-from .compare import compare
-from .create_binary import create_binary
-from .find_lines import find_lines
-from .get_character_scale import get_character_scale
-from .glob import glob
-from .new import new
-from .open import open
-from .parse_receipt import parse_receipt
-from .remove_by_mask import remove_by_mask
-from .show import show
-from .validate import validate
+import A_GIS.Code.Tree._LazyPackage
 
-# Packages
-from . import Collection
-from . import Encoder
-from . import Metadata
-from . import Plot
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "compare",
+        "create_binary",
+        "find_lines",
+        "get_character_scale",
+        "glob",
+        "new",
+        "open",
+        "parse_receipt",
+        "remove_by_mask",
+        "show",
+        "validate",
+    ],
+    packages=[
+        "Collection",
+        "Encoder",
+        "Metadata",
+        "Plot",
+    ],
+)
@@ -0,0 +1,14 @@
+"""Spans of tracked calls.
+"""
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "_get_child_s",
+        "read",
+        "summarize",
+        "to_chrome_trace",
+        "to_collapsed_stacks",
+    ],
+)
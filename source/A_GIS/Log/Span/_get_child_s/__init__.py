@@ -0,0 +1,21 @@
+def _get_child_s(*, spans: list[dict]) -> dict:
+    """Add up the duration of the child spans of every span.
+
+    Spans whose parent is not among the spans are not counted.
+
+    Args:
+        spans (list[dict]):
+            Spans from `A_GIS.Log.Span.read`.
+
+    Returns:
+        dict:
+            The seconds spent in child spans, by the id of the parent span.
+    """
+    ids = {span["id"] for span in spans}
+    child_s = {}
+    for span in spans:
+        if span["parent"] in ids:
+            child_s[span["parent"]] = (
+                child_s.get(span["parent"], 0.0) + span["wall_s"]
+            )
+    return child_s
@@ -0,0 +1,58 @@
+def read(*, file: type["pathlib.Path"]):
+    """Read the spans of tracked calls from an A_GIS log file.
+
+    Every exit record written by `A_GIS.Log.track_function` describes one
+    call as a span with its parent span, start time and durations. The log
+    is streamed with `A_GIS.Log._iterate_records`, so only the spans are
+    kept in memory.
+
+    Args:
+        file (pathlib.Path):
+            The log file.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - spans (list[dict]): Spans ordered by start time, each with
+              `id`, `parent`, `module`, `function`, `name` (module and
+              function), `start_s`, `end_s`, `wall_s`, `cpu_s`, `pid`,
+              `thread_id` and `error`.
+            - error (str): Error message if the file could not be read,
+              else "".
+            - _file (pathlib.Path): The log file.
+    """
+    import A_GIS.Code.make_struct
+    import A_GIS.Log._iterate_records
+
+    spans = []
+    error = ""
+    try:
+        for record in A_GIS.Log._iterate_records(file=file):
+            if "tracking_hash_on_exit" not in record:
+                continue
+            if "start_s" not in record or "wall_s" not in record:
+                continue
+            module = record.get("module", "")
+            function = record.get("function", "")
+            spans.append(
+                {
+                    "id": record["tracking_hash_on_exit"],
+                    "parent": record.get("parent_hash"),
+                    "module": module,
+                    "function": function,
+                    "name": f"{module}.{function}",
+                    "start_s": record["start_s"],
+                    "end_s": record["start_s"] + record["wall_s"],
+                    "wall_s": record["wall_s"],
+                    "cpu_s": record.get("cpu_s", 0.0),
+                    "pid": record.get("pid", 0),
+                    "thread_id": record.get("thread_id", 0),
+                    "error": record.get("error", ""),
+                }
+            )
+    except OSError as e:
+        error = str(e)
+    spans.sort(key=lambda x: x["start_s"])
+
+    return A_GIS.Code.make_struct(spans=spans, error=error, _file=file)
@@ -0,0 +1,67 @@
+def summarize(*, spans: list[dict], top: int = 20):
+    """Summarize where tracked calls spend their time.
+
+    The self time of a span is its duration minus the duration of its child
+    spans, so time spent in nested tracked calls is attributed to them.
+
+    Args:
+        spans (list[dict]):
+            Spans from `A_GIS.Log.Span.read`.
+        top (int, optional):
+            The number of spans and functions to return. Defaults to 20.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - slowest (list[dict]): The `top` longest spans, each with a
+              `self_s` added.
+            - functions (list[dict]): Per function `name`, `calls`,
+              `total_s`, `self_s`, `cpu_s` and `max_s`, sorted by total
+              time, at most `top`.
+            - total_s (float): Duration of all root spans.
+            - _top (int): The number of entries.
+    """
+    import A_GIS.Code.make_struct
+    import A_GIS.Log.Span._get_child_s
+
+    by_id = {span["id"]: span for span in spans}
+    child_s = A_GIS.Log.Span._get_child_s(spans=spans)
+
+    # Aggregate per function.
+    functions = {}
+    total_s = 0.0
+    for span in spans:
+        self_s = max(0.0, span["wall_s"] - child_s.get(span["id"], 0.0))
+        entry = functions.setdefault(
+            span["name"],
+            {
+                "name": span["name"],
+                "calls": 0,
+                "total_s": 0.0,
+                "self_s": 0.0,
+                "cpu_s": 0.0,
+                "max_s": 0.0,
+            },
+        )
+        entry["calls"] += 1
+        entry["total_s"] += span["wall_s"]
+        entry["self_s"] += self_s
+        entry["cpu_s"] += span["cpu_s"]
+        entry["max_s"] = max(entry["max_s"], span["wall_s"])
+        if span["parent"] not in by_id:
+            total_s += span["wall_s"]
+
+    slowest = sorted(spans, key=lambda x: -x["wall_s"])[:top]
+    slowest = [
+        {**x, "self_s": max(0.0, x["wall_s"] - child_s.get(x["id"], 0.0))}
+        for x in slowest
+    ]
+    functions = sorted(functions.values(), key=lambda x: -x["total_s"])
+
+    return A_GIS.Code.make_struct(
+        slowest=slowest,
+        functions=functions[:top],
+        total_s=total_s,
+        _top=top,
+    )
@@ -0,0 +1,55 @@
+import A_GIS.Log.Span.summarize
+import A_GIS.Log.Span.to_chrome_trace
+import A_GIS.Log.Span.to_collapsed_stacks
+import pytest
+
+
+def _span(id, parent, function, start_s, wall_s):
+    return {
+        "id": id,
+        "parent": parent,
+        "module": "A_GIS.Test",
+        "function": function,
+        "name": f"A_GIS.Test.{function}",
+        "start_s": start_s,
+        "end_s": start_s + wall_s,
+        "wall_s": wall_s,
+        "cpu_s": wall_s / 2,
+        "pid": 1,
+        "thread_id": 2,
+        "error": "",
+    }
+
+
+SPANS = [
+    _span("a", None, "outer", 0.0, 1.0),
+    _span("b", "a", "inner", 0.1, 0.3),
+    _span("c", "a", "inner", 0.5, 0.4),
+]
+
+
+def test_summarize():
+    result = A_GIS.Log.Span.summarize(spans=SPANS, top=1)
+    assert result.total_s == 1.0
+    assert result.slowest[0]["id"] == "a"
+    assert result.slowest[0]["self_s"] == pytest.approx(0.3)
+    (outer,) = result.functions
+    assert outer["name"] == "A_GIS.Test.outer"
+    assert outer["self_s"] == pytest.approx(0.3)
+
+
+def test_collapsed_stacks():
+    text = A_GIS.Log.Span.to_collapsed_stacks(spans=SPANS)
+    assert text == (
+        "A_GIS.Test.outer 300000\n"
+        "A_GIS.Test.outer;A_GIS.Test.inner 700000\n"
+    )
+
+
+def test_chrome_trace():
+    trace = A_GIS.Log.Span.to_chrome_trace(spans=SPANS)
+    event = trace["traceEvents"][1]
+    assert event["ph"] == "X"
+    assert event["ts"] == pytest.approx(100000)
+    assert event["dur"] == pytest.approx(300000)
+    assert event["args"]["parent"] == "a"
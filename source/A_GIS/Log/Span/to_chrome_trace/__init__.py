@@ -0,0 +1,36 @@
+def to_chrome_trace(*, spans: list[dict]) -> dict:
+    """Convert spans to the Chrome trace-event format.
+
+    The result can be written as JSON and opened in `chrome://tracing`,
+    Perfetto or speedscope. Each span becomes a complete ("X") event on its
+    process and thread, with times in microseconds.
+
+    Args:
+        spans (list[dict]):
+            Spans from `A_GIS.Log.Span.read`.
+
+    Returns:
+        dict:
+            The trace with a `traceEvents` list.
+    """
+    events = []
+    for span in spans:
+        events.append(
+            {
+                "name": span["function"],
+                "cat": span["module"],
+                "ph": "X",
+                "ts": span["start_s"] * 1e6,
+                "dur": span["wall_s"] * 1e6,
+                "pid": span["pid"],
+                "tid": span["thread_id"],
+                "args": {
+                    "id": span["id"],
+                    "parent": span["parent"],
+                    "cpu_s": span["cpu_s"],
+                    "error": span["error"],
+                },
+            }
+        )
+
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
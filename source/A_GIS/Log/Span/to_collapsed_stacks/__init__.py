@@ -0,0 +1,36 @@
+def to_collapsed_stacks(*, spans: list[dict]) -> str:
+    """Convert spans to the collapsed-stack format for flamegraphs.
+
+    Each line holds a stack of span names from the root to a span, joined
+    by ";", and the self time of the span in microseconds, i.e. its
+    duration minus the duration of its child spans. Identical stacks are
+    added up. The output can be passed to `flamegraph.pl`, speedscope or
+    inferno. Spans whose parent is not among the spans start a new stack.
+
+    Args:
+        spans (list[dict]):
+            Spans from `A_GIS.Log.Span.read`.
+
+    Returns:
+        str:
+            The collapsed stacks, one per line, sorted.
+    """
+    import A_GIS.Log.Span._get_child_s
+
+    by_id = {span["id"]: span for span in spans}
+    child_s = A_GIS.Log.Span._get_child_s(spans=spans)
+
+    stacks = {}
+    for span in spans:
+        names = [span["name"]]
+        parent = span["parent"]
+        seen = {span["id"]}
+        while parent in by_id and parent not in seen:
+            seen.add(parent)
+            names.append(by_id[parent]["name"])
+            parent = by_id[parent]["parent"]
+        stack = ";".join(reversed(names))
+        self_s = max(0.0, span["wall_s"] - child_s.get(span["id"], 0.0))
+        stacks[stack] = stacks.get(stack, 0) + round(self_s * 1e6)
+
+    return "".join(f"{k} {v}\n" for k, v in sorted(stacks.items()))
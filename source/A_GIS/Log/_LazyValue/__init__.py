@@ -0,0 +1,43 @@
+class _LazyValue:
+    """Defer serializing a logged value until its record is written.
+
+    Wrapping a value keeps `A_GIS.Log.append` from rendering it on the
+    caller's thread. The JSON renderers of `A_GIS.Log._Log` and
+    `A_GIS.Log._QueueWriter` call `__structlog__` only when the record is
+    emitted. Sequences are written as lists, other values that are not JSON
+    serializable with a bounded `reprlib` representation, and anything
+    longer than `max_chars` characters of JSON is cut to a string with a
+    truncation marker.
+    """
+
+    __slots__ = ("value", "max_chars")
+
+    def __init__(self, value, max_chars=10000):
+        self.value = value
+        self.max_chars = max_chars
+
+    def __structlog__(self):
+        import collections.abc
+        import json
+        import reprlib
+
+        bounded = reprlib.Repr()
+        bounded.maxstring = self.max_chars
+        bounded.maxother = self.max_chars
+
+        def default(value):
+            # Write sequences such as a chatbot's history as lists.
+            if isinstance(value, collections.abc.Sequence) and not isinstance(
+                value, (bytes, bytearray)
+            ):
+                return list(value)
+            return bounded.repr(value)
+
+        text = json.dumps(self.value, default=default)
+        if len(text) <= self.max_chars:
+            return json.loads(text)
+        extra = len(text) - self.max_chars
+        return f"{text[:self.max_chars]}... [truncated {extra} characters]"
+
+    def __repr__(self):
+        return repr(self.__structlog__())
@@ -0,0 +1,33 @@
+import A_GIS.Log._LazyValue
+import json
+
+
+class _Unserializable:
+    def __repr__(self):
+        return "<unserializable>"
+
+
+def test_small_values_keep_structure():
+    value = A_GIS.Log._LazyValue({"a": [1, 2], "b": _Unserializable()})
+    assert value.__structlog__() == {"a": [1, 2], "b": "<unserializable>"}
+
+
+def test_large_values_are_truncated():
+    value = A_GIS.Log._LazyValue(("x" * 1000,), max_chars=50)
+    text = value.__structlog__()
+    assert text.startswith('["xxx')
+    assert text.endswith("[truncated 954 characters]")
+
+
+def test_serialized_only_when_rendered():
+    calls = []
+
+    class _Counted:
+        def __repr__(self):
+            calls.append(1)
+            return "counted"
+
+    value = A_GIS.Log._LazyValue([_Counted()])
+    assert calls == []
+    assert json.dumps({"v": value}, default=lambda x: x.__structlog__())
+    assert calls == [1]
@@ -2,6 +2,8 @@ class _Log:
     initialized = False
     logfile = None
     name = None
+    mode = None
+    writer = None
 
     def __init__(self):
         if not _Log.initialized:
@@ -19,6 +21,11 @@ class _Log:
         _Log.name = "A_GIS_LOG"
         _Log.logfile = os.environ.get("A_GIS_LOGFILE", "app.log")
 
+        # The default "sync" mode writes indented JSON on the caller's thread.
+        # In "async" mode records are written as JSON lines by a background
+        # thread, including the stdlib records of other libraries.
+        _Log.mode = os.environ.get("A_GIS_LOG_MODE", "sync")
+
         shared_processors = [
             structlog.contextvars.merge_contextvars,
             structlog.stdlib.add_log_level,
@@ -28,17 +35,30 @@ class _Log:
             structlog.processors.format_exc_info,
         ]
 
-        # Configure basic logging
-        logging.basicConfig(
-            level=logging.INFO,
-            handlers=[
-                logging.FileHandler(_Log.logfile, mode="a"),
-            ],
-        )
+        if _Log.mode == "sync":
+            # Configure basic logging
+            logging.basicConfig(
+                level=logging.INFO,
+                handlers=[
+                    logging.FileHandler(_Log.logfile, mode="a"),
+                ],
+            )
 
-        final_processors = [
-            structlog.processors.JSONRenderer(indent=1, sort_keys=True)
-        ]
+            final_processors = [
+                structlog.processors.JSONRenderer(indent=1, sort_keys=True)
+            ]
+        else:
+            import A_GIS.Log._QueueWriter
+
+            # Stdlib records of other libraries go to the same queue.
+            _Log.writer = A_GIS.Log._QueueWriter(_Log.logfile)
+            logging.basicConfig(level=logging.INFO, handlers=[_Log.writer])
+
+            def enqueue(logger, method_name, event_dict):
+                _Log.writer.put(event_dict)
+                raise structlog.DropEvent
+
+            final_processors = [enqueue]
 
         structlog.configure(
             processors=shared_processors + final_processors,
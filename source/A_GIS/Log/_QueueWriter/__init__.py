@@ -0,0 +1,190 @@
+import logging
+
+class _QueueWriter(logging.Handler):
+    """Write log records as JSON lines from a background thread.
+
+    Callers only put records into a bounded in-memory queue. A daemon writer
+    thread takes them off in batches, serializes each one compactly with
+    `json.dumps` (one object per line, keys sorted) and appends the batch to
+    the log file with a single write and flush. When the queue is full the
+    record is dropped and counted right away, so logging never stalls the
+    caller; with a positive `block_timeout` the caller first waits that many
+    seconds for room. Everything still queued is written on `close`, which
+    also runs at interpreter exit.
+
+    Records can be stdlib `logging.LogRecord`s, through the handler
+    interface, or already built event dictionaries, through `put`, which is
+    how `A_GIS.Log._Log` hands over structlog events without rendering them
+    on the caller's thread. Values are serialized when they are written, so
+    mutable objects should not be changed after they were logged.
+    """
+
+    def __init__(
+        self,
+        file_name,
+        max_size=10000,
+        batch_size=256,
+        flush_interval=0.5,
+        block_timeout=0,
+    ):
+        import atexit
+        import queue
+        import threading
+
+        super().__init__()
+        self.file_name = str(file_name)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.block_timeout = block_timeout
+        self.queue = queue.Queue(maxsize=max_size)
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.blocked = 0
+        self.errors = 0
+        self.closed = False
+        self._counter_lock = threading.Lock()
+        self._stop = object()
+        self._thread = threading.Thread(
+            target=self._run, name="A_GIS_LOG_WRITER", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def put(self, event: dict):
+        """Queue one event dictionary and return whether it was accepted."""
+        import queue
+
+        if self.closed:
+            self._count("dropped")
+            return False
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            # Apply back-pressure before giving up on the record.
+            if self.block_timeout <= 0:
+                self._count("dropped")
+                return False
+            self._count("blocked")
+            try:
+                self.queue.put(event, timeout=self.block_timeout)
+            except queue.Full:
+                self._count("dropped")
+                return False
+        self._count("enqueued")
+        return True
+
+    def emit(self, record):
+        """Queue a stdlib log record as an event dictionary."""
+        import datetime
+
+        try:
+            event = {
+                "event": record.getMessage(),
+                "level": record.levelname.lower(),
+                "logger": record.name,
+                "timestamp": datetime.datetime.fromtimestamp(
+                    record.created, tz=datetime.timezone.utc
+                ).isoformat(),
+            }
+            if record.exc_info:
+                event["exception"] = logging.Formatter().formatException(
+                    record.exc_info
+                )
+            self.put(event)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self, timeout=None):
+        """Wait until every queued record has been written."""
+        import time
+
+        if not self._thread.is_alive():
+            return
+        end = None if timeout is None else time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = None if end is None else end - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self.queue.all_tasks_done.wait(remaining)
+
+    def close(self):
+        """Write all queued records, stop the writer thread and close."""
+        if not self.closed:
+            self.closed = True
+            if self._thread.is_alive():
+                self.queue.put(self._stop)
+                self._thread.join()
+        super().close()
+
+    def get_stats(self):
+        """Return the counters of the writer."""
+        import A_GIS.Code.make_struct
+
+        return A_GIS.Code.make_struct(
+            enqueued=self.enqueued,
+            written=self.written,
+            dropped=self.dropped,
+            blocked=self.blocked,
+            errors=self.errors,
+            pending=self.queue.qsize(),
+            _file_name=self.file_name,
+        )
+
+    def _count(self, name):
+        with self._counter_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _run(self):
+        import queue
+
+        with open(self.file_name, "a", encoding="utf-8") as f:
+            while True:
+                try:
+                    batch = [self.queue.get(timeout=self.flush_interval)]
+                except queue.Empty:
+                    continue
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = any(x is self._stop for x in batch)
+                self._write(f, [x for x in batch if x is not self._stop])
+                for _ in batch:
+                    self.queue.task_done()
+                if stop:
+                    # Drain whatever was queued behind the stop marker.
+                    rest = []
+                    while True:
+                        try:
+                            rest.append(self.queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    self._write(f, rest)
+                    for _ in rest:
+                        self.queue.task_done()
+                    return
+
+    def _write(self, f, batch):
+        import json
+
+        def default(value):
+            # Same fallback as structlog's JSONRenderer.
+            if hasattr(value, "__structlog__"):
+                return value.__structlog__()
+            return repr(value)
+
+        lines = []
+        for event in batch:
+            try:
+                lines.append(
+                    json.dumps(event, sort_keys=True, default=default)
+                )
+            except Exception:
+                self.errors += 1
+        if lines:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            self.written += len(lines)
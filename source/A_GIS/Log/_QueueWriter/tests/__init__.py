@@ -0,0 +1,91 @@
+import A_GIS.Log._QueueWriter
+import json
+import logging
+
+
+def test_writes_json_lines(tmp_path):
+    file_name = tmp_path / "app.log"
+    writer = A_GIS.Log._QueueWriter(file_name, batch_size=2)
+    for i in range(5):
+        assert writer.put({"event": "step", "i": i, "data": object()})
+    writer.flush()
+    lines = file_name.read_text().splitlines()
+    assert [json.loads(x)["i"] for x in lines] == list(range(5))
+    assert json.loads(lines[0])["data"].startswith("<object")
+    writer.close()
+    stats = writer.get_stats()
+    assert stats.enqueued == 5
+    assert stats.written == 5
+    assert stats.dropped == 0
+
+
+def test_close_writes_pending(tmp_path):
+    file_name = tmp_path / "app.log"
+    writer = A_GIS.Log._QueueWriter(file_name, flush_interval=10.0)
+    for i in range(100):
+        writer.put({"i": i})
+    writer.close()
+    assert len(file_name.read_text().splitlines()) == 100
+    assert not writer.put({"i": 100})
+    assert writer.get_stats().dropped == 1
+
+
+def test_drops_when_full(tmp_path):
+    writer = A_GIS.Log._QueueWriter(
+        tmp_path / "app.log", max_size=2, block_timeout=0.01
+    )
+    # Stop the writer thread so that the queue fills up.
+    writer.queue.put(writer._stop)
+    writer._thread.join()
+    assert writer.put({"i": 0})
+    assert writer.put({"i": 1})
+    assert not writer.put({"i": 2})
+    stats = writer.get_stats()
+    assert stats.blocked == 1
+    assert stats.dropped == 1
+    assert stats.pending == 2
+
+
+def test_drops_without_waiting_by_default(tmp_path):
+    writer = A_GIS.Log._QueueWriter(tmp_path / "app.log", max_size=1)
+    writer.queue.put(writer._stop)
+    writer._thread.join()
+    assert writer.put({"i": 0})
+    assert not writer.put({"i": 1})
+    stats = writer.get_stats()
+    assert stats.blocked == 0
+    assert stats.dropped == 1
+
+
+def test_counters_under_contention(tmp_path):
+    import threading
+
+    writer = A_GIS.Log._QueueWriter(tmp_path / "app.log")
+
+    def log():
+        for i in range(1000):
+            writer.put({"i": i})
+
+    threads = [threading.Thread(target=log) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.close()
+    stats = writer.get_stats()
+    assert stats.enqueued == 8000
+    assert stats.written == 8000
+
+
+def test_logging_handler(tmp_path):
+    file_name = tmp_path / "app.log"
+    writer = A_GIS.Log._QueueWriter(file_name)
+    logger = logging.getLogger("A_GIS_TEST_QUEUE_WRITER")
+    logger.addHandler(writer)
+    logger.warning("hello %s", "world")
+    logger.removeHandler(writer)
+    writer.close()
+    event = json.loads(file_name.read_text())
+    assert event["event"] == "hello world"
+    assert event["level"] == "warning"
+    assert event["logger"] == "A_GIS_TEST_QUEUE_WRITER"
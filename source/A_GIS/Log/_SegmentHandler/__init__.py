@@ -0,0 +1,117 @@
+import logging
+
+class _SegmentHandler(logging.FileHandler):
+    """Write a log as one segment file per day, optionally split by size.
+
+    Records go to `<file_name>.<YYYY-MM-DD>` for their local date, and to
+    `<file_name>.<YYYY-MM-DD>.<n>` once a segment reaches `max_bytes`.
+    Switching segments only compares the record time with the precomputed
+    next midnight and the bytes written so far, so `emit` takes constant
+    time however large the log is. Expired segments, older than
+    `backup_days`, are deleted as whole files by a background thread every
+    `prune_interval` seconds, without holding the handler lock. Use
+    `A_GIS.Log.read_segments` to read all segments as one stream.
+    """
+
+    def __init__(
+        self,
+        file_name,
+        backup_days=30,
+        prune_interval=86400,
+        max_bytes=None,
+    ):
+        import os
+        import threading
+
+        super().__init__(
+            os.path.abspath(file_name), mode="a", encoding="utf-8", delay=True
+        )
+        self.file_name = self.baseFilename
+        self.backup_days = backup_days
+        self.prune_interval = prune_interval
+        self.max_bytes = max_bytes
+        self.segment = None
+        self.size = 0
+        self.rollover_at = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._prune_loop, name="A_GIS_LOG_PRUNE", daemon=True
+        )
+        self._thread.start()
+
+    def emit(self, record):
+        try:
+            message = self.format(record) + self.terminator
+            if record.created >= self.rollover_at or (
+                self.max_bytes is not None and self.size >= self.max_bytes
+            ):
+                self._open_segment(record.created)
+            self.stream.write(message)
+            self.stream.flush()
+            self.size += len(message.encode(self.encoding))
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self._stop.set()
+        super().close()
+
+    def prune(self):
+        """Delete the segments older than `backup_days`."""
+        import A_GIS.Log._list_segments
+        import datetime
+        import os
+
+        cutoff = datetime.date.today() - datetime.timedelta(
+            days=self.backup_days
+        )
+        for path, date, _ in A_GIS.Log._list_segments(
+            file_name=self.file_name
+        ):
+            if date < cutoff and str(path) != self.segment:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _open_segment(self, created):
+        import A_GIS.Log._list_segments
+        import datetime
+        import os
+
+        date = datetime.date.fromtimestamp(created)
+        next_day = date + datetime.timedelta(days=1)
+        self.rollover_at = datetime.datetime.combine(
+            next_day, datetime.time.min
+        ).timestamp()
+
+        # Continue the latest segment of the day unless it is full.
+        name = f"{self.file_name}.{date.isoformat()}"
+        index = 0
+        for path, segment_date, segment_index in A_GIS.Log._list_segments(
+            file_name=self.file_name
+        ):
+            if segment_date == date:
+                index = segment_index
+        segment = name if index == 0 else f"{name}.{index}"
+        size = os.path.getsize(segment) if os.path.exists(segment) else 0
+        if self.max_bytes is not None and size >= self.max_bytes:
+            index += 1
+            segment = f"{name}.{index}"
+            size = 0
+
+        if self.stream is not None:
+            self.stream.close()
+        self.baseFilename = segment
+        self.segment = segment
+        self.stream = self._open()
+        self.size = size
+
+    def _prune_loop(self):
+        while True:
+            try:
+                self.prune()
+            except Exception:
+                pass
+            if self._stop.wait(self.prune_interval):
+                return
@@ -0,0 +1,57 @@
+import A_GIS.Log._SegmentHandler
+import A_GIS.Log._list_segments
+import A_GIS.Log.read_segments
+import datetime
+import logging
+
+
+def _record(message, created):
+    record = logging.LogRecord("test", logging.INFO, "", 0, message, (), None)
+    record.created = created
+    return record
+
+
+def _timestamp(days_ago):
+    date = datetime.date.today() - datetime.timedelta(days=days_ago)
+    return datetime.datetime.combine(date, datetime.time(12)).timestamp()
+
+
+def test_one_segment_per_day(tmp_path):
+    file_name = tmp_path / "monitor.log"
+    handler = A_GIS.Log._SegmentHandler(file_name)
+    handler.emit(_record("old", _timestamp(1)))
+    handler.emit(_record("new", _timestamp(0)))
+    handler.emit(_record("newer", _timestamp(0)))
+    handler.close()
+    segments = A_GIS.Log._list_segments(file_name=file_name)
+    assert [x[1] for x in segments] == [
+        datetime.date.today() - datetime.timedelta(days=1),
+        datetime.date.today(),
+    ]
+    lines = list(A_GIS.Log.read_segments(file_name=file_name))
+    assert lines == ["old\n", "new\n", "newer\n"]
+
+
+def test_split_by_size(tmp_path):
+    file_name = tmp_path / "monitor.log"
+    handler = A_GIS.Log._SegmentHandler(file_name, max_bytes=10)
+    for i in range(5):
+        handler.emit(_record(f"message {i}", _timestamp(0)))
+    handler.close()
+    segments = A_GIS.Log._list_segments(file_name=file_name)
+    assert [x[2] for x in segments] == [0, 1, 2, 3, 4]
+    lines = list(A_GIS.Log.read_segments(file_name=file_name))
+    assert lines == [f"message {i}\n" for i in range(5)]
+
+
+def test_prune_deletes_expired_segments(tmp_path):
+    file_name = tmp_path / "monitor.log"
+    old = datetime.date.today() - datetime.timedelta(days=40)
+    (tmp_path / f"monitor.log.{old.isoformat()}").write_text("old\n")
+    (tmp_path / f"monitor.log.{old.isoformat()}.1").write_text("old\n")
+    handler = A_GIS.Log._SegmentHandler(file_name, backup_days=30)
+    handler.emit(_record("new", _timestamp(0)))
+    handler.prune()
+    handler.close()
+    segments = A_GIS.Log._list_segments(file_name=file_name)
+    assert [x[1] for x in segments] == [datetime.date.today()]
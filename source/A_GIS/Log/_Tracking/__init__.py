@@ -0,0 +1,41 @@
+import contextvars
+
+class _Tracking:
+    """Process-wide settings of `A_GIS.Log.track_function`.
+
+    The settings are read once from the environment, `A_GIS_TRACK_LEVEL`,
+    `A_GIS_TRACK_SAMPLE_RATE` and `A_GIS_TRACK_MAX_CHARS`, and can be
+    changed at runtime with `A_GIS.Log.configure_tracking`. The tracking
+    hash of the innermost tracked call is kept in the `span` context
+    variable, so nested calls know their parent span.
+    """
+
+    levels = ("off", "timing", "sampled", "full")
+    span = contextvars.ContextVar("A_GIS_TRACK_SPAN", default=None)
+    initialized = False
+    level = None
+    sample_rate = None
+    max_chars = None
+    calls = None
+
+    def __init__(self):
+        if not _Tracking.initialized:
+            self._do_initialize()
+
+    @staticmethod
+    def _do_initialize():
+        import itertools
+        import os
+
+        if _Tracking.initialized:
+            return
+
+        _Tracking.level = os.environ.get("A_GIS_TRACK_LEVEL", "full")
+        _Tracking.sample_rate = float(
+            os.environ.get("A_GIS_TRACK_SAMPLE_RATE", "0.1")
+        )
+        _Tracking.max_chars = int(
+            os.environ.get("A_GIS_TRACK_MAX_CHARS", "10000")
+        )
+        _Tracking.calls = itertools.count()
+        _Tracking.initialized = True
@@ -1,9 +1,31 @@
 """Global logging.
 """
-# Functions
-from .append import append
-from .get_sublogger import get_sublogger
-from .track_function import track_function
+import A_GIS.Code.Tree._LazyPackage
 
-# Classes
-from ._Log import _Log
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "_get_record_time",
+        "_get_token_usage",
+        "_iterate_records",
+        "_list_segments",
+        "analyze",
+        "append",
+        "configure_tracking",
+        "flush",
+        "get_sublogger",
+        "read",
+        "read_segments",
+        "track_function",
+    ],
+    classes=[
+        "_LazyValue",
+        "_Log",
+        "_QueueWriter",
+        "_SegmentHandler",
+        "_Tracking",
+    ],
+    packages=[
+        "Span",
+    ],
+)
@@ -0,0 +1,30 @@
+def _get_record_time(*, record: dict) -> float:
+    """Return the time of a log record in seconds since the epoch.
+
+    Records of tracked calls carry their start time in `start_s`. Other
+    records use the ISO `timestamp` added by the log renderers.
+
+    Args:
+        record (dict):
+            The log record.
+
+    Returns:
+        float:
+            The time of the record, or None if it has none.
+    """
+    import datetime
+
+    if isinstance(record.get("start_s"), (int, float)):
+        return float(record["start_s"])
+    timestamp = record.get("timestamp")
+    if not isinstance(timestamp, str):
+        return None
+    try:
+        time = datetime.datetime.fromisoformat(
+            timestamp.replace("Z", "+00:00")
+        )
+    except ValueError:
+        return None
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=datetime.timezone.utc)
+    return time.timestamp()
@@ -0,0 +1,49 @@
+def _get_token_usage(*, record: dict) -> dict:
+    """Extract the model token usage from a log record.
+
+    Two kinds of records carry usage: the responses that
+    `A_GIS.Ai.Chatbot._send_chat_ollama` logs with `A_GIS.Log.append`,
+    which have `model`, `prompt_eval_count`, `eval_count` and
+    `total_duration` (ns), and the exit records of the tracked OpenAI and
+    Groq senders, whose `output` has `model` and `usage`, either as a
+    dictionary or as the repr of the client's usage object.
+
+    Args:
+        record (dict):
+            The log record.
+
+    Returns:
+        dict:
+            The `model`, `prompt_tokens`, `completion_tokens` and
+            `duration_s` of the request, or None if the record has no usage.
+    """
+    import re
+
+    # Responses logged by the ollama sender.
+    event = record.get("event")
+    if isinstance(event, dict) and "model" in event:
+        if "eval_count" in event or "prompt_eval_count" in event:
+            return {
+                "model": event["model"],
+                "prompt_tokens": event.get("prompt_eval_count") or 0,
+                "completion_tokens": event.get("eval_count") or 0,
+                "duration_s": (event.get("total_duration") or 0) / 1e9,
+            }
+
+    # Results of the OpenAI and Groq senders.
+    output = record.get("output")
+    if isinstance(output, dict) and "model" in output and "usage" in output:
+        usage = output["usage"]
+        if isinstance(usage, str):
+            usage = {
+                k: int(v) for k, v in re.findall(r"(\w+_tokens)=(\d+)", usage)
+            }
+        if isinstance(usage, dict):
+            return {
+                "model": output["model"],
+                "prompt_tokens": usage.get("prompt_tokens") or 0,
+                "completion_tokens": usage.get("completion_tokens") or 0,
+                "duration_s": record.get("wall_s") or 0.0,
+            }
+
+    return None
@@ -0,0 +1,59 @@
+def _iterate_records(*, file: type["pathlib.Path"]):
+    """Stream the JSON records of an A_GIS log file one at a time.
+
+    Both formats written by `A_GIS.Log._Log` are understood: indented JSON
+    records, possibly behind a stdlib logging prefix such as
+    `INFO:A_GIS_LOG:`, from the "sync" mode, and JSON lines from the "async"
+    mode. The file, and any day segments of it written by
+    `A_GIS.Log.get_sublogger`, are read line by line with
+    `A_GIS.Log.read_segments`, so memory use is bounded by the largest
+    single record. A record starts with a brace at the beginning of a line,
+    after the optional prefix. Lines that are not part of a JSON record,
+    e.g. plain messages of other libraries, and records that fail to parse
+    are skipped.
+
+    Args:
+        file (pathlib.Path):
+            The log file.
+
+    Yields:
+        dict:
+            The next record of the log.
+    """
+    import A_GIS.Log.read_segments
+    import json
+    import re
+
+    # The "LEVEL:logger:" prefix of the stdlib logging default format.
+    prefix = re.compile(r"[A-Z]+:[\w.\-]*:")
+
+    buffer = None
+    for line in A_GIS.Log.read_segments(file_name=file):
+        if buffer is None:
+            match = prefix.match(line)
+            text = line[match.end() :] if match else line
+            if not text.startswith("{"):
+                continue
+            if text.rstrip() == "{":
+                # The first line of an indented record.
+                buffer = [text]
+                continue
+            if text.rstrip().endswith("}"):
+                try:
+                    record = json.loads(text)
+                except ValueError:
+                    record = None
+                if isinstance(record, dict):
+                    yield record
+            continue
+
+        # Indented records close with a brace in the first column.
+        buffer.append(line)
+        if line.rstrip() == "}":
+            try:
+                record = json.loads("".join(buffer))
+            except ValueError:
+                record = None
+            if isinstance(record, dict):
+                yield record
+            buffer = None
@@ -0,0 +1,36 @@
+import A_GIS.Log._iterate_records
+import json
+
+
+def test_both_formats(tmp_path):
+    file = tmp_path / "app.log"
+    indented = json.dumps({"event": "a", "nested": {"x": [1, 2]}}, indent=1)
+    file.write_text(
+        f"INFO:A_GIS_LOG:{indented}\n"
+        "INFO:httpx:HTTP Request: POST http://localhost {not json}\n"
+        '{"event": "b"}\n'
+        f"{json.dumps({'event': 'c'}, indent=1)}\n"
+    )
+    records = list(A_GIS.Log._iterate_records(file=file))
+    assert [x["event"] for x in records] == ["a", "b", "c"]
+    assert records[0]["nested"] == {"x": [1, 2]}
+
+
+def test_broken_record_is_skipped(tmp_path):
+    file = tmp_path / "app.log"
+    file.write_text('{\n "event": \n}\n{"event": "ok"}\n')
+    records = list(A_GIS.Log._iterate_records(file=file))
+    assert records == [{"event": "ok"}]
+
+
+def test_stray_brace_does_not_swallow_records(tmp_path):
+    file = tmp_path / "app.log"
+    record = json.dumps({"event": "a"}, indent=1)
+    file.write_text(
+        "WARNING:other:unclosed {\n"
+        "a message with a brace {\n"
+        f"{record}\n"
+        '{"event": "b"}\n'
+    )
+    records = list(A_GIS.Log._iterate_records(file=file))
+    assert [x["event"] for x in records] == ["a", "b"]
@@ -0,0 +1,37 @@
+def _list_segments(*, file_name: type["pathlib.Path"]) -> list[tuple]:
+    """List the segment files of a segmented log in chronological order.
+
+    A log written by `A_GIS.Log.get_sublogger` is stored as one segment per
+    day, `<file_name>.<YYYY-MM-DD>`, followed by `<file_name>.<YYYY-MM-DD>.<n>`
+    when a day is split by size.
+
+    Args:
+        file_name (pathlib.Path):
+            The base name of the log.
+
+    Returns:
+        list[tuple]:
+            The `(path, date, index)` of every segment, oldest first, where
+            `date` is a `datetime.date` and `index` an int.
+    """
+    import datetime
+    import pathlib
+    import re
+
+    file_name = pathlib.Path(file_name)
+    pattern = re.compile(
+        re.escape(file_name.name) + r"\.(\d{4}-\d{2}-\d{2})(?:\.(\d+))?$"
+    )
+    segments = []
+    if file_name.parent.is_dir():
+        for path in file_name.parent.iterdir():
+            match = pattern.match(path.name)
+            if match is None:
+                continue
+            try:
+                date = datetime.date.fromisoformat(match.group(1))
+            except ValueError:
+                continue
+            segments.append((path, date, int(match.group(2) or 0)))
+
+    return sorted(segments, key=lambda x: (x[1], x[2]))
@@ -0,0 +1,165 @@
+def analyze(
+    *,
+    file: type["pathlib.Path"],
+    module: str = None,
+    function: str = None,
+    tracking_hash: str = None,
+    since: float = None,
+    until: float = None,
+    max_samples: int = 10000,
+):
+    """Aggregate call statistics and token usage from an A_GIS log.
+
+    The log is streamed with `A_GIS.Log.read` and the same filters. For
+    every tracked function it counts the calls and errors and computes
+    latency percentiles from the `wall_s` of the exit records. Latencies
+    are kept in a reservoir sample of at most `max_samples` per function,
+    so memory stays bounded and the percentiles are exact up to that many
+    calls. Token usage is summed per model from the records that
+    `A_GIS.Log._get_token_usage` understands.
+
+    Args:
+        file (pathlib.Path):
+            The log file, e.g. "app.log".
+        module (str, optional):
+            Only tracked calls in this module or its submodules. Defaults
+            to None.
+        function (str, optional):
+            Only tracked calls of this function. Defaults to None.
+        tracking_hash (str, optional):
+            Only this tracked call and the calls nested in it directly.
+            Defaults to None.
+        since (float, optional):
+            Only records at or after this time, in seconds since the epoch.
+            Defaults to None.
+        until (float, optional):
+            Only records before this time, in seconds since the epoch.
+            Defaults to None.
+        max_samples (int, optional):
+            The reservoir size for latencies per function. Defaults to
+            10000.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - records (int): The number of matching records.
+            - functions (list[dict]): Per function `name`, `calls`,
+              `errors`, `total_s`, `mean_s`, `p50_s`, `p90_s`, `p99_s`,
+              `max_s` and `cpu_s`, by total time.
+            - models (list[dict]): Per model `model`, `requests`,
+              `prompt_tokens`, `completion_tokens` and `duration_s`, by
+              total tokens.
+            - first (float): Time of the earliest timed record, or None.
+            - last (float): Time of the latest timed record, or None.
+            - error (str): Error message if the log could not be read,
+              else "".
+            - _file (pathlib.Path): The log file.
+    """
+    import A_GIS.Code.make_struct
+    import A_GIS.Log._get_record_time
+    import A_GIS.Log._get_token_usage
+    import A_GIS.Log.read
+    import random
+
+    # Seeded so the same log always gives the same report.
+    rng = random.Random(0)
+
+    def percentile(values, fraction):
+        if not values:
+            return 0.0
+        index = min(len(values) - 1, max(0, round(fraction * len(values)) - 1))
+        return values[index]
+
+    count = 0
+    first = None
+    last = None
+    functions = {}
+    samples = {}
+    models = {}
+    error = ""
+    try:
+        for record in A_GIS.Log.read(
+            file=file,
+            module=module,
+            function=function,
+            tracking_hash=tracking_hash,
+            since=since,
+            until=until,
+        ):
+            count += 1
+            time = A_GIS.Log._get_record_time(record=record)
+            if time is not None:
+                first = time if first is None else min(first, time)
+                last = time if last is None else max(last, time)
+
+            # Calls of tracked functions.
+            if "tracking_hash_on_exit" in record:
+                name = f"{record.get('module')}.{record.get('function')}"
+                entry = functions.setdefault(
+                    name,
+                    {
+                        "name": name,
+                        "calls": 0,
+                        "errors": 0,
+                        "total_s": 0.0,
+                        "max_s": 0.0,
+                        "cpu_s": 0.0,
+                    },
+                )
+                entry["calls"] += 1
+                if record.get("error"):
+                    entry["errors"] += 1
+                wall_s = record.get("wall_s")
+                if isinstance(wall_s, (int, float)):
+                    entry["total_s"] += wall_s
+                    entry["max_s"] = max(entry["max_s"], wall_s)
+                    entry["cpu_s"] += record.get("cpu_s") or 0.0
+                    sample = samples.setdefault(name, [])
+                    if len(sample) < max_samples:
+                        sample.append(wall_s)
+                    else:
+                        index = rng.randrange(entry["calls"])
+                        if index < max_samples:
+                            sample[index] = wall_s
+
+            # Token usage of model requests.
+            usage = A_GIS.Log._get_token_usage(record=record)
+            if usage is not None:
+                entry = models.setdefault(
+                    usage["model"],
+                    {
+                        "model": usage["model"],
+                        "requests": 0,
+                        "prompt_tokens": 0,
+                        "completion_tokens": 0,
+                        "duration_s": 0.0,
+                    },
+                )
+                entry["requests"] += 1
+                entry["prompt_tokens"] += usage["prompt_tokens"]
+                entry["completion_tokens"] += usage["completion_tokens"]
+                entry["duration_s"] += usage["duration_s"]
+    except OSError as e:
+        error = str(e)
+
+    # Compute the latency percentiles.
+    for name, entry in functions.items():
+        values = sorted(samples.get(name, []))
+        entry["mean_s"] = entry["total_s"] / entry["calls"]
+        entry["p50_s"] = percentile(values, 0.5)
+        entry["p90_s"] = percentile(values, 0.9)
+        entry["p99_s"] = percentile(values, 0.99)
+
+    return A_GIS.Code.make_struct(
+        records=count,
+        functions=sorted(functions.values(), key=lambda x: -x["total_s"]),
+        models=sorted(
+            models.values(),
+            key=lambda x: -(x["prompt_tokens"] + x["completion_tokens"]),
+        ),
+        first=first,
+        last=last,
+        error=error,
+        _file=file,
+    )
@@ -0,0 +1,92 @@
+import A_GIS.Log.analyze
+import A_GIS.Log.read
+import json
+import pytest
+
+
+def _exit(hash, function, start_s, wall_s, error=None):
+    record = {
+        "tracking_hash_on_exit": hash,
+        "parent_hash": None,
+        "module": "A_GIS.Test",
+        "function": function,
+        "start_s": start_s,
+        "wall_s": wall_s,
+        "cpu_s": wall_s / 2,
+    }
+    if error:
+        record["error"] = error
+    return record
+
+
+@pytest.fixture
+def log(tmp_path):
+    file = tmp_path / "app.log"
+    records = [
+        _exit(str(i), "fast", 100.0 + i, 0.01 * i) for i in range(1, 11)
+    ]
+    records.append(_exit("x", "slow", 200.0, 2.0, error="ValueError: x"))
+    records.append(
+        {
+            "event": {
+                "model": "llama3",
+                "prompt_eval_count": 10,
+                "eval_count": 5,
+                "total_duration": 2e9,
+            },
+            "timestamp": "1970-01-01T00:03:20Z",
+        }
+    )
+    records.append(
+        {
+            "tracking_hash_on_exit": "y",
+            "module": "A_GIS.Ai.Chatbot._send_chat_openai",
+            "function": "_send_chat_openai",
+            "start_s": 300.0,
+            "wall_s": 1.0,
+            "output": {
+                "model": "gpt-4o",
+                "usage": "CompletionUsage(completion_tokens=7, "
+                "prompt_tokens=3, total_tokens=10)",
+            },
+        }
+    )
+    with open(file, "w") as f:
+        for i, record in enumerate(records):
+            # Mix the indented and the JSON lines formats.
+            indent = 1 if i % 2 else None
+            f.write(f"INFO:A_GIS_LOG:{json.dumps(record, indent=indent)}\n")
+    return file
+
+
+def test_filters(log):
+    assert len(list(A_GIS.Log.read(file=log, function="fast"))) == 10
+    assert len(list(A_GIS.Log.read(file=log, module="A_GIS.Ai"))) == 1
+    assert len(list(A_GIS.Log.read(file=log, since=105.0, until=200.0))) == 6
+    (record,) = A_GIS.Log.read(file=log, tracking_hash="x")
+    assert record["function"] == "slow"
+
+
+def test_analyze(log):
+    result = A_GIS.Log.analyze(file=log)
+    assert result.records == 13
+    assert result.first == 101.0
+    assert result.last == 300.0
+    fast = next(x for x in result.functions if x["name"] == "A_GIS.Test.fast")
+    assert fast["calls"] == 10
+    assert fast["p50_s"] == pytest.approx(0.05)
+    assert fast["p90_s"] == pytest.approx(0.09)
+    assert fast["max_s"] == pytest.approx(0.1)
+    slow = next(x for x in result.functions if x["name"] == "A_GIS.Test.slow")
+    assert slow["errors"] == 1
+    models = {x["model"]: x for x in result.models}
+    assert models["llama3"]["completion_tokens"] == 5
+    assert models["llama3"]["duration_s"] == pytest.approx(2.0)
+    assert models["gpt-4o"]["prompt_tokens"] == 3
+
+
+def test_reservoir_is_bounded(log):
+    result = A_GIS.Log.analyze(file=log, function="fast", max_samples=3)
+    (fast,) = result.functions
+    assert fast["calls"] == 10
+    assert fast["p99_s"] <= fast["max_s"]
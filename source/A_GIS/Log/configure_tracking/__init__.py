@@ -0,0 +1,60 @@
+def configure_tracking(
+    *, level: str = None, sample_rate: float = None, max_chars: int = None
+):
+    """Change how `A_GIS.Log.track_function` records calls.
+
+    The levels trade detail for overhead:
+
+    - "off": Call the function without any logging.
+    - "timing": Log one record per call with the wall-clock and CPU time.
+    - "sampled": Log a random `sample_rate` fraction of the calls like
+      "full" and the rest like "timing".
+    - "full": Also log the arguments on entry and the result on exit.
+
+    Arguments and results are serialized only when their record is written,
+    and each is capped at `max_chars` characters. The initial settings come
+    from the `A_GIS_TRACK_LEVEL`, `A_GIS_TRACK_SAMPLE_RATE` and
+    `A_GIS_TRACK_MAX_CHARS` environment variables, with defaults "full",
+    0.1 and 10000.
+
+    Args:
+        level (str, optional):
+            One of "off", "timing", "sampled" or "full". Defaults to None,
+            which keeps the current level.
+        sample_rate (float, optional):
+            Fraction of calls logged in full at the "sampled" level.
+            Defaults to None, which keeps the current rate.
+        max_chars (int, optional):
+            Maximum number of characters of a logged argument list or
+            result. Defaults to None, which keeps the current cap.
+
+    Raises:
+        ValueError: If the level is not known.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the resulting `level`, `sample_rate` and
+            `max_chars`.
+    """
+    import A_GIS.Code.make_struct
+    import A_GIS.Log._Tracking
+
+    A_GIS.Log._Tracking()
+    if level is not None:
+        if level not in A_GIS.Log._Tracking.levels:
+            raise ValueError(
+                f"Unknown tracking level={level}! Should be one of "
+                + ", ".join(A_GIS.Log._Tracking.levels)
+                + "."
+            )
+        A_GIS.Log._Tracking.level = level
+    if sample_rate is not None:
+        A_GIS.Log._Tracking.sample_rate = sample_rate
+    if max_chars is not None:
+        A_GIS.Log._Tracking.max_chars = max_chars
+
+    return A_GIS.Code.make_struct(
+        level=A_GIS.Log._Tracking.level,
+        sample_rate=A_GIS.Log._Tracking.sample_rate,
+        max_chars=A_GIS.Log._Tracking.max_chars,
+    )
@@ -0,0 +1,47 @@
+def flush(*, timeout: float = None):
+    """Wait until queued log records are written.
+
+    In the asynchronous logging mode (`A_GIS_LOG_MODE=async`) records are
+    written by a background thread. This waits until everything appended so
+    far is in the log file and returns the writer counters. In the default
+    synchronous mode records are already written and nothing is done.
+
+    Args:
+        timeout (float, optional):
+            The maximum number of seconds to wait. Defaults to None, which
+            waits until the queue is empty.
+
+    Returns:
+        A_GIS.Code.make_struct:
+            A dataclass with the following attributes:
+
+            - enqueued (int): Records accepted into the queue.
+            - written (int): Records written to the log file.
+            - dropped (int): Records dropped because the queue was full.
+            - blocked (int): Times a caller waited for room in the queue.
+            - errors (int): Records that could not be serialized.
+            - pending (int): Records still queued.
+            - _file_name (str): The log file.
+            - _mode (str): The logging mode.
+    """
+    import A_GIS.Code.make_struct
+    import A_GIS.Log._Log
+
+    A_GIS.Log._Log()
+    writer = A_GIS.Log._Log.writer
+    if writer is None:
+        return A_GIS.Code.make_struct(
+            enqueued=0,
+            written=0,
+            dropped=0,
+            blocked=0,
+            errors=0,
+            pending=0,
+            _file_name=A_GIS.Log._Log.logfile,
+            _mode=A_GIS.Log._Log.mode,
+        )
+
+    writer.flush(timeout=timeout)
+    return A_GIS.Code.make_struct(
+        **writer.get_stats().__dict__, _mode=A_GIS.Log._Log.mode
+    )
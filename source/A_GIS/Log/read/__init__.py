@@ -0,0 +1,69 @@
+def read(
+    *,
+    file: type["pathlib.Path"],
+    module: str = None,
+    function: str = None,
+    tracking_hash: str = None,
+    since: float = None,
+    until: float = None,
+):
+    """Stream the records of an A_GIS log that match the given filters.
+
+    The log is read incrementally with `A_GIS.Log._iterate_records`, so
+    memory use does not grow with the size of the log. Every filter that is
+    not None must match for a record to be returned.
+
+    Args:
+        file (pathlib.Path):
+            The log file, e.g. "app.log".
+        module (str, optional):
+            Keep records of tracked calls in this module or its
+            submodules, e.g. "A_GIS.Ai.Chatbot". Defaults to None.
+        function (str, optional):
+            Keep records of tracked calls of this function, given by name
+            or by module and name. Defaults to None.
+        tracking_hash (str, optional):
+            Keep the entry and exit records of this tracked call and the
+            records of the calls nested in it directly. Defaults to None.
+        since (float, optional):
+            Keep records at or after this time, in seconds since the
+            epoch. Defaults to None.
+        until (float, optional):
+            Keep records before this time, in seconds since the epoch.
+            Defaults to None.
+
+    Yields:
+        dict:
+            The next matching record.
+    """
+    import A_GIS.Log._get_record_time
+    import A_GIS.Log._iterate_records
+
+    for record in A_GIS.Log._iterate_records(file=file):
+        if module is not None:
+            name = record.get("module")
+            if not isinstance(name, str):
+                continue
+            if name != module and not name.startswith(module + "."):
+                continue
+        if function is not None:
+            name = record.get("function")
+            if function not in (name, f"{record.get('module')}.{name}"):
+                continue
+        if tracking_hash is not None:
+            hashes = (
+                record.get("tracking_hash_on_entry"),
+                record.get("tracking_hash_on_exit"),
+                record.get("parent_hash"),
+            )
+            if tracking_hash not in hashes:
+                continue
+        if since is not None or until is not None:
+            time = A_GIS.Log._get_record_time(record=record)
+            if time is None:
+                continue
+            if since is not None and time < since:
+                continue
+            if until is not None and time >= until:
+                continue
+        yield record
@@ -0,0 +1,30 @@
+def read_segments(*, file_name: type["pathlib.Path"]):
+    """Read a segmented log as one stream of lines.
+
+    The segments of a log written by `A_GIS.Log.get_sublogger` are read
+    one after the other, oldest first, one line at a time. A plain file at
+    `file_name` itself, as written before logs were segmented, is read
+    first.
+
+    Args:
+        file_name (pathlib.Path):
+            The base name of the log, as passed to `get_sublogger`.
+
+    Yields:
+        str:
+            The next line, including its line ending.
+    """
+    import A_GIS.Log._list_segments
+    import pathlib
+
+    paths = [x[0] for x in A_GIS.Log._list_segments(file_name=file_name)]
+    if pathlib.Path(file_name).is_file():
+        paths.insert(0, pathlib.Path(file_name))
+
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                yield from f
+        except FileNotFoundError:
+            # The segment expired while reading.
+            continue
@@ -1,9 +1,18 @@
 def track_function(func):
     """Decorator to enable logging
 
-    This decorator logs the signature of the input arguments and output result of
-    the decorated function. It also hashes the signature using `A_GIS.Text.hash`
-    for unique identification. The logger is initialized with `A_GIS.Log.append()`.
+    This decorator logs calls of the decorated function with
+    `A_GIS.Log.append` at the level set by `A_GIS.Log.configure_tracking`.
+    Except at the "off" level, every call gets a unique tracking hash from
+    `A_GIS.Text.hash`, which is passed on as `__tracking_hash`, and an exit
+    record describing it as a span: the tracking hash of the enclosing
+    tracked call (`parent_hash`, from a context variable), the start time,
+    the wall-clock and CPU duration, the process and thread ids, and the
+    error if it raised. `A_GIS.Log.Span.read` turns these back into spans.
+    At the "full" level, and for the sampled calls at the "sampled" level,
+    the input arguments are logged on entry and the `__dict__` of the result
+    on exit. They are serialized only when the record is written, capped in
+    size by `A_GIS.Log._LazyValue`.
 
     Args:
         func (callable): The function to be logged.
@@ -19,34 +28,88 @@ def track_function(func):
     # Define the logging wrapper for the decorator.
     @functools.wraps(func)
     def __wrapper(*args, **kwargs):
-        import A_GIS.Text.hash
-        import json
+        import A_GIS.Log._Tracking
+
+        A_GIS.Log._Tracking()
+        level = A_GIS.Log._Tracking.level
+        if level == "off":
+            return func(*args, **kwargs, __tracking_hash=None)
+
+        import A_GIS.Log._LazyValue
         import A_GIS.Log.append
+        import A_GIS.Text.hash
+        import os
+        import random
+        import threading
+        import time
 
-        # Log the signature on input.
-        signature = json.dumps(
-            {
-                "module": f"{func.__module__}",
-                "function": f"{func.__name__}",
-                "args": f"{args}",
-                "kwargs": f"{kwargs}",
-            }
-        )
-        tracking_hash = A_GIS.Text.hash(text=signature)
-        A_GIS.Log.append(
-            tracking_hash_on_entry=tracking_hash, args=args, kwargs=kwargs
+        # Decide how much to log for this call.
+        if level == "sampled":
+            if random.random() < A_GIS.Log._Tracking.sample_rate:
+                level = "full"
+            else:
+                level = "timing"
+        max_chars = A_GIS.Log._Tracking.max_chars
+        module = func.__module__
+        function = func.__name__
+
+        # Identify the call without serializing its arguments.
+        tracking_hash = A_GIS.Text.hash(
+            text=f"{module}.{function}:{os.getpid()}:"
+            f"{next(A_GIS.Log._Tracking.calls)}:{time.time_ns()}"
         )
 
-        # Call the function.
-        result = func(*args, **kwargs, __tracking_hash=tracking_hash)
-        # Convert the result to a dictionary if needed.
-        if hasattr(result, "__dict__"):
-            output = result.__dict__
-        else:
-            output = result
+        # Log the arguments on input.
+        parent_hash = A_GIS.Log._Tracking.span.get()
+        if level == "full":
+            A_GIS.Log.append(
+                tracking_hash_on_entry=tracking_hash,
+                parent_hash=parent_hash,
+                module=module,
+                function=function,
+                args=A_GIS.Log._LazyValue(args, max_chars),
+                kwargs=A_GIS.Log._LazyValue(kwargs, max_chars),
+            )
+
+        # Call the function as the current span.
+        token = A_GIS.Log._Tracking.span.set(tracking_hash)
+        start_s = time.time()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        error = None
+        try:
+            result = func(*args, **kwargs, __tracking_hash=tracking_hash)
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            wall_s = time.perf_counter() - wall_start
+            cpu_s = time.thread_time() - cpu_start
+            A_GIS.Log._Tracking.span.reset(token)
+            record = {
+                "tracking_hash_on_exit": tracking_hash,
+                "parent_hash": parent_hash,
+                "module": module,
+                "function": function,
+                "start_s": start_s,
+                "wall_s": wall_s,
+                "cpu_s": cpu_s,
+                "pid": os.getpid(),
+                "thread_id": threading.get_ident(),
+            }
+            if error is not None:
+                record["error"] = error
+            elif level == "full":
+                # Convert the result to a dictionary if needed.
+                if hasattr(result, "__dict__"):
+                    output = result.__dict__
+                else:
+                    output = result
+                record["output"] = A_GIS.Log._LazyValue(output, max_chars)
+
+            # Log the output for returning result.
+            A_GIS.Log.append(**record)
 
-        # Log the output for returning result.
-        A_GIS.Log.append(tracking_hash_on_exit=tracking_hash, output=output)
         return result
 
     return __wrapper
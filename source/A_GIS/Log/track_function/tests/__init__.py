@@ -0,0 +1,87 @@
+import A_GIS.Log.append
+import A_GIS.Log.configure_tracking
+import A_GIS.Log.track_function
+import pytest
+
+
+@A_GIS.Log.track_function
+def _add(*, x, y, __tracking_hash=None):
+    if x < 0:
+        raise ValueError("negative")
+    return x + y
+
+
+@pytest.fixture
+def records(monkeypatch):
+    records = []
+    monkeypatch.setattr(
+        A_GIS.Log, "append", lambda *args, **kwargs: records.append(kwargs)
+    )
+    previous = A_GIS.Log.configure_tracking()
+    yield records
+    A_GIS.Log.configure_tracking(
+        level=previous.level,
+        sample_rate=previous.sample_rate,
+        max_chars=previous.max_chars,
+    )
+
+
+def test_full(records):
+    A_GIS.Log.configure_tracking(level="full")
+    assert _add(x=1, y=2) == 3
+    entry, exit = records
+    assert entry["tracking_hash_on_entry"] == exit["tracking_hash_on_exit"]
+    assert entry["function"] == "_add"
+    assert entry["kwargs"].__structlog__() == {"x": 1, "y": 2}
+    assert exit["output"].__structlog__() == 3
+    assert exit["wall_s"] >= 0
+    assert exit["cpu_s"] >= 0
+
+
+def test_timing(records):
+    A_GIS.Log.configure_tracking(level="timing")
+    assert _add(x=1, y=2) == 3
+    (exit,) = records
+    assert "output" not in exit
+    assert "wall_s" in exit
+
+
+def test_off(records):
+    A_GIS.Log.configure_tracking(level="off")
+    assert _add(x=1, y=2) == 3
+    assert records == []
+
+
+def test_sampled(records):
+    A_GIS.Log.configure_tracking(level="sampled", sample_rate=0.0)
+    _add(x=1, y=2)
+    A_GIS.Log.configure_tracking(sample_rate=1.0)
+    _add(x=1, y=2)
+    assert ["output" in x for x in records] == [False, False, True]
+
+
+def test_error_is_logged(records):
+    A_GIS.Log.configure_tracking(level="timing")
+    with pytest.raises(ValueError):
+        _add(x=-1, y=2)
+    assert records[-1]["error"] == "ValueError: negative"
+
+
+def test_unknown_level():
+    with pytest.raises(ValueError):
+        A_GIS.Log.configure_tracking(level="verbose")
+
+
+@A_GIS.Log.track_function
+def _outer(*, __tracking_hash=None):
+    return _add(x=1, y=1)
+
+
+def test_nested_spans(records):
+    A_GIS.Log.configure_tracking(level="timing")
+    _outer()
+    inner, outer = records
+    assert inner["parent_hash"] == outer["tracking_hash_on_exit"]
+    assert outer["parent_hash"] is None
+    assert outer["start_s"] <= inner["start_s"]
+    assert outer["wall_s"] >= inner["wall_s"]
@@ -1,7 +1,13 @@
 """Manage and manipulate correlation matrices.
 """
-# Functions
-from .from_samples import from_samples
-from .init import init
-from .init_from_numpy import init_from_numpy
-from .to_numpy import to_numpy
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "from_samples",
+        "init",
+        "init_from_numpy",
+        "to_numpy",
+    ],
+)
@@ -1,7 +1,13 @@
 """Manage a mixture of distributions.
 """
-# Functions
-from .get import get
+import A_GIS.Code.Tree._LazyPackage
 
-# Packages
-from . import Weights
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "get",
+    ],
+    packages=[
+        "Weights",
+    ],
+)
@@ -1,7 +1,13 @@
 """
 """
-# Functions
-from .init import init
+import A_GIS.Code.Tree._LazyPackage
 
-# Classes
-from ._Triangular import _Triangular
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "init",
+    ],
+    classes=[
+        "_Triangular",
+    ],
+)
@@ -1,10 +1,16 @@
 """Manage probability distributions.
 """
-# Functions
-from .init import init
-from .plot import plot
-from .sample import sample
+import A_GIS.Code.Tree._LazyPackage
 
-# Packages
-from . import Mixture
-from . import Triangular
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "init",
+        "plot",
+        "sample",
+    ],
+    packages=[
+        "Mixture",
+        "Triangular",
+    ],
+)
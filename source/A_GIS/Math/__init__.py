@@ -1,8 +1,14 @@
 """Math utility functions.
 """
-# Functions
-from .calculate_angle_between_vectors import calculate_angle_between_vectors
+import A_GIS.Code.Tree._LazyPackage
 
-# Packages
-from . import CorrelationMatrix
-from . import Distribution
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "calculate_angle_between_vectors",
+    ],
+    packages=[
+        "CorrelationMatrix",
+        "Distribution",
+    ],
+)
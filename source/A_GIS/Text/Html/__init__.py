@@ -1,6 +1,12 @@
 """
 """
-# Functions
-from .add_math_render import add_math_render
-from .embed_images import embed_images
-from .get_links import get_links
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "add_math_render",
+        "embed_images",
+        "get_links",
+    ],
+)
@@ -1,5 +1,11 @@
 """
 """
-# Functions
-from .fix_links import fix_links
-from .get_links import get_links
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "fix_links",
+        "get_links",
+    ],
+)
@@ -27,7 +27,13 @@ For example, if the two events are a purchase and the delivery arriving:
 This data can be used to piece together the events to determine the most likely
 times that things happened.
 """
-# Functions
-from .convert_to_datetime import convert_to_datetime
-from .convert_to_string import convert_to_string
-from .get import get
+import A_GIS.Code.Tree._LazyPackage
+
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "convert_to_datetime",
+        "convert_to_string",
+        "get",
+    ],
+)
@@ -1,18 +1,24 @@
 """Clock rendering functionality for A_GIS.
 """
-# Functions
-from ._calculate_hand_angles import _calculate_hand_angles
-from ._draw_clock_face import _draw_clock_face
-from ._draw_hands import _draw_hands
-from ._make_result import _make_result
-from .init_center import init_center
-from .init_face import init_face
-from .init_hour_hand import init_hour_hand
-from .init_minute_hand import init_minute_hand
-from .init_second_hand import init_second_hand
-from .render import render
+import A_GIS.Code.Tree._LazyPackage
 
-# Classes
-from ._Center import _Center
-from ._Face import _Face
-from ._Hand import _Hand
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "_calculate_hand_angles",
+        "_draw_clock_face",
+        "_draw_hands",
+        "_make_result",
+        "init_center",
+        "init_face",
+        "init_hour_hand",
+        "init_minute_hand",
+        "init_second_hand",
+        "render",
+    ],
+    classes=[
+        "_Center",
+        "_Face",
+        "_Hand",
+    ],
+)
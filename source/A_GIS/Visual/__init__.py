@@ -1,7 +1,13 @@
 """Generate visuals.
 """
-# Functions
-from .plot_transition import plot_transition
+import A_GIS.Code.Tree._LazyPackage
 
-# Packages
-from . import Clock
+A_GIS.Code.Tree._LazyPackage.install(
+    name=__name__,
+    functions=[
+        "plot_transition",
+    ],
+    packages=[
+        "Clock",
+    ],
+)
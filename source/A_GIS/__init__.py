@@ -1,21 +1,28 @@
 """A_GIS package root.
 """
-# Functions
-from .catalog import catalog
-from .resolve_function import resolve_function
+import A_GIS.Code.Tree._LazyPackage as _installer
 
-# Packages
-from . import Ai
-from . import Cli
-from . import Code
-from . import Conversation
-from . import Data
-from . import Dev
-from . import Document
-from . import File
-from . import Image
-from . import Log
-from . import Math
-from . import Text
-from . import Time
-from . import Visual
+_installer.install(
+    name=__name__,
+    functions=[
+        "catalog",
+        "resolve_function",
+    ],
+    packages=[
+        "Ai",
+        "Cli",
+        "Code",
+        "Conversation",
+        "Data",
+        "Dev",
+        "Document",
+        "File",
+        "Image",
+        "Log",
+        "Math",
+        "Text",
+        "Time",
+        "Visual",
+    ],
+)
+del _installer
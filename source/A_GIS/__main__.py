@@ -53,7 +53,12 @@ cli.add_command(cli_inspect)
 # Define the update command.
 @click.command("update")
 @A_GIS.Cli.register
-def cli_update(*, root: "path to find A_GIS root" = "source/A_GIS"):
+def cli_update(
+    *,
+    root: "path to find A_GIS root" = "source/A_GIS",
+    lazy: "write lazy-loading package files" = True,
+    full: "reformat every file, not only the changed ones" = False,
+):
     """Update the A_GIS repo tree"""
 
     # Perform the update.
@@ -64,7 +69,12 @@ def cli_update(*, root: "path to find A_GIS root" = "source/A_GIS"):
 
     # Update the tree
     tree = A_GIS.Code.Tree.recurse(path=root)
-    A_GIS.Code.Tree.update(tree=tree)
+    result = A_GIS.Code.Tree.update(
+        tree=tree, lazy=lazy, root=root, incremental=not full
+    )
+    for file, error in result.errors.items():
+        console.print(f"could not reformat {file}: {error}")
+    A_GIS.Code.Manifest.update(root=root)
 
     # Show git status
     console.print(A_GIS.Cli.get_git_status(root=root))
@@ -190,11 +200,16 @@ def cli_docstring(
         console = rich.console.Console(width=WIDTH)
         console.print(f"Replacing docstring for [bold]{name}[/bold] at path={path} ...")
 
-        # Generate a docstring.
+        # Generate a docstring, showing the response as it arrives.
         code = A_GIS.File.read(file=path)
         docstring = A_GIS.Code.Docstring.generate(
-            name=name, code=code, model=model, reformat=True
+            name=name,
+            code=code,
+            model=model,
+            reformat=True,
+            stream=lambda text: console.out(text, end=""),
         )
+        console.out("")
         panel = rich.panel.Panel(
             str(docstring),
             title=f"new docstring",
@@ -338,8 +353,11 @@ def cli_commit(
     panel = A_GIS.Cli.update_and_show_git_status(root=root)
     console.print(panel)
 
-    # Get the commit message.
-    message = A_GIS.Code.CommitMessage.generate(do_commit=not dry_run)
+    # Get the commit message, showing the response as it arrives.
+    message = A_GIS.Code.CommitMessage.generate(
+        do_commit=not dry_run, stream=lambda text: console.out(text, end="")
+    )
+    console.out("")
     panel = rich.panel.Panel(
         message, title=f"commit message", expand=True, border_style="bold cyan"
     )
@@ -379,6 +397,275 @@ def cli_status(*, root: "path to A_GIS root" = "source/A_GIS"):
 
 cli.add_command(cli_status)
 
+
+# Define the profile command.
+@click.command("profile")
+@A_GIS.Cli.register
+def cli_profile(
+    *,
+    mode: "what to import: package, units or cli" = "units",
+    top: "number of slowest units to show" = 20,
+    min_ms: "threshold for heavy imports and the tree (ms)" = 10.0,
+    baseline: "write the result as a JSON baseline to this file" = "",
+    compare: "compare against a JSON baseline file" = "",
+):
+    """Profile the import time of A_GIS"""
+    import json
+    import rich.tree
+
+    console = rich.console.Console(width=WIDTH)
+    console.print(f"Profiling imports with mode={mode} ...")
+    min_us = int(min_ms * 1000)
+    result = A_GIS.Code.Import.profile(mode=mode, min_us=min_us)
+    if result.error:
+        console.print(f"[red]Error:[/red] {result.error}")
+        sys.exit(1)
+
+    # Show the import tree, keeping only imports above the threshold.
+    def add_nodes(parent, names):
+        for name in names:
+            node = result.nodes[name]
+            if node["cumulative_us"] < min_us:
+                continue
+            style = "green" if name.startswith("A_GIS") else "white"
+            branch = parent.add(
+                f"[{style}]{name}[/{style}]"
+                f" self={node['self_us'] / 1000:.1f} ms"
+                f" cumulative={node['cumulative_us'] / 1000:.1f} ms"
+            )
+            add_nodes(branch, node["children"])
+
+    tree = rich.tree.Tree(f"total={result.total_us / 1000:.1f} ms")
+    roots = [k for k, v in result.nodes.items() if v["parent"] is None]
+    add_nodes(tree, roots)
+    console.print(tree)
+
+    # Show the slowest units.
+    table = rich.table.Table(title=f"slowest {top} units")
+    table.add_column("Unit", style="bold")
+    table.add_column("Self (ms)", justify="right")
+    table.add_column("Cumulative (ms)", justify="right")
+    for unit in result.units[:top]:
+        table.add_row(
+            unit["name"],
+            f"{unit['self_us'] / 1000:.1f}",
+            f"{unit['cumulative_us'] / 1000:.1f}",
+        )
+    console.print(table)
+
+    # Show heavy top-level imports.
+    table = rich.table.Table(title="heavy top-level imports")
+    table.add_column("Unit", style="bold")
+    table.add_column("Module", style="bold yellow")
+    table.add_column("Cumulative (ms)", justify="right")
+    for x in result.heavy:
+        table.add_row(
+            x["unit"], x["module"], f"{x['cumulative_us'] / 1000:.1f}"
+        )
+    console.print(table)
+    if result.errors:
+        console.print(f"[red]{len(result.errors)} units failed to import[/red]")
+
+    # Save or compare the baseline.
+    if baseline:
+        A_GIS.File.write(
+            content=json.dumps(result.snapshot, indent=1), file=baseline
+        )
+        console.print(f"Wrote baseline to {baseline}")
+    if compare:
+        old = A_GIS.Data.Format.Json.read(source=pathlib.Path(compare))
+        diff = A_GIS.Code.Import.compare(
+            baseline=old, snapshot=result.snapshot
+        )
+        if diff.error:
+            console.print(f"[red]Error:[/red] {diff.error}")
+            sys.exit(1)
+        console.print(
+            f"Total change vs {compare}: {diff.total_change_us / 1000:+.1f} ms"
+        )
+        for x in diff.regressions:
+            console.print(
+                f"[red]regressed[/red] {x['name']}:"
+                f" {x['baseline_us'] / 1000:.1f} ms ->"
+                f" {x['current_us'] / 1000:.1f} ms"
+            )
+        for x in diff.added:
+            console.print(
+                f"[red]added[/red] {x['name']}:"
+                f" {x['current_us'] / 1000:.1f} ms"
+            )
+        if diff.regressed:
+            sys.exit(1)
+
+
+cli.add_command(cli_profile)
+
+
+# Define the trace command.
+@click.command("trace")
+@A_GIS.Cli.register
+def cli_trace(
+    *,
+    log: "log file written by A_GIS.Log" = "app.log",
+    top: "number of slowest spans and functions to show" = 20,
+    chrome: "write a Chrome trace-event JSON file" = "",
+    collapsed: "write collapsed stacks for flamegraphs" = "",
+):
+    """Summarize the slowest spans of tracked units in a log"""
+    import datetime
+    import json
+
+    console = rich.console.Console(width=WIDTH)
+    result = A_GIS.Log.Span.read(file=pathlib.Path(log))
+    if result.error:
+        console.print(f"[red]Error:[/red] {result.error}")
+        sys.exit(1)
+    summary = A_GIS.Log.Span.summarize(spans=result.spans, top=top)
+    console.print(
+        f"{len(result.spans)} spans, {summary.total_s:.3f} s in root spans"
+    )
+
+    # Show the slowest spans.
+    table = rich.table.Table(title=f"slowest {top} spans")
+    table.add_column("Span", style="bold")
+    table.add_column("Start", justify="right")
+    table.add_column("Total (s)", justify="right")
+    table.add_column("Self (s)", justify="right")
+    table.add_column("CPU (s)", justify="right")
+    table.add_column("Error", style="red")
+    for span in summary.slowest:
+        table.add_row(
+            span["name"],
+            datetime.datetime.fromtimestamp(span["start_s"]).isoformat(
+                timespec="seconds"
+            ),
+            f"{span['wall_s']:.3f}",
+            f"{span['self_s']:.3f}",
+            f"{span['cpu_s']:.3f}",
+            span["error"],
+        )
+    console.print(table)
+
+    # Show the time per function.
+    table = rich.table.Table(title=f"top {top} functions by total time")
+    table.add_column("Function", style="bold")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total (s)", justify="right")
+    table.add_column("Self (s)", justify="right")
+    table.add_column("CPU (s)", justify="right")
+    table.add_column("Max (s)", justify="right")
+    for x in summary.functions:
+        table.add_row(
+            x["name"],
+            str(x["calls"]),
+            f"{x['total_s']:.3f}",
+            f"{x['self_s']:.3f}",
+            f"{x['cpu_s']:.3f}",
+            f"{x['max_s']:.3f}",
+        )
+    console.print(table)
+
+    # Export for trace viewers and flamegraphs.
+    if chrome:
+        trace = A_GIS.Log.Span.to_chrome_trace(spans=result.spans)
+        A_GIS.File.write(content=json.dumps(trace), file=chrome)
+        console.print(f"Wrote Chrome trace to {chrome}")
+    if collapsed:
+        A_GIS.File.write(
+            content=A_GIS.Log.Span.to_collapsed_stacks(spans=result.spans),
+            file=collapsed,
+        )
+        console.print(f"Wrote collapsed stacks to {collapsed}")
+
+
+cli.add_command(cli_trace)
+
+
+# Define the logs command.
+@click.command("logs")
+@A_GIS.Cli.register
+def cli_logs(
+    *,
+    log: "log file written by A_GIS.Log" = "app.log",
+    module: "only calls in this module" = "",
+    function: "only calls of this function" = "",
+    tracking_hash: "only this call and its direct children" = "",
+    since: "only records at or after this ISO time" = "",
+    until: "only records before this ISO time" = "",
+    top: "number of functions to show" = 20,
+):
+    """Report calls, latencies and token usage from a log"""
+    import datetime
+
+    def to_seconds(text):
+        if not text:
+            return None
+        return datetime.datetime.fromisoformat(text).timestamp()
+
+    console = rich.console.Console(width=WIDTH)
+    result = A_GIS.Log.analyze(
+        file=pathlib.Path(log),
+        module=module or None,
+        function=function or None,
+        tracking_hash=tracking_hash or None,
+        since=to_seconds(since),
+        until=to_seconds(until),
+    )
+    if result.error:
+        console.print(f"[red]Error:[/red] {result.error}")
+        sys.exit(1)
+    span = ""
+    if result.first is not None:
+        first = datetime.datetime.fromtimestamp(result.first)
+        last = datetime.datetime.fromtimestamp(result.last)
+        span = f" from {first:%Y-%m-%d %H:%M:%S} to {last:%Y-%m-%d %H:%M:%S}"
+    console.print(f"{result.records} matching records{span}")
+
+    # Show the calls of tracked functions.
+    table = rich.table.Table(title=f"top {top} functions by total time")
+    table.add_column("Function", style="bold")
+    table.add_column("Calls", justify="right")
+    table.add_column("Errors", justify="right", style="red")
+    table.add_column("Total (s)", justify="right")
+    table.add_column("Mean (s)", justify="right")
+    table.add_column("p50 (s)", justify="right")
+    table.add_column("p90 (s)", justify="right")
+    table.add_column("p99 (s)", justify="right")
+    table.add_column("Max (s)", justify="right")
+    for x in result.functions[:top]:
+        table.add_row(
+            x["name"],
+            str(x["calls"]),
+            str(x["errors"]),
+            f"{x['total_s']:.3f}",
+            f"{x['mean_s']:.3f}",
+            f"{x['p50_s']:.3f}",
+            f"{x['p90_s']:.3f}",
+            f"{x['p99_s']:.3f}",
+            f"{x['max_s']:.3f}",
+        )
+    console.print(table)
+
+    # Show the token usage per model.
+    table = rich.table.Table(title="token usage per model")
+    table.add_column("Model", style="bold")
+    table.add_column("Requests", justify="right")
+    table.add_column("Prompt tokens", justify="right")
+    table.add_column("Completion tokens", justify="right")
+    table.add_column("Duration (s)", justify="right")
+    for x in result.models:
+        table.add_row(
+            x["model"],
+            str(x["requests"]),
+            str(x["prompt_tokens"]),
+            str(x["completion_tokens"]),
+            f"{x['duration_s']:.1f}",
+        )
+    console.print(table)
+
+
+cli.add_command(cli_logs)
+
 @click.command('repl')
 @A_GIS.Cli.register
 def cli_repl(ctx=None, debug:"Show debug info"=False):
@@ -460,28 +747,23 @@ def cli_repl(ctx=None, debug:"Show debug info"=False):
                 if cmd.startswith(text):
                     yield Completion(cmd, start_position=-len(text))
 
+    # Read the unit manifest once, so listing contents imports nothing.
+    manifest = A_GIS.Code.Manifest.read()
+
     def get_module_contents(module):
         """Get contents of a module"""
         contents = {}
-        try:
-            for name, obj in inspect.getmembers(module):
-                if name.startswith('_'):
-                    continue
-
-                # Only include if it's part of A_GIS
-                obj_name = getattr(obj, '__name__', '')
-                if not isinstance(obj_name, str) or (inspect.ismodule(obj) and not obj_name.startswith('A_GIS')):
-                    continue
-
-                if inspect.ismodule(obj):
-                    contents[name] = ('module', obj)
-                elif inspect.isfunction(obj):
-                    contents[name] = ('function', obj)
-                elif inspect.isclass(obj):
-                    contents[name] = ('class', obj)
-        except Exception as e:
-            if debug:
-                console.print(f"[red]Error getting contents: {str(e)}[/red]")
+        prefix = module.__name__ + "."
+        for full_name, entry in manifest.entries.items():
+            name = full_name[len(prefix):]
+            if not full_name.startswith(prefix) or "." in name:
+                continue
+            if name.startswith('_') or name == "tests":
+                continue
+
+            type_ = "module" if entry["kind"] == "package" else entry["kind"]
+            if type_ in ("module", "function", "class"):
+                contents[name] = (type_, entry)
         return contents
 
     def show_contents(contents):
@@ -495,9 +777,8 @@ def cli_repl(ctx=None, debug:"Show debug info"=False):
         table.add_column("Name", style="bold")
         table.add_column("Description")
 
-        for name, (type_, obj) in sorted(contents.items()):
-            doc = inspect.getdoc(obj)
-            desc = doc.split('\n')[0] if doc else "No description"
+        for name, (type_, entry) in sorted(contents.items()):
+            desc = entry["description"] or "No description"
             style = {"module": "green", "function": "cyan", "class": "magenta"}[type_]
             table.add_row(type_.capitalize(), Text(name, style=style), desc)
 
@@ -579,11 +860,12 @@ def cli_repl(ctx=None, debug:"Show debug info"=False):
                                 module = importlib.import_module(nav_path)
                                 contents = get_module_contents(module)
                                 if part in contents:
-                                    type_, obj = contents[part]
+                                    type_, entry = contents[part]
                                     if type_ == 'module':
                                         nav_path = f"{nav_path}.{part}"
                                     else:
                                         # Handle function/class display
+                                        obj = getattr(module, part)
                                         doc = inspect.getdoc(obj)
                                         nav_history.append((f"{nav_path}.{part}", type_, obj))
                                         console.print(f"\n[bold]{type_.capitalize()}: {part}[/bold]")
@@ -610,7 +892,8 @@ def cli_repl(ctx=None, debug:"Show debug info"=False):
                             console.print(f"[red]Navigation error: {str(e)}[/red]")
                         continue
                 elif text in contents:
-                    type_, obj = contents[text]
+                    type_, entry = contents[text]
+                    obj = getattr(current_module, text)
 
                     if type_ == 'module':
                         doc = inspect.getdoc(obj)
@@ -13,6 +13,9 @@ def catalog(
     it is defined. The description is parsed from the function's
     docstring.
 
+    Entries are built from the unit manifest (see
+    `A_GIS.Code.Manifest.read`), so no module of the package is imported.
+
     The output list of strings can be used to display or write a catalog
     in a readable format. By default, the full signature of the function
     is included in the header; this can be toggled with the
@@ -34,30 +37,25 @@ def catalog(
     """
 
     import A_GIS.Code.list
-    import A_GIS.Code.parse_docstring
-    import A_GIS.Code.Unit.get
-    import A_GIS.Code.is_function
-    import A_GIS.File.read
-    import pathlib
-    import A_GIS.Text.add_indent
+    import A_GIS.Code.Manifest.read
 
-    lines = []
+    # Descriptions and signatures come from the manifest, so no unit file
+    # is read or imported here.
+    manifest = A_GIS.Code.Manifest.read(package_name=package_name)
     result = A_GIS.Code.list(package_name=package_name)
 
+    lines = []
+
     # Only process functions, not modules
     for name in result.functions:
         file = result.sources[name]
-        code = A_GIS.File.read(file=pathlib.Path(file))
-        unit = A_GIS.Code.Unit.get(code=code)
-        description = (
-            A_GIS.Code.parse_docstring(code=code, only_description=True)
-            or "None"
-        ).lstrip()
-
-        if unit.function_definition != [""]:
+        entry = manifest.entries[name.rsplit(".", 1)[0]]
+        description = (entry["description"] or "None").lstrip()
+
+        if entry["definition"] != "":
             # Get just the signature part (everything after 'def
             # function_name')
-            signature = "\n".join(unit.function_definition).strip()
+            signature = entry["definition"].strip()
             # Get the function name from the full path
             func_name = name.split(".")[-1]
 